@@ -3,10 +3,12 @@ from backend.application.use_cases.start_session_use_case import StartSessionUse
 from backend.application.use_cases.continue_session_use_case import ContinueSessionUseCase
 from backend.application.use_cases.get_srs_use_case import GetSRSUseCase
 from backend.application.use_cases.reset_session_use_case import ResetSessionUseCase
+from backend.application.use_cases.batch_srs_use_case import BatchSRSUseCase
 
 __all__ = [
     "StartSessionUseCase",
     "ContinueSessionUseCase",
     "GetSRSUseCase",
     "ResetSessionUseCase",
+    "BatchSRSUseCase",
 ]
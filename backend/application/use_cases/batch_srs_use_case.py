@@ -0,0 +1,142 @@
+"""Batch SRS Use Case"""
+import asyncio
+import time
+import weakref
+from typing import Any, AsyncIterator, Dict, List, Optional
+from backend.infrastructure.graph.executor import DummyExecutor
+from backend.utils.logger import setup_logger
+from config.settings import settings
+
+logger = setup_logger(__name__)
+
+# 이벤트 루프별 프로세스 전체 동시 처리 슬롯 (여러 일괄 요청이 함께 실행되어도 상한 유지)
+_batch_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_batch_slots() -> asyncio.Semaphore:
+    """현재 이벤트 루프의 동시 처리 슬롯 가져오기"""
+    loop = asyncio.get_running_loop()
+    slots = _batch_slots.get(loop)
+    if slots is None:
+        slots = asyncio.Semaphore(settings.batch_max_concurrency)
+        _batch_slots[loop] = slots
+    return slots
+
+
+class BatchSRSUseCase:
+    """
+    일괄 SRS 생성 Use Case
+
+    여러 프로젝트의 초기 입력과 미리 준비된 답변을 받아 대화 없이 SRS를 생성합니다.
+    항목은 제한된 수의 워커가 나누어 처리하고, 결과는 끝나는 순서대로 전달합니다.
+    """
+
+    def __init__(self):
+        """Use Case 초기화"""
+        self.executor = DummyExecutor()
+
+    def stream(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        일괄 SRS 생성 실행
+
+        Args:
+            items: {"id", "initial_input", "answers"} 항목 리스트
+            concurrency: 이 요청의 동시 처리 항목 수 (None이면 settings.batch_concurrency,
+                settings.batch_max_concurrency를 넘을 수 없음)
+
+        Returns:
+            항목 결과 비동기 이터레이터 (완료 순서)
+        """
+        concurrency = min(
+            concurrency or settings.batch_concurrency,
+            settings.batch_max_concurrency,
+            max(len(items), 1)
+        )
+        return self._run(items, concurrency)
+
+    async def _run(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """워커 풀로 항목을 처리하고 결과를 완료 순서대로 전달"""
+        pending: asyncio.Queue = asyncio.Queue()
+        for index, item in enumerate(items):
+            pending.put_nowait((index, item))
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def worker() -> None:
+            while True:
+                try:
+                    index, item = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                async with _get_batch_slots():
+                    result = await self._run_item(index, item)
+                await results.put(result)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+        try:
+            for _ in range(len(items)):
+                yield await results.get()
+        finally:
+            # 클라이언트 연결이 끊긴 경우 남은 항목 취소
+            for task in workers:
+                task.cancel()
+
+    async def _run_item(self, index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        항목 1개 처리 (실패/시간 초과도 결과로 반환)
+
+        Args:
+            index: 요청 내 항목 순서
+            item: {"id", "initial_input", "answers"} 항목
+
+        Returns:
+            항목 결과
+        """
+        session_id = self.executor.create_session()
+        result = {
+            "index": index,
+            "id": item.get("id"),
+            "session_id": session_id,
+            "status": "ok",
+        }
+        started = time.perf_counter()
+        cancelled = asyncio.Event()
+        task = asyncio.ensure_future(
+            self.executor.execute_non_interactive_async(
+                session_id, item["initial_input"], item.get("answers") or [], cancelled=cancelled
+            )
+        )
+
+        try:
+            done, _ = await asyncio.wait({task}, timeout=settings.batch_item_timeout)
+            if task in done:
+                state = task.result()
+                result.update({
+                    "judge_approved": state.is_complete,
+                    "judge_feedback": state.judge_feedback,
+                    "srs": state.srs_renditions.data if state.srs_renditions else None,
+                })
+            else:
+                result.update({"status": "error", "error": f"Timed out after {settings.batch_item_timeout}s"})
+                # 워커 스레드에서 실행 중인 단계는 중단할 수 없으므로 남은 단계와 저장을 건너뛰게 하고,
+                # 그 단계가 끝날 때까지 기다려 호출자가 잡고 있는 동시 처리 슬롯을 유지
+                cancelled.set()
+                await asyncio.gather(task, return_exceptions=True)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        except Exception as e:
+            logger.exception("Batch SRS item failed", exc_info=e)
+            result.update({"status": "error", "error": str(e)})
+
+        result["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
@@ -1,5 +1,7 @@
 """Continue Session Use Case"""
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, Optional, AsyncIterator, Tuple
+from backend.domain.models.state import RequirementState
 from backend.infrastructure.graph.executor import DummyExecutor
 
 
@@ -14,13 +16,14 @@ class ContinueSessionUseCase:
         """Use Case 초기화"""
         self.executor = DummyExecutor()
 
-    def execute(self, session_id: str, user_response: str) -> Dict[str, Any]:
+    def execute(self, session_id: str, user_response: str, idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """
         세션 계속 실행
 
         Args:
             session_id: 세션 ID
             user_response: 사용자 응답
+            idempotency_key: 요청의 Idempotency-Key (재시도면 첫 응답을 그대로 반환)
 
         Returns:
             업데이트된 세션 정보
@@ -31,10 +34,79 @@ class ContinueSessionUseCase:
             return {"error": "Session not found", "session_id": session_id}
 
         # 워크플로우 실행
-        state = self.executor.execute(session_id, user_response)
+        state = self.executor.execute(session_id, user_response, idempotency_key)
 
-        # 결과 반환
-        result = {
+        return self._build_result(session_id, state)
+
+    async def execute_async(
+        self,
+        session_id: str,
+        user_response: str,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        세션 계속 비동기 실행
+
+        Args:
+            session_id: 세션 ID
+            user_response: 사용자 응답
+            idempotency_key: 요청의 Idempotency-Key (재시도면 첫 응답을 그대로 반환)
+
+        Returns:
+            업데이트된 세션 정보
+        """
+        existing_state = await asyncio.to_thread(self.executor.get_state, session_id)
+        if existing_state is None:
+            return {"error": "Session not found", "session_id": session_id}
+
+        state = await self.executor.execute_async(session_id, user_response, idempotency_key)
+
+        return self._build_result(session_id, state)
+
+    def stream(
+        self,
+        session_id: str,
+        user_response: str
+    ) -> Optional[AsyncIterator[Tuple[str, Dict[str, Any]]]]:
+        """
+        세션 계속 스트리밍 실행
+
+        Args:
+            session_id: 세션 ID
+            user_response: 사용자 응답
+
+        Returns:
+            (이벤트 이름, 이벤트 데이터) 비동기 이터레이터 (세션이 없으면 None)
+            마지막 이벤트는 execute()와 같은 결과를 담은 "done"입니다.
+        """
+        if self.executor.get_state(session_id) is None:
+            return None
+        return self._stream_events(session_id, user_response)
+
+    async def _stream_events(
+        self,
+        session_id: str,
+        user_response: str
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """워크플로우 이벤트 전달 후 최종 결과를 "done" 이벤트로 전달"""
+        async for event, data in self.executor.execute_stream(session_id, user_response):
+            if event == "state":
+                yield "done", self._build_result(session_id, data["state"])
+            else:
+                yield event, data
+
+    def _build_result(self, session_id: str, state: RequirementState) -> Dict[str, Any]:
+        """
+        응답 딕셔너리 생성
+
+        Args:
+            session_id: 세션 ID
+            state: 실행 후 요구사항 상태
+
+        Returns:
+            업데이트된 세션 정보
+        """
+        return {
             "session_id": session_id,
             "questions": state.questions,
             "messages": [{"role": msg.role, "content": msg.content} for msg in state.messages],
@@ -43,5 +115,3 @@ class ContinueSessionUseCase:
             "iteration_count": state.iteration_count,
             "final_srs": state.final_srs,
         }
-
-        return result
@@ -1,6 +1,14 @@
 """Get SRS Use Case"""
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, AsyncIterator, Tuple
+from backend.domain.models.srs import SRSRenditions
+from backend.domain.models.state import RequirementState
+from backend.domain.agents.writer_agent import iter_srs_sections, build_srs_json, set_final_srs
 from backend.infrastructure.graph.executor import DummyExecutor
+from backend.infrastructure.graph.workflow import to_jsonable
+from backend.utils.srs_formatter import build_srs_renditions, srs_content_hash
+
+# 지원하는 문서 형식
+SRS_FORMATS = ("json", "markdown")
 
 
 class GetSRSUseCase:
@@ -8,6 +16,7 @@ class GetSRSUseCase:
     SRS 문서 조회 Use Case
 
     세션의 최종 SRS 문서를 조회합니다.
+    Markdown / 파싱된 딕셔너리는 완료 시점에 세션에 저장된 표현을 그대로 사용합니다.
     """
 
     def __init__(self):
@@ -24,17 +33,141 @@ class GetSRSUseCase:
 
         Returns:
             SRS 문서
+            - content: 요청한 형식의 문서 (SRS가 없으면 None)
+            - srs_data: 파싱된 SRS 딕셔너리 (SRS가 없으면 None)
+            - etag: SRS 콘텐츠 해시 (SRS가 없으면 None)
         """
+        if format not in SRS_FORMATS:
+            return {"error": f"Unsupported format: {format}", "session_id": session_id}
+
         # 상태 조회
         state = self.executor.get_state(session_id)
         if state is None:
             return {"error": "Session not found", "session_id": session_id}
 
+        renditions = self._get_renditions(session_id, state)
+
         # SRS 반환
         result = {
             "session_id": session_id,
             "final_srs": state.final_srs,
             "is_complete": state.is_complete,
+            "format": format,
+            "content": None,
+            "srs_data": None,
+            "etag": None,
         }
 
+        if renditions is not None:
+            result["content"] = renditions.markdown if format == "markdown" else state.final_srs
+            result["srs_data"] = renditions.data
+            result["etag"] = renditions.content_hash
+
         return result
+
+    def _get_renditions(self, session_id: str, state: RequirementState) -> Optional[SRSRenditions]:
+        """
+        저장된 SRS 표현 조회 (없거나 final_srs와 해시가 다르면 다시 생성하여 저장)
+
+        Args:
+            session_id: 세션 ID
+            state: 요구사항 상태
+
+        Returns:
+            SRSRenditions 또는 None (SRS가 없는 경우)
+        """
+        renditions, rebuilt = _current_renditions(state)
+        if rebuilt:
+            self.executor.update_state(session_id, lambda latest: _store_renditions(latest, renditions))
+        return renditions
+
+    def stream(self, session_id: str) -> Optional[AsyncIterator[Tuple[str, Dict[str, Any]]]]:
+        """
+        SRS 섹션 스트리밍
+
+        이미 생성된 SRS가 있으면 저장된 섹션을 순서대로 전달하고,
+        없으면 현재까지 수집된 정보로 섹션을 생성하면서 전달합니다.
+        생성한 SRS는 세션이 완료된 경우에만 저장하며, 진행 중인 세션은 미리보기로만 전달하고
+        final_srs를 비워 둡니다 (GET /api/srs/{session_id}와 같은 완료 여부 유지).
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            (이벤트 이름, 이벤트 데이터) 비동기 이터레이터 (세션이 없으면 None)
+        """
+        state = self.executor.get_state(session_id)
+        if state is None:
+            return None
+        return self._stream_sections(session_id, state)
+
+    async def _stream_sections(
+        self,
+        session_id: str,
+        state: RequirementState
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """SRS 섹션 이벤트 전달 후 최종 문서를 "done" 이벤트로 전달"""
+        renditions, rebuilt = _current_renditions(state)
+        if rebuilt:
+            await self.executor.update_state_async(
+                session_id, lambda latest: _store_renditions(latest, renditions)
+            )
+
+        if renditions is not None:
+            for name, value in renditions.data.items():
+                yield "srs_section", {"section": name, "content": value}
+        else:
+            sections = {}
+            for name, value in iter_srs_sections(state):
+                sections[name] = value
+                yield "srs_section", {"section": name, "content": to_jsonable(value)}
+            # 진행 중인 세션의 미리보기는 저장하지 않음 (final_srs는 None으로 전달)
+            if state.is_complete:
+                set_final_srs(state, build_srs_json(sections))
+                await self.executor.update_state_async(
+                    session_id, lambda latest: _store_final_srs(latest, state.final_srs)
+                )
+
+        yield "done", {
+            "session_id": session_id,
+            "final_srs": state.final_srs,
+            "is_complete": state.is_complete,
+        }
+
+
+def _current_renditions(state: RequirementState) -> Tuple[Optional[SRSRenditions], bool]:
+    """
+    상태의 SRS 표현 (없거나 final_srs와 해시가 다르면 다시 생성)
+
+    Args:
+        state: 요구사항 상태 (다시 생성한 표현으로 갱신됨)
+
+    Returns:
+        (SRSRenditions 또는 None, 다시 생성했는지 여부)
+    """
+    if not state.final_srs:
+        return None, False
+
+    renditions = state.srs_renditions
+    if renditions is not None and renditions.content_hash == srs_content_hash(state.final_srs):
+        return renditions, False
+
+    renditions = build_srs_renditions(state.final_srs)
+    state.srs_renditions = renditions
+    return renditions, True
+
+
+def _store_renditions(latest: RequirementState, renditions: SRSRenditions) -> bool:
+    """저장소의 최신 상태가 같은 SRS일 때만 다시 생성한 표현 반영"""
+    if not latest.final_srs or srs_content_hash(latest.final_srs) != renditions.content_hash:
+        return False
+    latest.srs_renditions = renditions
+    return True
+
+
+def _store_final_srs(latest: RequirementState, final_srs: str) -> bool:
+    """스트리밍으로 생성한 SRS 반영 (그 사이 다른 요청이 SRS를 만들었으면 그대로 둠)"""
+    if latest.final_srs:
+        return False
+    set_final_srs(latest, final_srs)
+    return True
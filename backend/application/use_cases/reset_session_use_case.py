@@ -1,6 +1,8 @@
 """Reset Session Use Case"""
 from typing import Dict, Any
+from backend.domain.agents.speculation import get_speculation_store
 from backend.infrastructure.graph.executor import DummyExecutor
+from backend.utils.tracing import get_trace_recorder
 
 
 class ResetSessionUseCase:
@@ -24,10 +26,13 @@ class ResetSessionUseCase:
         Returns:
             리셋 결과
         """
-        # 세션 삭제
-        deleted = self.executor.repository.delete(session_id)
+        # 세션 삭제 (진행 중인 턴이 있으면 끝난 뒤 삭제하여 저장으로 되살아나지 않게 함)
+        with self.executor.repository.lock(session_id):
+            deleted = self.executor.repository.delete(session_id)
 
         if deleted:
+            get_trace_recorder().discard_session(session_id)
+            get_speculation_store().discard(session_id)
             return {
                 "message": "Session reset successfully",
                 "session_id": session_id,
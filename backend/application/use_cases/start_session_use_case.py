@@ -1,5 +1,7 @@
 """Start Session Use Case"""
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, Optional
+from backend.domain.models.state import RequirementState
 from backend.infrastructure.graph.executor import DummyExecutor
 
 
@@ -14,23 +16,51 @@ class StartSessionUseCase:
         """Use Case 초기화"""
         self.executor = DummyExecutor()
 
-    def execute(self, initial_input: str) -> Dict[str, Any]:
+    def execute(self, initial_input: str, idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """
         세션 시작 실행
 
         Args:
             initial_input: 초기 사용자 입력
+            idempotency_key: 요청의 Idempotency-Key (재시도면 같은 세션과 첫 응답을 반환)
 
         Returns:
             세션 정보 및 첫 질문
         """
         # 새 세션 생성
-        session_id = self.executor.create_session()
+        session_id = self.executor.create_session(idempotency_key)
 
         # 워크플로우 실행
-        state = self.executor.execute(session_id, initial_input)
+        state = self.executor.execute(session_id, initial_input, idempotency_key)
 
-        # 결과 반환
+        return self._build_result(session_id, state)
+
+    async def execute_async(self, initial_input: str, idempotency_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        세션 시작 비동기 실행
+
+        Args:
+            initial_input: 초기 사용자 입력
+            idempotency_key: 요청의 Idempotency-Key (재시도면 같은 세션과 첫 응답을 반환)
+
+        Returns:
+            세션 정보 및 첫 질문
+        """
+        session_id = await asyncio.to_thread(self.executor.create_session, idempotency_key)
+        state = await self.executor.execute_async(session_id, initial_input, idempotency_key)
+        return self._build_result(session_id, state)
+
+    def _build_result(self, session_id: str, state: RequirementState) -> Dict[str, Any]:
+        """
+        응답 딕셔너리 생성
+
+        Args:
+            session_id: 세션 ID
+            state: 실행 후 요구사항 상태
+
+        Returns:
+            세션 정보 및 첫 질문
+        """
         return {
             "session_id": session_id,
             "questions": state.questions,
@@ -1,11 +1,16 @@
 """Consultant Agent - LLM 기반 질문 생성"""
+from typing import AsyncIterator, List, Optional
 from backend.domain.models.state import RequirementState, Message
-from backend.infrastructure.llm.gemini_client import get_gemini_client
+from backend.infrastructure.llm.client_registry import get_llm_client
 from backend.infrastructure.prompts.consultant_prompt import (
     CONSULTANT_SYSTEM_PROMPT,
     get_consultant_prompt
 )
+from backend.infrastructure.prompts.hint_index import get_hint_index, rule_based_hint
+from backend.infrastructure.prompts.prompt_builder import get_prompt_builder
 from backend.utils.logger import setup_logger
+from backend.utils.tracing import STAGE_CONSULTANT_LLM, STAGE_EXAMPLE_HINT_LLM, trace_stage
+from config.settings import settings
 
 # 로거 설정
 logger = setup_logger(__name__)
@@ -21,128 +26,209 @@ def consultant_agent(state: RequirementState) -> RequirementState:
     Returns:
         업데이트된 요구사항 상태
     """
-    # LLM 클라이언트 가져오기
-    llm_client = get_gemini_client()
-
-    # 대화 히스토리 생성 (assistant 메시지만 추출 - 이미 물어본 질문들)
-    conversation_history = "\n".join([
-        f"Already asked: {msg.content}" for msg in state.messages
-        if msg.role == "assistant"
-    ])
+    # 공유 LLM 클라이언트 가져오기
+    llm_client = get_llm_client()
 
     # 프롬프트 생성
-    user_prompt = get_consultant_prompt(
-        collected_info=state.collected_info,
-        user_input=state.user_input,
-        conversation_history=conversation_history
-    )
+    user_prompt = _build_consultant_prompt(state)
 
     try:
         # LLM 호출하여 질문 생성
-        response = llm_client.generate_with_context(
-            system_prompt=CONSULTANT_SYSTEM_PROMPT,
-            user_message=user_prompt
-        )
-
-        # 응답 파싱: 프롬프트가 "질문만 출력"하라고 했으므로 전체 응답을 질문으로 사용
-        response_clean = response.strip()
-
-        # 만약 질문 형태가 아니면 (물음표가 없으면) 기본 질문 사용
-        if '?' in response_clean or '？' in response_clean:
-            # 여러 줄이 있으면 첫 번째 줄만 사용
-            first_line = response_clean.split('\n')[0].strip()
-            questions = [first_line]
-        else:
-            # 질문 형태가 아니면 fallback
-            questions = ["프로젝트에 대해 더 자세히 설명해주실 수 있나요?"]
+        with trace_stage(STAGE_CONSULTANT_LLM):
+            response = llm_client.generate_with_context(
+                system_prompt=CONSULTANT_SYSTEM_PROMPT,
+                user_message=user_prompt
+            )
 
-        # State 업데이트
+        questions = _parse_questions(response)
         state.questions = questions
 
         # 메시지 추가 (예시 포함)
         if questions:
-            main_question = questions[0]
+            example_hint = _get_example_hint_for_question(questions[0], state.collected_info)
+            _append_question_message(state, questions[0], example_hint)
+
+    except Exception as e:
+        logger.exception("Consultant Agent LLM error occurred", exc_info=e)
+        _apply_default_question(state)
+
+    return state
+
+
+async def consultant_agent_async(state: RequirementState) -> RequirementState:
+    """
+    consultant_agent의 비동기 버전 (LLM 대기 중 이벤트 루프를 점유하지 않음)
+
+    Args:
+        state: 현재 요구사항 상태
 
-            # 질문에 맞는 예시 추가
-            example_hint = _get_example_hint_for_question(main_question, state.collected_info)
+    Returns:
+        업데이트된 요구사항 상태
+    """
+    llm_client = get_llm_client()
+    user_prompt = _build_consultant_prompt(state)
 
-            if example_hint:
-                full_message = f"추가 정보가 필요합니다:\n\n{main_question}\n\n{example_hint}"
-            else:
-                full_message = f"추가 정보가 필요합니다:\n\n{main_question}"
+    try:
+        with trace_stage(STAGE_CONSULTANT_LLM):
+            response = await llm_client.generate_with_context_async(
+                system_prompt=CONSULTANT_SYSTEM_PROMPT,
+                user_message=user_prompt
+            )
 
-            state.messages.append(
-                Message(
-                    role="assistant",
-                    content=full_message
-                )
+        questions = _parse_questions(response)
+        state.questions = questions
+
+        if questions:
+            example_hint = await _get_example_hint_for_question_async(
+                questions[0], state.collected_info
             )
+            _append_question_message(state, questions[0], example_hint)
 
     except Exception as e:
         logger.exception("Consultant Agent LLM error occurred", exc_info=e)
-        logger.warning("Falling back to default questions")
-
-        # Fallback: 기본 질문 사용
-        default_questions = [
-            "프로젝트의 주요 기능은 무엇인가요?"
-        ]
-
-        state.questions = default_questions
-        state.messages.append(
-            Message(
-                role="assistant",
-                content=f"추가 정보가 필요합니다:\n\n{default_questions[0]}"
-            )
-        )
+        _apply_default_question(state)
 
     return state
 
 
-def _get_rule_based_example(question: str) -> str:
+async def consultant_agent_stream(state: RequirementState) -> AsyncIterator[str]:
     """
-    규칙 기반으로 자주 나오는 질문에 대한 예시 제공
+    consultant_agent의 스트리밍 버전 (LLM 토큰을 생성되는 대로 전달)
+
+    스트림이 끝나면 state에 질문과 assistant 메시지가 반영됩니다.
 
     Args:
-        question: 질문 문자열
+        state: 현재 요구사항 상태 (직접 갱신됨)
+
+    Yields:
+        LLM 응답 텍스트 청크
+    """
+    llm_client = get_llm_client()
+    user_prompt = _build_consultant_prompt(state)
+
+    try:
+        chunks = []
+        # 스트리밍 단계 시간에는 청크를 소비하는 쪽의 전송 시간도 포함됨
+        with trace_stage(STAGE_CONSULTANT_LLM):
+            async for chunk in llm_client.generate_with_context_stream_async(
+                system_prompt=CONSULTANT_SYSTEM_PROMPT,
+                user_message=user_prompt
+            ):
+                chunks.append(chunk)
+                yield chunk
+
+        questions = _parse_questions("".join(chunks))
+        state.questions = questions
+
+        if questions:
+            example_hint = await _get_example_hint_for_question_async(
+                questions[0], state.collected_info
+            )
+            _append_question_message(state, questions[0], example_hint)
+
+    except Exception as e:
+        logger.exception("Consultant Agent LLM error occurred", exc_info=e)
+        _apply_default_question(state)
+
+
+def _build_consultant_prompt(state: RequirementState) -> str:
+    """
+    Consultant 사용자 프롬프트 생성
+
+    Args:
+        state: 현재 요구사항 상태
 
     Returns:
-        예시 문자열 또는 None
+        완성된 프롬프트
     """
-    question_lower = question.lower()
+    # 이미 물어본 질문 목록 (새 메시지만 증분 렌더링)
+    conversation_history = get_prompt_builder().consultant_history(state)
+
+    return get_consultant_prompt(
+        collected_info=state.collected_info,
+        user_input=state.user_input,
+        conversation_history=conversation_history
+    )
 
-    # 인증 관련
-    if "인증" in question_lower or "로그인" in question_lower:
-        return "💡 예: 이메일/비밀번호, 카카오 로그인, 구글 로그인, 네이버 로그인 등"
 
-    # 결제 관련
-    if "결제" in question_lower or "pg" in question_lower or "페이먼트" in question_lower:
-        return "💡 예: 토스페이먼츠, KG이니시스, 카카오페이, 네이버페이 등"
+def _parse_questions(response: str) -> List[str]:
+    """
+    LLM 응답에서 질문 추출
 
-    # 배포 관련
-    if "배포" in question_lower or "서버" in question_lower or "클라우드" in question_lower:
-        return "💡 예: AWS, GCP, Azure, 네이버 클라우드, 온프레미스 등"
+    Args:
+        response: LLM 응답 문자열
+
+    Returns:
+        질문 리스트 (질문 형태가 아니면 기본 질문)
+    """
+    # 응답 파싱: 프롬프트가 "질문만 출력"하라고 했으므로 전체 응답을 질문으로 사용
+    response_clean = response.strip()
+
+    # 만약 질문 형태가 아니면 (물음표가 없으면) 기본 질문 사용
+    if '?' in response_clean or '？' in response_clean:
+        # 여러 줄이 있으면 첫 번째 줄만 사용
+        first_line = response_clean.split('\n')[0].strip()
+        return [first_line]
+
+    # 질문 형태가 아니면 fallback
+    return ["프로젝트에 대해 더 자세히 설명해주실 수 있나요?"]
+
+
+def _append_question_message(state: RequirementState, question: str, example_hint: str) -> None:
+    """
+    질문(및 예시 힌트)을 assistant 메시지로 추가
+
+    Args:
+        state: 현재 요구사항 상태
+        question: 메인 질문
+        example_hint: 예시 힌트 (없으면 None)
+    """
+    if example_hint:
+        full_message = f"추가 정보가 필요합니다:\n\n{question}\n\n{example_hint}"
+    else:
+        full_message = f"추가 정보가 필요합니다:\n\n{question}"
+
+    state.messages.append(
+        Message(
+            role="assistant",
+            content=full_message
+        )
+    )
+
+
+def _apply_default_question(state: RequirementState) -> None:
+    """
+    LLM 실패 시 기본 질문 적용
+
+    Args:
+        state: 현재 요구사항 상태
+    """
+    logger.warning("Falling back to default questions")
 
-    # 배송 관련
-    if "배송" in question_lower or "택배" in question_lower or "물류" in question_lower:
-        return "💡 예: 당일 배송, 익일 배송, 무료 배송(조건부), 배송비 3000원 등"
+    default_questions = [
+        "프로젝트의 주요 기능은 무엇인가요?"
+    ]
 
-    # 규모 관련
-    if "규모" in question_lower or "사용자" in question_lower or "트래픽" in question_lower:
-        return "💡 예: 월 1만명, 일 1000명, 동시 접속 100명 등"
+    state.questions = default_questions
+    state.messages.append(
+        Message(
+            role="assistant",
+            content=f"추가 정보가 필요합니다:\n\n{default_questions[0]}"
+        )
+    )
 
-    # 데이터베이스 관련
-    if "데이터베이스" in question_lower or "db" in question_lower or "저장" in question_lower:
-        return "💡 예: PostgreSQL, MySQL, MongoDB, Redis 등"
 
-    # 모바일 관련
-    if "모바일" in question_lower or "앱" in question_lower:
-        return "💡 예: iOS/Android 네이티브, React Native, Flutter 등"
+def _get_rule_based_example(question: str) -> str:
+    """
+    규칙 기반으로 자주 나오는 질문에 대한 예시 제공
 
-    # 알림 관련
-    if "알림" in question_lower or "notification" in question_lower:
-        return "💡 예: 푸시 알림, 이메일, SMS, 카카오톡 알림톡 등"
+    Args:
+        question: 질문 문자열
 
-    return None
+    Returns:
+        예시 문자열 또는 None
+    """
+    return rule_based_hint(question)
 
 
 def _get_fallback_example(question: str) -> str:
@@ -175,6 +261,9 @@ def _get_example_hint_for_question(question: str, collected_info: dict) -> str:
     """
     LLM을 사용하여 질문에 맞는 간단한 예시 힌트 생성 (인라인용)
 
+    힌트 색인이 켜져 있으면 LLM을 기다리지 않고 색인에서 힌트를 찾고,
+    색인에 없는 질문은 폴백 예시로 응답한 뒤 백그라운드에서 LLM 힌트를 생성합니다.
+
     Args:
         question: 생성된 질문
         collected_info: 수집된 정보
@@ -182,6 +271,9 @@ def _get_example_hint_for_question(question: str, collected_info: dict) -> str:
     Returns:
         예시 힌트 문자열 (없으면 폴백 예시 사용)
     """
+    if settings.hint_index_enabled:
+        return _get_indexed_example_hint(question)
+
     try:
         # 먼저 규칙 기반 예시 시도
         rule_based_example = _get_rule_based_example(question)
@@ -190,13 +282,100 @@ def _get_example_hint_for_question(question: str, collected_info: dict) -> str:
             return rule_based_example
 
         # 규칙 기반 예시가 없으면 LLM 사용
-        llm_client = get_gemini_client()
+        llm_client = get_llm_client()
+        with trace_stage(STAGE_EXAMPLE_HINT_LLM):
+            response = llm_client.generate(_build_example_prompt(question, collected_info))
+        return _parse_example_hint(response, question)
+
+    except Exception as e:
+        # LLM 호출 실패 시 폴백 예시 사용
+        logger.exception(f"Error generating example, using fallback", exc_info=e)
+        return _get_fallback_example(question)
+
+
+async def _get_example_hint_for_question_async(question: str, collected_info: dict) -> str:
+    """
+    _get_example_hint_for_question의 비동기 버전
 
-        # 프로젝트 컨텍스트 정보
-        project_context = "\n".join([f"- {k}: {v}" for k, v in collected_info.items()]) if collected_info else "없음"
+    Args:
+        question: 생성된 질문
+        collected_info: 수집된 정보
 
-        # LLM에게 예시 생성 요청
-        example_prompt = f"""다음 질문에 대한 간단한 인라인 예시를 생성해주세요.
+    Returns:
+        예시 힌트 문자열 (없으면 폴백 예시 사용)
+    """
+    if settings.hint_index_enabled:
+        return _get_indexed_example_hint(question)
+
+    try:
+        rule_based_example = _get_rule_based_example(question)
+        if rule_based_example:
+            logger.debug(f"Using rule-based example for: {question[:50]}...")
+            return rule_based_example
+
+        llm_client = get_llm_client()
+        with trace_stage(STAGE_EXAMPLE_HINT_LLM):
+            response = await llm_client.generate_async(_build_example_prompt(question, collected_info))
+        return _parse_example_hint(response, question)
+
+    except Exception as e:
+        logger.exception(f"Error generating example, using fallback", exc_info=e)
+        return _get_fallback_example(question)
+
+
+def _get_indexed_example_hint(question: str) -> str:
+    """
+    힌트 색인에서 예시 힌트 찾기 (색인에 없으면 백그라운드 LLM 생성 예약 후 폴백 예시)
+
+    Args:
+        question: 생성된 질문
+
+    Returns:
+        예시 힌트 문자열
+    """
+    index = get_hint_index()
+    hint = index.lookup(question)
+    if hint:
+        return hint
+
+    index.schedule_fill(question, _generate_example_hint)
+    return _get_fallback_example(question)
+
+
+def _generate_example_hint(question: str) -> Optional[str]:
+    """
+    LLM으로 예시 힌트 생성 (백그라운드 색인 채우기용)
+
+    색인된 힌트는 모든 세션이 공유하므로 세션의 수집 정보 없이 질문만으로 생성합니다.
+
+    Args:
+        question: 생성된 질문
+
+    Returns:
+        "💡 예:" 힌트 (형식이 맞지 않으면 None)
+    """
+    response = get_llm_client().generate(_build_example_prompt(question, {}))
+    if not response or "💡 예:" not in response:
+        return None
+    return _parse_example_hint(response, question)
+
+
+def _build_example_prompt(question: str, collected_info: dict) -> str:
+    """
+    예시 힌트 생성용 프롬프트 작성
+
+    Args:
+        question: 생성된 질문
+        collected_info: 수집된 정보
+
+    Returns:
+        LLM 프롬프트 문자열
+    """
+    # 프로젝트 컨텍스트 정보
+    project_context = "\n".join([f"- {k}: {v}" for k, v in collected_info.items()]) if collected_info else "없음"
+
+    # LLM에게 예시 생성 요청
+    return f"""다음 질문에 대한 간단한 인라인 예시를 생성해주세요.
 
 질문: {question}
 
@@ -214,29 +393,35 @@ def _get_example_hint_for_question(question: str, collected_info: dict) -> str:
 
 위 형식을 정확히 따라 예시를 생성하세요:"""
 
-        response = llm_client.generate(example_prompt)
-        example_hint = response.strip()
-
-        logger.debug(f"Question: {question[:50]}...")
-        logger.debug(f"LLM Response: {example_hint}")
-
-        # "💡 예:"로 시작하는지 확인
-        if "💡 예:" in example_hint:
-            # "💡 예:" 부분 추출
-            if example_hint.startswith("💡 예:"):
-                return example_hint
-            else:
-                # 중간에 있으면 해당 부분만 추출
-                example_start = example_hint.find("💡 예:")
-                return example_hint[example_start:]
-        else:
-            # 형식이 맞지 않으면 폴백 예시 생성
-            logger.warning(f"Invalid format, using fallback for: {question[:50]}...")
-            return _get_fallback_example(question)
 
-    except Exception as e:
-        # LLM 호출 실패 시 폴백 예시 사용
-        logger.exception(f"Error generating example, using fallback", exc_info=e)
+def _parse_example_hint(response: str, question: str) -> str:
+    """
+    LLM 응답에서 "💡 예:" 힌트 추출
+
+    Args:
+        response: LLM 응답 문자열
+        question: 원래 질문 (폴백 예시용)
+
+    Returns:
+        예시 힌트 문자열
+    """
+    example_hint = response.strip()
+
+    logger.debug(f"Question: {question[:50]}...")
+    logger.debug(f"LLM Response: {example_hint}")
+
+    # "💡 예:"로 시작하는지 확인
+    if "💡 예:" in example_hint:
+        # "💡 예:" 부분 추출
+        if example_hint.startswith("💡 예:"):
+            return example_hint
+        else:
+            # 중간에 있으면 해당 부분만 추출
+            example_start = example_hint.find("💡 예:")
+            return example_hint[example_start:]
+    else:
+        # 형식이 맞지 않으면 폴백 예시 생성
+        logger.warning(f"Invalid format, using fallback for: {question[:50]}...")
         return _get_fallback_example(question)
 
 
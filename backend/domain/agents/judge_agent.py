@@ -1,12 +1,13 @@
 """Judge Agent - LLM 기반 완전성 평가"""
 import json
+from typing import List
 from backend.domain.models.state import RequirementState, Message
-from backend.infrastructure.llm.gemini_client import get_gemini_client
-from backend.infrastructure.prompts.judge_prompt import (
-    JUDGE_SYSTEM_PROMPT,
-    get_judge_prompt
-)
+from backend.infrastructure.llm.client_registry import get_llm_client
+from backend.infrastructure.prompts.judge_prompt import JUDGE_SYSTEM_PROMPT
+from backend.infrastructure.prompts.judge_context import get_judge_context_compactor
 from backend.utils.string_utils import safe_lower
+from backend.utils.tracing import STAGE_JUDGE_LLM, STAGE_JUDGE_RULES, record_llm_call_saved, trace_stage
+from config.settings import settings
 
 
 def judge_agent(state: RequirementState) -> RequirementState:
@@ -20,157 +21,273 @@ def judge_agent(state: RequirementState) -> RequirementState:
         업데이트된 요구사항 상태
     """
     # iteration 제한 체크
-    if state.iteration_count >= 10:
-        state.is_complete = True
-        state.judge_feedback = "최대 반복 횟수에 도달했습니다. 현재 수집된 정보로 SRS를 생성합니다."
+    if _apply_iteration_limit(state):
         return state
 
-    # LLM 클라이언트 가져오기
-    llm_client = get_gemini_client()
+    # 필수 항목이 빠져 있으면 LLM 응답과 무관하게 reject이므로 호출 생략
+    if _apply_rule_fast_path(state):
+        return state
+
+    # 공유 LLM 클라이언트 가져오기
+    llm_client = get_llm_client()
+
+    try:
+        with trace_stage(STAGE_JUDGE_LLM):
+            # 프롬프트 생성 (토큰 예산 안으로 압축)
+            user_prompt = _build_judge_prompt(state)
+
+            # LLM 호출하여 평가 수행
+            response = llm_client.generate_with_context(
+                system_prompt=JUDGE_SYSTEM_PROMPT,
+                user_message=user_prompt
+            )
+        _apply_judge_response(state, response)
+
+    except Exception as e:
+        print(f"⚠️ Judge Agent LLM error: {e}")
+        print("⚠️ Falling back to strict evaluation")
+        _apply_fallback_evaluation(state)
+
+    return state
 
-    # 대화 히스토리 생성
-    conversation_history = "\n".join([
-        f"{msg.role}: {msg.content}" for msg in state.messages
-    ])
 
-    # 프롬프트 생성
-    user_prompt = get_judge_prompt(
-        collected_info=state.collected_info,
-        conversation_history=conversation_history
-    )
+async def judge_agent_async(state: RequirementState) -> RequirementState:
+    """
+    judge_agent의 비동기 버전 (LLM 대기 중 이벤트 루프를 점유하지 않음)
 
+    Args:
+        state: 현재 요구사항 상태
+
+    Returns:
+        업데이트된 요구사항 상태
+    """
+    if _apply_iteration_limit(state):
+        return state
+
+    if _apply_rule_fast_path(state):
+        return state
+
+    llm_client = get_llm_client()
     try:
-        # LLM 호출하여 평가 수행
-        response = llm_client.generate_with_context(
-            system_prompt=JUDGE_SYSTEM_PROMPT,
-            user_message=user_prompt
-        )
-
-        # 응답 파싱 (decision, completeness_score, feedback 추출)
-        decision = "reject"  # 기본값
-        completeness_score = 0.0
-        feedback = ""
-
-        # response가 None이면 기본값 사용
-        if not response:
-            response = "정보 부족"
-
-        # 간단한 파싱: "approve" 또는 "reject" 키워드 찾기
-        response_lower = safe_lower(response)
-
-        if "approve" in response_lower or "충분" in response or "완료" in response:
-            decision = "approve"
-            completeness_score = 0.8
-        elif "reject" in response_lower or "부족" in response or "필요" in response:
-            decision = "reject"
-            completeness_score = 0.4
-
-        # completeness_score 추출 시도
-        if "completeness_score" in response_lower:
-            try:
-                # "completeness_score: 0.7" 형태 찾기
-                score_str = response.split("completeness_score")[1].split()[0].strip(':').strip()
-                completeness_score = float(score_str)
-            except:
-                pass
-
-        # feedback 추출
-        feedback_lines = []
-        for line in response.split('\n'):
-            line = line.strip()
-            if line and not line.startswith('-') and not line.startswith('*'):
-                # JSON 키가 아닌 일반 텍스트만 피드백으로 사용
-                line_lower = safe_lower(line)
-                if not any(key in line_lower for key in ['decision', 'completeness', 'missing']):
-                    feedback_lines.append(line)
-
-        feedback = " ".join(feedback_lines[:3])  # 최대 3줄
-
-        # CRITICAL: LLM 응답에 상관없이 필수 항목 체크 수행
-        # 값이 존재하고 비어있지 않은지 확인
-        def has_valid_value(key: str) -> bool:
-            value = state.collected_info.get(key)
-            return value is not None and str(value).strip() and str(value).strip() != "지정되지 않음"
-
-        has_auth = has_valid_value("authentication")
-        has_deployment = has_valid_value("deployment")
-        has_scale = has_valid_value("scale")
-
-        project_type = state.collected_info.get("project_type", "")
-        needs_payment = any(keyword in str(project_type).lower()
-                           for keyword in ["이커머스", "쇼핑", "예약", "결제"])
-        has_payment = has_valid_value("payment")
-
-        missing_items = []
-        if not has_auth:
-            missing_items.append("인증 방식")
-        if not has_deployment:
-            missing_items.append("배포 환경")
-        if not has_scale:
-            missing_items.append("예상 규모")
-        if needs_payment and not has_payment:
-            missing_items.append("결제 수단")
-
-        # State 업데이트: LLM approve + 필수 항목 모두 충족해야 complete
-        if (decision == "approve" or completeness_score >= 0.7) and not missing_items:
-            state.is_complete = True
-            state.judge_feedback = feedback or "충분한 정보가 수집되었습니다. SRS 문서를 생성할 수 있습니다."
-        else:
-            state.is_complete = False
-            if missing_items:
-                missing_str = ", ".join(missing_items)
-                state.judge_feedback = f"추가 정보 필요: {missing_str}"
-            else:
-                state.judge_feedback = feedback or "추가 정보가 필요합니다."
+        with trace_stage(STAGE_JUDGE_LLM):
+            user_prompt = _build_judge_prompt(state)
+            response = await llm_client.generate_with_context_async(
+                system_prompt=JUDGE_SYSTEM_PROMPT,
+                user_message=user_prompt
+            )
+        _apply_judge_response(state, response)
 
     except Exception as e:
         print(f"⚠️ Judge Agent LLM error: {e}")
         print("⚠️ Falling back to strict evaluation")
+        _apply_fallback_evaluation(state)
+
+    return state
+
+
+def _apply_iteration_limit(state: RequirementState) -> bool:
+    """
+    최대 반복 횟수 도달 시 강제 완료 처리
+
+    Args:
+        state: 현재 요구사항 상태
+
+    Returns:
+        강제 완료 처리 여부
+    """
+    if state.iteration_count >= 10:
+        state.is_complete = True
+        state.judge_feedback = "최대 반복 횟수에 도달했습니다. 현재 수집된 정보로 SRS를 생성합니다."
+        return True
+    return False
+
+
+def _missing_required_items(state: RequirementState) -> List[str]:
+    """
+    필수 항목 중 아직 수집되지 않은 항목 찾기
+
+    Args:
+        state: 현재 요구사항 상태
+
+    Returns:
+        누락된 필수 항목 이름 리스트
+    """
+    # 값이 존재하고 비어있지 않은지 확인
+    def has_valid_value(key: str) -> bool:
+        value = state.collected_info.get(key)
+        return value is not None and str(value).strip() and str(value).strip() != "지정되지 않음"
+
+    project_type = state.collected_info.get("project_type", "")
+    needs_payment = any(keyword in str(project_type).lower()
+                       for keyword in ["이커머스", "쇼핑", "예약", "결제"])
+
+    missing_items = []
+    if not has_valid_value("authentication"):
+        missing_items.append("인증 방식")
+    if not has_valid_value("deployment"):
+        missing_items.append("배포 환경")
+    if not has_valid_value("scale"):
+        missing_items.append("예상 규모")
+    if needs_payment and not has_valid_value("payment"):
+        missing_items.append("결제 수단")
+    return missing_items
 
-        # Fallback: 엄격한 평가 로직
-        # response_X 같은 백업 데이터는 제외하고 실제 추출된 정보만 카운트
-        extracted_categories = [k for k in state.collected_info.keys()
-                               if not k.startswith("response_") and k != "initial_request"]
-        info_count = len(extracted_categories)
-
-        # 필수 카테고리 개수를 동적으로 계산
-        required_count = 4  # 기본: project_type, scale, auth, deployment
-
-        # 필수 카테고리 확인
-        has_project_type = "project_type" in state.collected_info
-        has_scale = "scale" in state.collected_info
-        has_auth = "authentication" in state.collected_info
-        has_deployment = "deployment" in state.collected_info
-
-        # 이커머스/예약 프로젝트는 payment도 필수
-        project_type = state.collected_info.get("project_type", "")
-        needs_payment = any(keyword in str(project_type).lower()
-                           for keyword in ["이커머스", "쇼핑", "예약", "결제"])
-        has_payment = "payment" in state.collected_info
-
-        # 필수 항목 체크
-        missing_items = []
-        if not has_auth:
-            missing_items.append("인증 방식")
-        if not has_deployment:
-            missing_items.append("배포 환경")
-        if not has_scale:
-            missing_items.append("예상 규모")
-        if needs_payment and not has_payment:
-            missing_items.append("결제 수단")
-            required_count = 5  # 이커머스는 5개 필수
-
-        # 정보 개수와 필수 항목 모두 충족해야 approve
-        # CRITICAL: 모든 필수 항목이 있어야만 approve (missing_items가 비어있어야 함)
-        if info_count >= required_count and not missing_items:
-            state.is_complete = True
-            state.judge_feedback = "충분한 정보가 수집되었습니다. SRS 문서를 생성할 수 있습니다."
+
+def _apply_rule_fast_path(state: RequirementState) -> bool:
+    """
+    필수 항목 체크만으로 판정이 확정되면 LLM 없이 State 업데이트
+
+    필수 항목이 하나라도 빠져 있으면 LLM 응답과 관계없이 reject되므로
+    _apply_judge_response와 같은 결과를 바로 기록하고 절약한 호출을 judge_rules 단계에 남깁니다.
+    필수 항목이 모두 있으면 판정은 LLM에 달려 있으므로 처리하지 않습니다.
+
+    Args:
+        state: 현재 요구사항 상태
+
+    Returns:
+        LLM 호출 없이 판정했는지 여부
+    """
+    if not settings.judge_fast_path_enabled:
+        return False
+
+    missing_items = _missing_required_items(state)
+    if not missing_items:
+        return False
+
+    with trace_stage(STAGE_JUDGE_RULES):
+        state.is_complete = False
+        state.judge_feedback = f"추가 정보 필요: {', '.join(missing_items)}"
+        record_llm_call_saved()
+    return True
+
+
+def _build_judge_prompt(state: RequirementState) -> str:
+    """
+    Judge 사용자 프롬프트 생성
+
+    Args:
+        state: 현재 요구사항 상태
+
+    Returns:
+        완성된 프롬프트
+    """
+    # 중복된 답변 백업과 예시 힌트를 빼고, 예산을 넘는 오래된 대화는 요약하거나 제외
+    return get_judge_context_compactor().build_prompt(state)
+
+
+def _apply_judge_response(state: RequirementState, response: str) -> None:
+    """
+    LLM 평가 응답을 파싱하고 필수 항목 체크와 결합하여 State 업데이트
+
+    Args:
+        state: 현재 요구사항 상태
+        response: LLM 응답 문자열
+    """
+    # 응답 파싱 (decision, completeness_score, feedback 추출)
+    decision = "reject"  # 기본값
+    completeness_score = 0.0
+    feedback = ""
+
+    # response가 None이면 기본값 사용
+    if not response:
+        response = "정보 부족"
+
+    # 간단한 파싱: "approve" 또는 "reject" 키워드 찾기
+    response_lower = safe_lower(response)
+
+    if "approve" in response_lower or "충분" in response or "완료" in response:
+        decision = "approve"
+        completeness_score = 0.8
+    elif "reject" in response_lower or "부족" in response or "필요" in response:
+        decision = "reject"
+        completeness_score = 0.4
+
+    # completeness_score 추출 시도
+    if "completeness_score" in response_lower:
+        try:
+            # "completeness_score: 0.7" 형태 찾기
+            score_str = response.split("completeness_score")[1].split()[0].strip(':').strip()
+            completeness_score = float(score_str)
+        except:
+            pass
+
+    # feedback 추출
+    feedback_lines = []
+    for line in response.split('\n'):
+        line = line.strip()
+        if line and not line.startswith('-') and not line.startswith('*'):
+            # JSON 키가 아닌 일반 텍스트만 피드백으로 사용
+            line_lower = safe_lower(line)
+            if not any(key in line_lower for key in ['decision', 'completeness', 'missing']):
+                feedback_lines.append(line)
+
+    feedback = " ".join(feedback_lines[:3])  # 최대 3줄
+
+    # CRITICAL: LLM 응답에 상관없이 필수 항목 체크 수행
+    missing_items = _missing_required_items(state)
+
+    # State 업데이트: LLM approve + 필수 항목 모두 충족해야 complete
+    if (decision == "approve" or completeness_score >= 0.7) and not missing_items:
+        state.is_complete = True
+        state.judge_feedback = feedback or "충분한 정보가 수집되었습니다. SRS 문서를 생성할 수 있습니다."
+    else:
+        state.is_complete = False
+        if missing_items:
+            missing_str = ", ".join(missing_items)
+            state.judge_feedback = f"추가 정보 필요: {missing_str}"
         else:
-            state.is_complete = False
-            if missing_items:
-                missing_str = ", ".join(missing_items)
-                state.judge_feedback = f"추가 정보 필요: {missing_str} (현재 {info_count}/{required_count}개 수집)"
-            else:
-                state.judge_feedback = f"추가 정보가 필요합니다. (현재 {info_count}/{required_count}개 정보 수집됨)"
+            state.judge_feedback = feedback or "추가 정보가 필요합니다."
 
-    return state
+
+def _apply_fallback_evaluation(state: RequirementState) -> None:
+    """
+    LLM 실패 시 엄격한 규칙 기반 평가로 State 업데이트
+
+    Args:
+        state: 현재 요구사항 상태
+    """
+    # Fallback: 엄격한 평가 로직
+    # response_X 같은 백업 데이터는 제외하고 실제 추출된 정보만 카운트
+    extracted_categories = [k for k in state.collected_info.keys()
+                           if not k.startswith("response_") and k != "initial_request"]
+    info_count = len(extracted_categories)
+
+    # 필수 카테고리 개수를 동적으로 계산
+    required_count = 4  # 기본: project_type, scale, auth, deployment
+
+    # 필수 카테고리 확인
+    has_project_type = "project_type" in state.collected_info
+    has_scale = "scale" in state.collected_info
+    has_auth = "authentication" in state.collected_info
+    has_deployment = "deployment" in state.collected_info
+
+    # 이커머스/예약 프로젝트는 payment도 필수
+    project_type = state.collected_info.get("project_type", "")
+    needs_payment = any(keyword in str(project_type).lower()
+                       for keyword in ["이커머스", "쇼핑", "예약", "결제"])
+    has_payment = "payment" in state.collected_info
+
+    # 필수 항목 체크
+    missing_items = []
+    if not has_auth:
+        missing_items.append("인증 방식")
+    if not has_deployment:
+        missing_items.append("배포 환경")
+    if not has_scale:
+        missing_items.append("예상 규모")
+    if needs_payment and not has_payment:
+        missing_items.append("결제 수단")
+        required_count = 5  # 이커머스는 5개 필수
+
+    # 정보 개수와 필수 항목 모두 충족해야 approve
+    # CRITICAL: 모든 필수 항목이 있어야만 approve (missing_items가 비어있어야 함)
+    if info_count >= required_count and not missing_items:
+        state.is_complete = True
+        state.judge_feedback = "충분한 정보가 수집되었습니다. SRS 문서를 생성할 수 있습니다."
+    else:
+        state.is_complete = False
+        if missing_items:
+            missing_str = ", ".join(missing_items)
+            state.judge_feedback = f"추가 정보 필요: {missing_str} (현재 {info_count}/{required_count}개 수집)"
+        else:
+            state.judge_feedback = f"추가 정보가 필요합니다. (현재 {info_count}/{required_count}개 정보 수집됨)"
@@ -0,0 +1,293 @@
+"""Speculative Question - 다음 질문 사전 생성"""
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from backend.domain.models.state import RequirementState
+from backend.domain.agents.consultant_agent import (
+    _append_question_message,
+    _build_consultant_prompt,
+    _get_example_hint_for_question,
+    _get_example_hint_for_question_async,
+    _parse_questions,
+)
+from backend.infrastructure.llm.client_registry import get_llm_client
+from backend.infrastructure.prompts.consultant_prompt import CONSULTANT_SYSTEM_PROMPT
+from backend.utils.tracing import STAGE_SPECULATIVE_QUESTION, record_llm_call_saved, trace_stage
+
+# Consultant 프롬프트의 우선순위 규칙과 같은 순서
+PRIORITY_CATEGORIES = ("payment", "authentication", "scale", "deployment")
+
+# 질문 분류 키워드 (사용자 "인증"이 규모로 분류되지 않도록 인증을 먼저 확인)
+_CATEGORY_KEYWORDS = (
+    ("payment", ("결제", "pg", "페이먼트")),
+    ("authentication", ("인증", "로그인")),
+    ("deployment", ("배포", "서버", "클라우드", "호스팅", "인프라")),
+    ("scale", ("규모", "사용자 수", "사용자수", "동시 접속", "동시접속", "트래픽", "이용자")),
+)
+
+# 답변 대기 중인 항목을 추측 프롬프트에 채워 넣을 값
+_PENDING_ANSWER = "(답변 예정)"
+
+
+class SpeculativeQuestion(BaseModel):
+    """사용자 답변 전에 미리 만든 다음 질문"""
+    category: str
+    question: str
+    example_hint: Optional[str] = None
+    iteration: int  # 이 질문을 사용할 턴의 iteration_count
+
+
+def question_category(question: str) -> Optional[str]:
+    """
+    질문이 묻는 우선순위 항목 분류
+
+    Args:
+        question: 질문 문자열
+
+    Returns:
+        항목 이름 (우선순위 항목이 아니면 None)
+    """
+    question_lower = (question or "").lower()
+    for category, keywords in _CATEGORY_KEYWORDS:
+        if any(keyword in question_lower for keyword in keywords):
+            return category
+    return None
+
+
+def missing_priority_categories(collected_info: Dict) -> List[str]:
+    """
+    아직 수집되지 않은 우선순위 항목 (Consultant가 물어볼 순서)
+
+    Args:
+        collected_info: 수집된 정보
+
+    Returns:
+        누락 항목 이름 리스트
+    """
+    def has_valid_value(key: str) -> bool:
+        value = collected_info.get(key)
+        return value is not None and str(value).strip() and str(value).strip() != "지정되지 않음"
+
+    project_type = str(collected_info.get("project_type", "")).lower()
+    needs_payment = any(keyword in project_type for keyword in ["이커머스", "쇼핑", "예약", "결제"])
+
+    return [
+        category for category in PRIORITY_CATEGORIES
+        if (category != "payment" or needs_payment) and not has_valid_value(category)
+    ]
+
+
+def predict_next_category(state: RequirementState) -> Optional[str]:
+    """
+    방금 한 질문에 사용자가 답한다고 가정했을 때 다음에 물어볼 항목 추측
+
+    Args:
+        state: 턴이 끝난 요구사항 상태
+
+    Returns:
+        다음 질문 항목 (우선순위 항목이 모두 채워지면 None)
+    """
+    pending = question_category(state.questions[0]) if state.questions else None
+    remaining = [category for category in missing_priority_categories(state.collected_info) if category != pending]
+    return remaining[0] if remaining else None
+
+
+def _speculative_state(state: RequirementState) -> RequirementState:
+    """
+    방금 한 질문의 항목을 답변 예정으로 채운 가상 상태 (Consultant 프롬프트용 사본)
+
+    Args:
+        state: 턴이 끝난 요구사항 상태
+
+    Returns:
+        상태 사본
+    """
+    speculative = state.model_copy(deep=True)
+    pending = question_category(state.questions[0]) if state.questions else None
+    if pending:
+        speculative.collected_info[pending] = _PENDING_ANSWER
+    return speculative
+
+
+def _accept(state: RequirementState, category: str, response: str) -> Optional[SpeculativeQuestion]:
+    """LLM 응답이 추측한 항목을 묻는 질문이면 SpeculativeQuestion 생성"""
+    questions = _parse_questions(response or "")
+    if not questions or question_category(questions[0]) != category:
+        return None
+    return SpeculativeQuestion(category=category, question=questions[0], iteration=state.iteration_count)
+
+
+def speculate_next_question(state: RequirementState) -> Optional[SpeculativeQuestion]:
+    """
+    다음 질문과 예시 힌트 미리 생성 (턴이 끝난 뒤 백그라운드에서 실행)
+
+    Args:
+        state: 턴이 끝난 요구사항 상태 (읽기만 함)
+
+    Returns:
+        미리 만든 질문 (추측할 항목이 없거나 LLM이 다른 항목을 물으면 None)
+    """
+    category = predict_next_category(state)
+    if category is None:
+        return None
+
+    speculative = _speculative_state(state)
+    response = get_llm_client().generate_with_context(
+        system_prompt=CONSULTANT_SYSTEM_PROMPT,
+        user_message=_build_consultant_prompt(speculative)
+    )
+    result = _accept(state, category, response)
+    if result:
+        result.example_hint = _get_example_hint_for_question(result.question, speculative.collected_info)
+    return result
+
+
+async def speculate_next_question_async(state: RequirementState) -> Optional[SpeculativeQuestion]:
+    """
+    speculate_next_question의 비동기 버전
+
+    Args:
+        state: 턴이 끝난 요구사항 상태 (읽기만 함)
+
+    Returns:
+        미리 만든 질문 (추측할 항목이 없거나 LLM이 다른 항목을 물으면 None)
+    """
+    category = predict_next_category(state)
+    if category is None:
+        return None
+
+    speculative = _speculative_state(state)
+    response = await get_llm_client().generate_with_context_async(
+        system_prompt=CONSULTANT_SYSTEM_PROMPT,
+        user_message=_build_consultant_prompt(speculative)
+    )
+    result = _accept(state, category, response)
+    if result:
+        result.example_hint = await _get_example_hint_for_question_async(
+            result.question, speculative.collected_info
+        )
+    return result
+
+
+def is_speculation_valid(speculation: SpeculativeQuestion, state: RequirementState) -> bool:
+    """
+    사용자 답변 반영 후에도 미리 만든 질문이 유효한지 확인
+
+    같은 턴을 위해 만든 질문이고, 새로 추출한 정보 기준으로도 가장 먼저 물어볼 항목이
+    추측한 항목과 같으며, 아직 묻지 않은 질문이어야 합니다.
+
+    Args:
+        speculation: 미리 만든 질문
+        state: 사용자 답변이 반영된 요구사항 상태
+
+    Returns:
+        유효 여부
+    """
+    if speculation.iteration != state.iteration_count:
+        return False
+    missing = missing_priority_categories(state.collected_info)
+    if not missing or missing[0] != speculation.category:
+        return False
+    return not any(
+        speculation.question in message.content
+        for message in state.messages if message.role == "assistant"
+    )
+
+
+def apply_speculative_question(state: RequirementState, speculation: SpeculativeQuestion) -> RequirementState:
+    """
+    Consultant LLM 호출 대신 미리 만든 질문 적용 (절약한 호출을 speculative_question 단계에 기록)
+
+    Args:
+        state: 현재 요구사항 상태
+        speculation: 검증된 미리 만든 질문
+
+    Returns:
+        업데이트된 요구사항 상태
+    """
+    with trace_stage(STAGE_SPECULATIVE_QUESTION):
+        state.questions = [speculation.question]
+        _append_question_message(state, speculation.question, speculation.example_hint)
+        record_llm_call_saved()
+    return state
+
+
+class SpeculationStore:
+    """
+    세션별 미리 만든 질문 보관소 (프로세스 메모리, LRU)
+
+    다른 프로세스가 다음 요청을 처리하면 사용되지 않고 일반 경로로 질문을 생성합니다.
+    """
+
+    def __init__(self, max_sessions: int = 1000):
+        """
+        보관소 초기화
+
+        Args:
+            max_sessions: 보관할 최대 세션 수
+        """
+        self.max_sessions = max_sessions
+        self._items: "OrderedDict[str, SpeculativeQuestion]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 메트릭
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, session_id: str, speculation: SpeculativeQuestion) -> None:
+        """미리 만든 질문 저장 (이미 다음 턴이 시작되어 오래된 질문은 무시)"""
+        with self._lock:
+            current = self._items.get(session_id)
+            if current is not None and current.iteration > speculation.iteration:
+                return
+            self._items[session_id] = speculation
+            self._items.move_to_end(session_id)
+            while len(self._items) > self.max_sessions:
+                self._items.popitem(last=False)
+
+    def take(self, session_id: str, state: RequirementState) -> Optional[SpeculativeQuestion]:
+        """
+        세션의 미리 만든 질문을 꺼내 검증
+
+        Args:
+            session_id: 세션 ID
+            state: 사용자 답변이 반영된 요구사항 상태
+
+        Returns:
+            유효한 미리 만든 질문 (없거나 유효하지 않으면 None)
+        """
+        with self._lock:
+            speculation = self._items.pop(session_id, None)
+            valid = speculation is not None and is_speculation_valid(speculation, state)
+            if valid:
+                self.hits += 1
+            elif speculation is not None:
+                self.misses += 1
+        return speculation if valid else None
+
+    def discard(self, session_id: str) -> None:
+        """세션의 미리 만든 질문 삭제 (세션 리셋 시)"""
+        with self._lock:
+            self._items.pop(session_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """보관 중인 세션 수와 적중/실패 수"""
+        with self._lock:
+            return {"sessions": len(self._items), "hits": self.hits, "misses": self.misses}
+
+
+# 전역 공유 보관소
+_speculation_store = SpeculationStore()
+
+
+def get_speculation_store() -> SpeculationStore:
+    """
+    전역 미리 만든 질문 보관소 가져오기
+
+    Returns:
+        SpeculationStore 인스턴스
+    """
+    return _speculation_store
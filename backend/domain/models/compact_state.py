@@ -0,0 +1,304 @@
+"""Compact Session State - 저장용 세션 상태 표현"""
+import sys
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.domain.models.srs import SRSRenditions
+from backend.domain.models.state import Message, PromptContext, RequirementState
+from backend.infrastructure.prompts.turn_renderer import render_prompt_turn
+from backend.utils.token_utils import estimate_tokens
+
+# 사용자 답변 원문을 백업하는 collected_info 키
+INITIAL_REQUEST_KEY = "initial_request"
+RESPONSE_KEY_PREFIX = "response_"
+
+# 직렬화 형식 버전
+FORMAT_VERSION = 1
+
+
+class Role(str, Enum):
+    """메시지 역할 (인스턴스가 하나뿐이므로 메시지마다 문자열을 보관하지 않음)"""
+    USER = "user"
+    ASSISTANT = "assistant"
+    SYSTEM = "system"
+
+
+_ROLES = {role.value: role for role in Role}
+
+
+class CompactMessage:
+    """
+    저장용 대화 메시지
+
+    사용자 답변은 여기에만 보관하고, collected_info의 백업 키(initial_request, response_N)는
+    backs_key로 이 메시지를 가리킵니다.
+    """
+
+    __slots__ = ("role", "content", "timestamp", "backs_key")
+
+    def __init__(
+        self,
+        role: Role,
+        content: str,
+        timestamp: Optional[str] = None,
+        backs_key: Optional[str] = None
+    ):
+        self.role = role
+        self.content = content
+        self.timestamp = timestamp
+        self.backs_key = backs_key
+
+    def to_message(self) -> Message:
+        """공개 Message 모델로 변환"""
+        return Message(role=self.role.value, content=self.content, timestamp=self.timestamp)
+
+
+class CompactSession:
+    """
+    저장용 세션 상태
+
+    RequirementState와 같은 정보를 다음과 같이 줄여서 보관합니다.
+    - 사용자 답변 원문은 메시지에만 두고 collected_info 백업 키는 복원 시 다시 채움
+    - 최근 max_messages개 메시지만 원문으로 유지 (그 이전 메시지는 프롬프트 컨텍스트의
+      요약에 이미 반영된 경우에만 버리고, 버린 메시지의 답변 백업은 collected_info로 옮김)
+    - PromptContext.recent_turns는 보관하지 않고 메시지에서 다시 렌더링
+
+    워크플로우는 턴마다 to_state()로 만든 RequirementState를 사용하고, 저장할 때 from_state()로 되돌립니다.
+    """
+
+    __slots__ = (
+        "user_input", "messages", "dropped_messages", "collected_info",
+        "questions", "is_complete", "judge_feedback", "final_srs", "srs_renditions",
+        "iteration_count", "rendered_count", "summarized_count", "summary_items", "asked_questions",
+        "transcript_tokens", "response_tokens", "version",
+    )
+
+    def __init__(self):
+        # 마지막 사용자 메시지와 같으면 None (중복 보관하지 않음)
+        self.user_input: Optional[str] = None
+        self.messages: List[CompactMessage] = []
+        self.dropped_messages = 0
+        self.collected_info: Dict[str, Any] = {}
+        self.questions: Tuple[str, ...] = ()
+        self.is_complete = False
+        self.judge_feedback: Optional[str] = None
+        self.final_srs: Optional[str] = None
+        self.srs_renditions: Optional[SRSRenditions] = None
+        self.iteration_count = 0
+        # 프롬프트 컨텍스트 (messages 기준 인덱스)
+        self.rendered_count = 0
+        self.summarized_count = 0
+        self.summary_items: List[str] = []
+        self.asked_questions: List[str] = []
+        self.transcript_tokens = 0
+        self.response_tokens = 0
+        self.version = 0
+
+    @classmethod
+    def from_state(cls, state: RequirementState, max_messages: Optional[int] = None) -> "CompactSession":
+        """
+        RequirementState를 저장용 표현으로 변환
+
+        Args:
+            state: 요구사항 상태
+            max_messages: 원문으로 유지할 최근 메시지 수 (None이면 제한 없음)
+
+        Returns:
+            CompactSession 인스턴스
+        """
+        compact = cls()
+        info = dict(state.collected_info)
+
+        # 사용자 답변 원문 백업 키를 메시지에 연결 (같은 순서로 대응, 이미 버린 메시지의 키는 건너뜀)
+        backup_keys = [INITIAL_REQUEST_KEY] if INITIAL_REQUEST_KEY in info else []
+        backup_keys += sorted(
+            (key for key in info if _response_number(key) is not None), key=_response_number
+        )
+        next_index = 0
+
+        for msg in state.messages:
+            backs_key = None
+            if msg.role == "user":
+                for index in range(next_index, len(backup_keys)):
+                    if info.get(backup_keys[index]) == msg.content:
+                        backs_key = backup_keys[index]
+                        del info[backs_key]
+                        next_index = index + 1
+                        break
+            compact.messages.append(CompactMessage(
+                _ROLES[msg.role], msg.content, msg.timestamp, sys.intern(backs_key) if backs_key else None
+            ))
+
+        compact.collected_info = {sys.intern(key): value for key, value in info.items()}
+
+        last_user = next((m for m in reversed(compact.messages) if m.role is Role.USER), None)
+        if last_user is None or last_user.content != state.user_input:
+            compact.user_input = state.user_input
+
+        compact.questions = tuple(state.questions)
+        compact.is_complete = state.is_complete
+        compact.judge_feedback = state.judge_feedback
+        compact.final_srs = state.final_srs
+        compact.srs_renditions = state.srs_renditions
+        compact.iteration_count = state.iteration_count
+        compact.version = state.version
+
+        context = state.prompt_context
+        compact.rendered_count = context.rendered_count
+        compact.summarized_count = max(context.rendered_count - len(context.recent_turns), 0)
+        compact.summary_items = list(context.summary_items)
+        compact.asked_questions = list(context.asked_questions)
+        compact.transcript_tokens = context.transcript_tokens
+        compact.response_tokens = context.response_tokens
+
+        if max_messages:
+            compact.trim(max_messages)
+        return compact
+
+    def trim(self, max_messages: int) -> int:
+        """
+        오래된 메시지 제거 (프롬프트 요약에 반영되지 않은 메시지는 유지)
+
+        버린 메시지가 가리키던 사용자 답변 백업(initial_request, response_N)은 Writer와 Judge가
+        사용하므로 collected_info로 옮겨 남깁니다.
+
+        Args:
+            max_messages: 유지할 최근 메시지 수
+
+        Returns:
+            제거한 메시지 수
+        """
+        drop = min(len(self.messages) - max_messages, self.summarized_count)
+        if drop <= 0:
+            return 0
+
+        for msg in self.messages[:drop]:
+            if msg.backs_key:
+                self.collected_info[msg.backs_key] = msg.content
+        if self.user_input is None and not any(m.role is Role.USER for m in self.messages[drop:]):
+            self.user_input = next(m.content for m in reversed(self.messages[:drop]) if m.role is Role.USER)
+        self.transcript_tokens -= sum(
+            estimate_tokens(f"{msg.role.value}: {msg.content}") + 1 for msg in self.messages[:drop]
+        )
+        del self.messages[:drop]
+
+        self.dropped_messages += drop
+        self.rendered_count -= drop
+        self.summarized_count -= drop
+        return drop
+
+    def to_state(self) -> RequirementState:
+        """
+        공개 RequirementState 모델로 복원
+
+        Returns:
+            요구사항 상태
+        """
+        messages = [msg.to_message() for msg in self.messages]
+
+        info = dict(self.collected_info)
+        for msg in self.messages:
+            if msg.backs_key:
+                info[msg.backs_key] = msg.content
+
+        user_input = self.user_input
+        if user_input is None:
+            user_input = next(m.content for m in reversed(self.messages) if m.role is Role.USER)
+
+        recent_turns = [
+            render_prompt_turn(msg.role.value, msg.content)
+            for msg in self.messages[self.summarized_count:self.rendered_count]
+        ]
+        recent_turn_tokens = [estimate_tokens(line) for line in recent_turns]
+        context = PromptContext(
+            rendered_count=self.rendered_count,
+            recent_turns=recent_turns,
+            recent_tokens=sum(recent_turn_tokens),
+            recent_turn_tokens=recent_turn_tokens,
+            summary_items=list(self.summary_items),
+            asked_questions=list(self.asked_questions),
+            transcript_tokens=max(self.transcript_tokens, 0),
+            response_tokens=self.response_tokens,
+        )
+
+        return RequirementState(
+            user_input=user_input,
+            messages=messages,
+            collected_info=info,
+            questions=list(self.questions),
+            is_complete=self.is_complete,
+            judge_feedback=self.judge_feedback,
+            final_srs=self.final_srs,
+            srs_renditions=self.srs_renditions,
+            iteration_count=self.iteration_count,
+            prompt_context=context,
+            version=self.version,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON 직렬화용 딕셔너리 (메시지는 [역할, 내용, 시각, 백업 키] 배열)
+
+        Returns:
+            직렬화 가능한 딕셔너리
+        """
+        return {
+            "v": FORMAT_VERSION,
+            "user_input": self.user_input,
+            "messages": [[m.role.value, m.content, m.timestamp, m.backs_key] for m in self.messages],
+            "dropped_messages": self.dropped_messages,
+            "collected_info": self.collected_info,
+            "questions": list(self.questions),
+            "is_complete": self.is_complete,
+            "judge_feedback": self.judge_feedback,
+            "final_srs": self.final_srs,
+            "srs_renditions": self.srs_renditions.model_dump() if self.srs_renditions else None,
+            "iteration_count": self.iteration_count,
+            "prompt": [
+                self.rendered_count, self.summarized_count, self.summary_items, self.asked_questions,
+                self.transcript_tokens, self.response_tokens,
+            ],
+            "version": self.version,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactSession":
+        """
+        to_dict() 결과에서 복원
+
+        Args:
+            data: 직렬화된 딕셔너리
+
+        Returns:
+            CompactSession 인스턴스
+        """
+        compact = cls()
+        compact.user_input = data["user_input"]
+        compact.messages = [
+            CompactMessage(_ROLES[role], content, timestamp, sys.intern(key) if key else None)
+            for role, content, timestamp, key in data["messages"]
+        ]
+        compact.dropped_messages = data["dropped_messages"]
+        compact.collected_info = {sys.intern(key): value for key, value in data["collected_info"].items()}
+        compact.questions = tuple(data["questions"])
+        compact.is_complete = data["is_complete"]
+        compact.judge_feedback = data["judge_feedback"]
+        compact.final_srs = data["final_srs"]
+        if data["srs_renditions"] is not None:
+            compact.srs_renditions = SRSRenditions.model_validate(data["srs_renditions"])
+        compact.iteration_count = data["iteration_count"]
+        prompt = data["prompt"]
+        (compact.rendered_count, compact.summarized_count,
+         compact.summary_items, compact.asked_questions) = prompt[:4]
+        if len(prompt) > 4:
+            compact.transcript_tokens, compact.response_tokens = prompt[4:6]
+        compact.version = data.get("version", 0)
+        return compact
+
+
+def _response_number(key: str) -> Optional[int]:
+    """response_N 키의 N (백업 키가 아니면 None)"""
+    if not key.startswith(RESPONSE_KEY_PREFIX):
+        return None
+    suffix = key[len(RESPONSE_KEY_PREFIX):]
+    return int(suffix) if suffix.isdigit() else None
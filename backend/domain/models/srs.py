@@ -1,5 +1,5 @@
 """SRS Document Models"""
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -95,3 +95,14 @@ class SRSDocument(BaseModel):
                 "assumptions": ["AWS 인프라 사용"]
             }
         }
+
+
+class SRSRenditions(BaseModel):
+    """
+    SRS 문서의 미리 계산된 표현 (완료 시점에 한 번 생성하여 세션에 저장)
+
+    JSON 표현은 state.final_srs 자체이며, content_hash로 final_srs와의 일치 여부를 확인합니다.
+    """
+    content_hash: str = Field(description="final_srs의 SHA-256 해시 (ETag로도 사용)")
+    markdown: str = Field(description="Markdown 표현")
+    data: Dict[str, Any] = Field(description="파싱된 SRS 딕셔너리")
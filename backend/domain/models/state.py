@@ -1,6 +1,7 @@
 """Requirement State Models"""
 from typing import List, Optional, Literal, Dict, Any
 from pydantic import BaseModel, Field
+from backend.domain.models.srs import SRSRenditions
 
 
 class Message(BaseModel):
@@ -19,6 +20,29 @@ class Message(BaseModel):
         }
 
 
+class PromptContext(BaseModel):
+    """증분 프롬프트 컨텍스트 (턴마다 새 메시지만 렌더링하여 누적)"""
+    # 이미 렌더링된 메시지 수 (state.messages 기준)
+    rendered_count: int = 0
+
+    # 최근 메시지 (render_prompt_turn 형태, Judge용)
+    recent_turns: List[str] = Field(default_factory=list)
+    recent_tokens: int = 0
+    # recent_turns 각 줄의 추정 토큰 수 (같은 순서)
+    recent_turn_tokens: List[int] = Field(default_factory=list)
+
+    # 오래된 메시지의 압축 요약 (토큰 예산 초과 시 recent_turns에서 이동)
+    summary_items: List[str] = Field(default_factory=list)
+
+    # 이미 물어본 질문 (Consultant용, 예시 힌트 제외)
+    asked_questions: List[str] = Field(default_factory=list)
+
+    # 압축하지 않은 Judge 프롬프트 크기 (절약 토큰 계산용, 요약해도 줄지 않음)
+    # transcript_tokens: 렌더링한 전체 메시지, response_tokens: response_N 백업이 된 사용자 답변
+    transcript_tokens: int = 0
+    response_tokens: int = 0
+
+
 class RequirementState(BaseModel):
     """LangGraph State 객체"""
     # 사용자 입력
@@ -40,9 +64,18 @@ class RequirementState(BaseModel):
     # 최종 SRS 문서
     final_srs: Optional[str] = None
 
+    # 최종 SRS의 미리 계산된 표현 (Markdown, 파싱된 딕셔너리)
+    srs_renditions: Optional[SRSRenditions] = None
+
     # 반복 횟수 (무한 루프 방지)
     iteration_count: int = 0
 
+    # 증분 프롬프트 컨텍스트
+    prompt_context: PromptContext = Field(default_factory=PromptContext)
+
+    # 저장 버전 (저장소가 저장할 때마다 1씩 올림, 0이면 아직 저장되지 않은 상태)
+    version: int = 0
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -1,10 +1,17 @@
 """Infrastructure Graph Module"""
 from backend.infrastructure.graph.workflow import DummyWorkflow
+from backend.infrastructure.graph.graph_workflow import GraphWorkflow, create_workflow
 from backend.infrastructure.graph.executor import DummyExecutor
 from backend.infrastructure.graph.session_repository import DummySessionRepository
+from backend.infrastructure.graph.sqlite_session_repository import SQLiteSessionRepository
+from backend.infrastructure.graph.repository_factory import create_session_repository
 
 __all__ = [
     "DummyWorkflow",
+    "GraphWorkflow",
+    "create_workflow",
     "DummyExecutor",
     "DummySessionRepository",
+    "SQLiteSessionRepository",
+    "create_session_repository",
 ]
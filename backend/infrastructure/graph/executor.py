@@ -1,14 +1,81 @@
 """Dummy Executor - 더미 구현"""
+import asyncio
+import hashlib
+import json
 import uuid
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from backend.domain.models.compact_state import CompactSession
 from backend.domain.models.state import RequirementState, Message
-from backend.infrastructure.graph.workflow import DummyWorkflow
-from backend.infrastructure.graph.session_repository import DummySessionRepository
+from backend.domain.agents.speculation import (
+    SpeculativeQuestion,
+    get_speculation_store,
+    speculate_next_question,
+    speculate_next_question_async,
+)
+from backend.infrastructure.graph.graph_workflow import create_workflow
+from backend.infrastructure.graph.idempotency_store import IdempotencyKeyReused
+from backend.infrastructure.graph.repository_factory import create_idempotency_store, create_session_repository
+from backend.infrastructure.graph.session_lock import SessionSaveFailed, SessionVersionConflict
+from backend.infrastructure.graph.session_sweeper import SessionSweeper
 from backend.utils.info_extractor import InfoExtractor
+from backend.utils.logger import setup_logger
+from backend.utils.tracing import (
+    STAGE_INFO_EXTRACTION,
+    STAGE_REPOSITORY_SAVE,
+    STAGE_WRITER,
+    trace_stage,
+    trace_turn,
+)
+from config.settings import settings
 
+logger = setup_logger(__name__)
 
 # 전역 공유 repository (싱글톤 패턴)
-_shared_repository = DummySessionRepository()
+_shared_repository = create_session_repository()
+
+# Idempotency-Key별 첫 실행 결과 (세션 저장소와 같은 종류)
+_idempotency_store = create_idempotency_store()
+
+# 세션 시작 요청의 Idempotency-Key 범위 (세션 계속은 세션 ID가 범위)
+START_SCOPE = "session-start"
+
+# 만료 세션 백그라운드 정리 (API 서버 수명주기에서 시작/중지)
+_session_sweeper = SessionSweeper(_shared_repository, interval=settings.session_sweep_interval)
+
+# 다음 질문 사전 생성 (동기 경로는 스레드 풀, 비동기 경로는 태스크 참조 보관)
+_speculation_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="speculation")
+_speculation_tasks: set = set()
+
+
+def get_shared_repository():
+    """
+    전역 공유 세션 저장소 가져오기
+
+    Returns:
+        settings.session_backend에 맞는 세션 저장소
+    """
+    return _shared_repository
+
+
+def get_idempotency_store():
+    """
+    전역 Idempotency-Key 기록 저장소 가져오기
+
+    Returns:
+        settings.session_backend에 맞는 기록 저장소
+    """
+    return _idempotency_store
+
+
+def get_session_sweeper() -> SessionSweeper:
+    """
+    전역 세션 sweeper 가져오기
+
+    Returns:
+        SessionSweeper 인스턴스
+    """
+    return _session_sweeper
 
 
 class DummyExecutor:
@@ -16,69 +83,448 @@ class DummyExecutor:
     워크플로우 실행기 더미 구현
 
     세션 관리와 워크플로우 실행을 담당합니다.
+    한 턴(load → 워크플로우 → save)은 세션 락 안에서 실행하므로 같은 세션의 동시 요청은
+    앞선 턴의 저장 결과를 읽고 이어서 처리됩니다 (SQLite 저장소면 워커 프로세스 간에도 적용).
+    저장은 읽은 버전과 비교하여(compare-and-swap) 락 lease 만료 등으로 그 사이 다른 요청이 저장했으면
+    최신 상태로 턴을 다시 실행하고, settings.session_save_retries번 재시도해도 충돌하면
+    SessionVersionConflict를 발생시킵니다.
     """
 
     def __init__(self):
         """Executor 초기화"""
-        self.workflow = DummyWorkflow()
+        self.workflow = create_workflow()
         self.repository = _shared_repository
+        self.idempotency = _idempotency_store
         self.info_extractor = InfoExtractor()
 
-    def create_session(self) -> str:
+    def create_session(self, idempotency_key: Optional[str] = None) -> str:
         """
         새로운 세션 생성
 
+        Args:
+            idempotency_key: 세션 시작 요청의 Idempotency-Key (같은 키로 이미 만든 세션이 있으면 그 ID)
+
         Returns:
             생성된 세션 ID (UUID)
         """
         session_id = str(uuid.uuid4())
+        if idempotency_key:
+            session_id = self.idempotency.setdefault(START_SCOPE, idempotency_key, session_id)
         return session_id
 
-    def execute(self, session_id: str, user_input: str) -> RequirementState:
+    def execute(self, session_id: str, user_input: str, idempotency_key: Optional[str] = None) -> RequirementState:
         """
         워크플로우 실행
 
         Args:
             session_id: 세션 ID
             user_input: 사용자 입력
+            idempotency_key: 요청의 Idempotency-Key (같은 키로 처리한 턴이 있으면 워크플로우 없이 그 결과 반환)
 
         Returns:
             업데이트된 요구사항 상태
+
+        Raises:
+            IdempotencyKeyReused: 같은 키를 다른 입력에 사용한 경우
+        """
+        for attempt in range(settings.session_save_retries + 1):
+            with self.repository.lock(session_id):
+                # 재시도 요청이면 (첫 요청이 끝날 때까지 락에서 기다린 뒤) 첫 결과 재생
+                replay = self._replay(session_id, user_input, idempotency_key)
+                if replay is not None:
+                    return replay
+
+                with trace_turn(session_id) as trace:
+                    state = self._prepare_state(session_id, user_input)
+                    loaded_version = state.version
+                    trace.iteration = state.iteration_count
+
+                    # 4. 워크플로우 실행
+                    state = self.workflow.run(
+                        state, self._take_speculation(session_id, state), thread_id=session_id
+                    )
+
+                    # 5. 상태 저장 (그 사이 다른 요청이 저장했으면 최신 상태로 다시 실행)
+                    saved = self._save(session_id, state, loaded_version, attempt)
+                # 어느 워커에서든 /timings로 조회할 수 있도록 세션과 함께 보관
+                self.repository.append_trace(session_id, trace)
+                if saved:
+                    self._remember(session_id, user_input, idempotency_key, state)
+                    break
+
+        # 6. 사용자가 답하는 동안 다음 질문 미리 생성 (턴 트레이스 밖에서 실행)
+        if self._should_speculate(state):
+            _speculation_pool.submit(self._speculate, session_id, state.model_copy(deep=True))
+
+        return state
+
+    async def execute_async(
+        self,
+        session_id: str,
+        user_input: str,
+        idempotency_key: Optional[str] = None
+    ) -> RequirementState:
+        """
+        워크플로우 비동기 실행
+
+        Args:
+            session_id: 세션 ID
+            user_input: 사용자 입력
+            idempotency_key: 요청의 Idempotency-Key (같은 키로 처리한 턴이 있으면 워크플로우 없이 그 결과 반환)
+
+        Returns:
+            업데이트된 요구사항 상태
+
+        Raises:
+            IdempotencyKeyReused: 같은 키를 다른 입력에 사용한 경우
+        """
+        for attempt in range(settings.session_save_retries + 1):
+            async with self.repository.lock_async(session_id):
+                # 저장소 I/O(세션, Idempotency-Key 기록)는 이벤트 루프 밖에서 실행
+                replay = await asyncio.to_thread(self._replay, session_id, user_input, idempotency_key)
+                if replay is not None:
+                    return replay
+
+                with trace_turn(session_id) as trace:
+                    state = await asyncio.to_thread(self._prepare_state, session_id, user_input)
+                    loaded_version = state.version
+                    trace.iteration = state.iteration_count
+
+                    # 4. 워크플로우 실행
+                    state = await self.workflow.run_async(
+                        state, self._take_speculation(session_id, state), thread_id=session_id
+                    )
+
+                    # 5. 상태 저장 (그 사이 다른 요청이 저장했으면 최신 상태로 다시 실행)
+                    saved = await asyncio.to_thread(self._save, session_id, state, loaded_version, attempt)
+                await asyncio.to_thread(self.repository.append_trace, session_id, trace)
+                if saved:
+                    await asyncio.to_thread(self._remember, session_id, user_input, idempotency_key, state)
+                    break
+
+        # 6. 사용자가 답하는 동안 다음 질문 미리 생성 (턴 트레이스 밖에서 실행)
+        self._schedule_speculation_async(session_id, state)
+
+        return state
+
+    async def execute_stream(
+        self,
+        session_id: str,
+        user_input: str
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        워크플로우 스트리밍 실행 (진행 이벤트를 생성되는 대로 전달)
+
+        Args:
+            session_id: 세션 ID
+            user_input: 사용자 입력
+
+        Yields:
+            (이벤트 이름, 이벤트 데이터) 튜플, 마지막은 ("state", {"state": 요구사항 상태})
+
+        Raises:
+            SessionVersionConflict: 이미 전달한 이벤트를 되돌릴 수 없으므로 재시도하지 않음
+        """
+        async with self.repository.lock_async(session_id):
+            with trace_turn(session_id) as trace:
+                state = await asyncio.to_thread(self._prepare_state, session_id, user_input)
+                loaded_version = state.version
+                trace.iteration = state.iteration_count
+
+                # 4. 워크플로우 실행
+                async for event in self.workflow.run_stream(state, self._take_speculation(session_id, state)):
+                    yield event
+
+                # 5. 상태 저장
+                await asyncio.to_thread(self._save, session_id, state, loaded_version)
+            await asyncio.to_thread(self.repository.append_trace, session_id, trace)
+
+        # 6. 사용자가 답하는 동안 다음 질문 미리 생성 (턴 트레이스 밖에서 실행)
+        self._schedule_speculation_async(session_id, state)
+
+        yield "state", {"state": state}
+
+    async def execute_non_interactive_async(
+        self,
+        session_id: str,
+        initial_input: str,
+        answers: List[str],
+        cancelled: Optional[asyncio.Event] = None
+    ) -> RequirementState:
+        """
+        미리 준비된 답변으로 대화 없이 SRS 생성 (일괄 처리용)
+
+        초기 입력과 답변을 차례로 정보 추출에 반영한 뒤 Judge로 한 번 평가하고,
+        승인 여부와 관계없이 Writer로 SRS를 생성합니다. 추가 질문을 받을 사용자가
+        없으므로 Consultant는 실행하지 않으며, Judge 판정은 is_complete에 남깁니다.
+
+        Args:
+            session_id: 세션 ID
+            initial_input: 프로젝트 초기 입력
+            answers: 미리 준비된 답변 목록
+            cancelled: 설정되면 남은 단계(Writer)와 저장을 건너뜀 (시간 초과된 일괄 항목용)
+
+        Returns:
+            SRS가 생성된 요구사항 상태 (취소되면 저장하지 않은 중간 상태)
+        """
+        with trace_turn(session_id) as trace:
+            state = self._new_state(initial_input)
+            for answer in answers:
+                state.iteration_count += 1
+                self._apply_user_response(state, answer)
+            trace.iteration = state.iteration_count
+
+            state = await self.workflow.judge_agent_async(state)
+            if cancelled is not None and cancelled.is_set():
+                return state
+            with trace_stage(STAGE_WRITER):
+                state = await self.workflow.writer_agent_async(state)
+            state.iteration_count += 1
+
+            if cancelled is not None and cancelled.is_set():
+                return state
+            await asyncio.to_thread(self._save, session_id, state, expected_version=0)
+        await asyncio.to_thread(self.repository.append_trace, session_id, trace)
+
+        return state
+
+    def _prepare_state(self, session_id: str, user_input: str) -> RequirementState:
+        """
+        상태 로드 및 사용자 입력 반영 (정보 추출, 메시지 추가)
+
+        Args:
+            session_id: 세션 ID
+            user_input: 사용자 입력
+
+        Returns:
+            워크플로우 실행 직전의 요구사항 상태
         """
         # 1. 기존 상태 로드 또는 새로운 상태 생성
         state = self.repository.load(session_id)
         if state is None:
-            state = RequirementState(user_input=user_input)
-            # 첫 번째 입력은 "initial_request"로 저장
-            state.collected_info["initial_request"] = user_input
+            return self._new_state(user_input)
 
-            # InfoExtractor로 초기 입력에서 정보 추출
-            extracted_info = self.info_extractor.extract(user_input, state.collected_info)
-            state.collected_info.update(extracted_info)
-        else:
-            # 기존 세션이면 user_input 업데이트
-            state.user_input = user_input
+        self._apply_user_response(state, user_input)
+        return state
+
+    def _new_state(self, initial_input: str) -> RequirementState:
+        """
+        초기 입력으로 새 상태 생성 (정보 추출, 메시지 추가)
+
+        Args:
+            initial_input: 프로젝트 초기 입력
+
+        Returns:
+            새 요구사항 상태
+        """
+        state = RequirementState(user_input=initial_input)
+        # 첫 번째 입력은 "initial_request"로 저장
+        state.collected_info["initial_request"] = initial_input
+
+        # InfoExtractor로 초기 입력에서 정보 추출
+        with trace_stage(STAGE_INFO_EXTRACTION):
+            extracted_info = self.info_extractor.extract(initial_input, state.collected_info)
+        state.collected_info.update(extracted_info)
+
+        state.messages.append(
+            Message(role="user", content=initial_input)
+        )
+        return state
 
-            # 2. InfoExtractor로 정보 추출 후 저장
+    def _apply_user_response(self, state: RequirementState, user_input: str) -> None:
+        """
+        기존 세션에 사용자 답변 반영 (정보 추출, 백업 저장, 메시지 추가)
+
+        Args:
+            state: 요구사항 상태 (직접 갱신됨)
+            user_input: 사용자 답변
+        """
+        # 기존 세션이면 user_input 업데이트
+        state.user_input = user_input
+
+        # 2. InfoExtractor로 정보 추출 후 저장
+        with trace_stage(STAGE_INFO_EXTRACTION):
             extracted_info = self.info_extractor.extract(user_input, state.collected_info)
-            state.collected_info.update(extracted_info)
+        state.collected_info.update(extracted_info)
 
-            # 3. 추가로 모든 사용자 응답을 collected_info에 저장 (백업용)
-            # iteration 횟수를 기반으로 키 생성
-            response_key = f"response_{state.iteration_count}"
-            state.collected_info[response_key] = user_input
+        # 3. 추가로 모든 사용자 응답을 collected_info에 저장 (백업용)
+        # iteration 횟수를 기반으로 키 생성
+        response_key = f"response_{state.iteration_count}"
+        state.collected_info[response_key] = user_input
 
-        # 3. 사용자 메시지 추가
+        # 사용자 메시지 추가
         state.messages.append(
             Message(role="user", content=user_input)
         )
 
-        # 4. 워크플로우 실행
-        state = self.workflow.run(state)
+    def _take_speculation(self, session_id: str, state: RequirementState) -> Optional[SpeculativeQuestion]:
+        """
+        이번 턴에 사용할 수 있는 미리 만든 질문 꺼내기
+
+        Args:
+            session_id: 세션 ID
+            state: 사용자 답변이 반영된 요구사항 상태
+
+        Returns:
+            새로 추출한 정보로 검증한 미리 만든 질문 (없으면 None)
+        """
+        if not settings.speculative_question_enabled:
+            return None
+        return get_speculation_store().take(session_id, state)
+
+    def _should_speculate(self, state: RequirementState) -> bool:
+        """다음 질문을 미리 만들 필요가 있는지 (완료되었거나 마지막 턴이면 불필요)"""
+        return (
+            settings.speculative_question_enabled
+            and not state.is_complete
+            and state.iteration_count < 10
+        )
+
+    def _schedule_speculation_async(self, session_id: str, state: RequirementState) -> None:
+        """다음 질문 사전 생성 태스크 예약 (응답을 기다리지 않음)"""
+        if not self._should_speculate(state):
+            return
+        task = asyncio.ensure_future(self._speculate_async(session_id, state.model_copy(deep=True)))
+        _speculation_tasks.add(task)
+        task.add_done_callback(_speculation_tasks.discard)
+
+    def _speculate(self, session_id: str, state: RequirementState) -> None:
+        """다음 질문 사전 생성 (실패해도 다음 턴은 일반 경로로 처리)"""
+        try:
+            speculation = speculate_next_question(state)
+            if speculation is not None:
+                get_speculation_store().put(session_id, speculation)
+        except Exception as e:
+            logger.warning(f"Speculative question failed: {e}")
+
+    async def _speculate_async(self, session_id: str, state: RequirementState) -> None:
+        """_speculate의 비동기 버전"""
+        try:
+            speculation = await speculate_next_question_async(state)
+            if speculation is not None:
+                get_speculation_store().put(session_id, speculation)
+        except Exception as e:
+            logger.warning(f"Speculative question failed: {e}")
+
+    def _replay(
+        self,
+        session_id: str,
+        user_input: str,
+        idempotency_key: Optional[str]
+    ) -> Optional[RequirementState]:
+        """
+        같은 Idempotency-Key로 이미 처리한 턴의 결과 조회
+
+        Args:
+            session_id: 세션 ID
+            user_input: 사용자 입력
+            idempotency_key: Idempotency-Key (None이면 조회하지 않음)
+
+        Returns:
+            첫 요청이 반환한 요구사항 상태 (없으면 None)
+
+        Raises:
+            IdempotencyKeyReused: 같은 키를 다른 입력에 사용한 경우
+        """
+        if not idempotency_key:
+            return None
+        record = self.idempotency.get(session_id, idempotency_key)
+        if record is None:
+            return None
+
+        data = json.loads(record)
+        if data["input"] != _input_digest(user_input):
+            raise IdempotencyKeyReused(f"Idempotency-Key was already used with a different request: {idempotency_key}")
+        return CompactSession.from_dict(data["state"]).to_state()
 
-        # 5. 상태 저장
-        self.repository.save(session_id, state)
+    def _remember(
+        self,
+        session_id: str,
+        user_input: str,
+        idempotency_key: Optional[str],
+        state: RequirementState
+    ) -> None:
+        """턴 결과를 Idempotency-Key로 기록 (재시도 요청이 재생할 수 있도록)"""
+        if not idempotency_key:
+            return
+        record = {"input": _input_digest(user_input), "state": CompactSession.from_state(state).to_dict()}
+        self.idempotency.put(session_id, idempotency_key, json.dumps(record, ensure_ascii=False))
+
+    def _save(
+        self,
+        session_id: str,
+        state: RequirementState,
+        expected_version: Optional[int] = None,
+        attempt: Optional[int] = None
+    ) -> bool:
+        """
+        상태 저장 (저장 시간 계측)
+
+        Args:
+            session_id: 세션 ID
+            state: 요구사항 상태
+            expected_version: 상태를 읽을 때의 버전 (None이면 확인하지 않음)
+            attempt: 턴 재시도 횟수 (None이면 재시도하지 않음)
+
+        Returns:
+            저장 여부 (버전 충돌이고 재시도할 수 있으면 False)
+
+        Raises:
+            SessionVersionConflict: 버전 충돌이고 더 재시도할 수 없는 경우
+            SessionSaveFailed: 저장소가 상태를 저장하지 못한 경우 (턴 결과를 기록하지 않음)
+        """
+        with trace_stage(STAGE_REPOSITORY_SAVE):
+            try:
+                saved = self.repository.save(session_id, state, expected_version=expected_version)
+            except SessionVersionConflict as e:
+                if attempt is None or attempt >= settings.session_save_retries:
+                    raise
+                logger.warning(f"{e}; retrying turn ({attempt + 1}/{settings.session_save_retries})")
+                return False
+        if not saved:
+            raise SessionSaveFailed(session_id)
+        return True
 
+    def update_state(
+        self,
+        session_id: str,
+        update: Callable[[RequirementState], bool]
+    ) -> Optional[RequirementState]:
+        """
+        세션 락 안에서 최신 상태를 다시 읽어 갱신 후 저장 (턴 밖에서 상태를 고칠 때 사용)
+
+        Args:
+            session_id: 세션 ID
+            update: 상태를 직접 갱신하고 저장이 필요하면 True를 반환하는 함수
+
+        Returns:
+            갱신된 요구사항 상태 또는 None (세션이 없는 경우)
+        """
+        with self.repository.lock(session_id):
+            state = self.repository.load(session_id)
+            if state is not None and update(state):
+                self._save(session_id, state, state.version)
+        return state
+
+    async def update_state_async(
+        self,
+        session_id: str,
+        update: Callable[[RequirementState], bool]
+    ) -> Optional[RequirementState]:
+        """
+        update_state의 비동기 버전 (락 대기와 저장소 I/O 동안 이벤트 루프를 점유하지 않음)
+
+        Args:
+            session_id: 세션 ID
+            update: 상태를 직접 갱신하고 저장이 필요하면 True를 반환하는 함수
+
+        Returns:
+            갱신된 요구사항 상태 또는 None (세션이 없는 경우)
+        """
+        async with self.repository.lock_async(session_id):
+            state = await asyncio.to_thread(self.repository.load, session_id)
+            if state is not None and update(state):
+                await asyncio.to_thread(self._save, session_id, state, state.version)
         return state
 
     def get_state(self, session_id: str) -> Optional[RequirementState]:
@@ -92,3 +538,8 @@ class DummyExecutor:
             요구사항 상태 또는 None
         """
         return self.repository.load(session_id)
+
+
+def _input_digest(user_input: str) -> str:
+    """같은 키를 다른 입력에 다시 쓴 요청을 가려내기 위한 입력 해시"""
+    return hashlib.sha256(user_input.encode("utf-8")).hexdigest()
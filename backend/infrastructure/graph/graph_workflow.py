@@ -0,0 +1,412 @@
+"""Graph Workflow - 노드 그래프 워크플로우 (LangGraph StateGraph, 노드별 체크포인트)"""
+import asyncio
+import contextvars
+import hashlib
+import threading
+from typing import Any, Callable, Dict, List, Optional, TypedDict, Union
+
+from backend.domain.models.compact_state import CompactSession
+from backend.domain.models.state import RequirementState
+from backend.domain.agents.speculation import SpeculativeQuestion
+from backend.infrastructure.graph.workflow import DummyWorkflow, _parallel_pool
+from backend.infrastructure.persistence.checkpointer import DummyCheckpointer, SQLiteCheckpointer
+from backend.utils.logger import setup_logger
+from backend.utils.tracing import STAGE_WRITER, trace_stage
+from config.settings import settings
+
+try:
+    from langchain_core.runnables import RunnableLambda
+    from langgraph.graph import END, START, StateGraph
+    LANGGRAPH_AVAILABLE = True
+except ImportError:
+    LANGGRAPH_AVAILABLE = False
+
+logger = setup_logger(__name__)
+
+# 노드 이름
+NODE_CONSULTANT = "consultant"
+NODE_JUDGE = "judge"
+NODE_MERGE = "merge"
+NODE_WRITER = "writer"
+NODE_FINISH = "finish"
+
+# 마지막 노드 이후 (실행할 노드 없음)
+_DONE = "__done__"
+
+
+class GraphState(TypedDict, total=False):
+    """그래프 채널 (병렬 모드의 Consultant/Judge 결과는 merge 노드에서 state로 합침)"""
+    state: RequirementState
+    consultant: RequirementState
+    judge: RequirementState
+    speculation: Optional[SpeculativeQuestion]
+    entry: Union[str, List[str]]
+    thread_id: Optional[str]
+    base: str
+
+
+class GraphWorkflow(DummyWorkflow):
+    """
+    노드 그래프 워크플로우
+
+    Consultant → Judge → (conditional) Writer → finish를 노드로 실행합니다.
+    langgraph가 설치되어 있으면 같은 노드로 StateGraph를 컴파일하여 실행하고
+    (parallel=True이면 Consultant/Judge 노드를 같은 단계에서 동시에 실행한 뒤 merge 노드에서 병합),
+    없으면 같은 노드를 순서대로 실행합니다.
+
+    thread_id(세션 ID)를 주면 state를 갱신하는 노드가 끝날 때마다 체크포인트를 저장하고,
+    턴을 마치면 지웁니다. 프로세스가 턴 도중 죽으면 같은 입력으로 다시 실행할 때
+    마지막으로 끝난 노드 다음부터 이어서 실행합니다 (이미 호출한 LLM을 다시 호출하지 않음).
+    커밋된 세션 상태는 여전히 세션 저장소가 관리하며, 체크포인트는 진행 중인 턴만 담습니다.
+
+    run_stream()은 DummyWorkflow의 스트리밍 경로를 그대로 사용합니다 (체크포인트 없음).
+    """
+
+    def __init__(
+        self,
+        parallel: bool = False,
+        checkpointer: Optional[Union[DummyCheckpointer, SQLiteCheckpointer]] = None
+    ):
+        """
+        워크플로우 초기화
+
+        Args:
+            parallel: Consultant/Judge 동시 실행 여부
+            checkpointer: 노드별 체크포인트 저장소 (None이면 인메모리 DummyCheckpointer)
+        """
+        super().__init__(parallel=parallel)
+        self.checkpointer = checkpointer if checkpointer is not None else DummyCheckpointer()
+        self.resumed_turns = 0
+        self._graph = self._compile() if LANGGRAPH_AVAILABLE else None
+
+    def run(
+        self,
+        state: RequirementState,
+        speculation: Optional[SpeculativeQuestion] = None,
+        thread_id: Optional[str] = None
+    ) -> RequirementState:
+        """
+        워크플로우 실행
+
+        Args:
+            state: 현재 요구사항 상태
+            speculation: 검증된 미리 만든 질문 (있으면 Consultant LLM 호출 생략)
+            thread_id: 체크포인트 키 (세션 ID, None이면 체크포인트 없이 실행)
+
+        Returns:
+            업데이트된 요구사항 상태
+        """
+        values = self._initial_values(state, speculation, thread_id)
+        if values["entry"] != _DONE:
+            if self._graph is not None:
+                values = self._graph.invoke(values)
+            else:
+                values = self._run_nodes(values)
+        self._clear_checkpoint(thread_id)
+        return values["state"]
+
+    async def run_async(
+        self,
+        state: RequirementState,
+        speculation: Optional[SpeculativeQuestion] = None,
+        thread_id: Optional[str] = None
+    ) -> RequirementState:
+        """
+        워크플로우 비동기 실행 (체크포인트 읽기/쓰기는 이벤트 루프 밖에서 실행)
+
+        Args:
+            state: 현재 요구사항 상태
+            speculation: 검증된 미리 만든 질문 (있으면 Consultant LLM 호출 생략)
+            thread_id: 체크포인트 키 (세션 ID, None이면 체크포인트 없이 실행)
+
+        Returns:
+            업데이트된 요구사항 상태
+        """
+        values = await asyncio.to_thread(self._initial_values, state, speculation, thread_id)
+        if values["entry"] != _DONE:
+            if self._graph is not None:
+                values = await self._graph.ainvoke(values)
+            else:
+                values = await self._run_nodes_async(values)
+        await asyncio.to_thread(self._clear_checkpoint, thread_id)
+        return values["state"]
+
+    # ------------------------------------------------------------------
+    # 체크포인트
+    # ------------------------------------------------------------------
+
+    def _initial_values(
+        self,
+        state: RequirementState,
+        speculation: Optional[SpeculativeQuestion],
+        thread_id: Optional[str]
+    ) -> GraphState:
+        """그래프 입력 (같은 입력의 중단된 턴 체크포인트가 있으면 그 다음 노드부터)"""
+        base = _turn_fingerprint(state)
+        values: GraphState = {
+            "state": state,
+            "speculation": speculation,
+            "entry": self._first_nodes(),
+            "thread_id": thread_id,
+            "base": base,
+        }
+        if not thread_id:
+            return values
+
+        checkpoint = self.checkpointer.load(thread_id)
+        if checkpoint is None:
+            return values
+        if checkpoint.get("base") != base:
+            # 이전 입력의 체크포인트 (이미 저장된 턴이거나 다른 답변으로 재시도)
+            self.checkpointer.delete(thread_id)
+            return values
+
+        resumed = CompactSession.from_dict(checkpoint["state"]).to_state()
+        values["state"] = resumed
+        values["entry"] = self._next_nodes(checkpoint["node"], resumed)
+        self.resumed_turns += 1
+        logger.info(f"Resuming turn for {thread_id} after node '{checkpoint['node']}'")
+        return values
+
+    def _save_checkpoint(self, values: GraphState, node: str, state: RequirementState) -> None:
+        """state를 갱신한 노드가 끝난 시점의 체크포인트 저장"""
+        thread_id = values.get("thread_id")
+        if not thread_id:
+            return
+        self.checkpointer.save(thread_id, {
+            "base": values["base"],
+            "node": node,
+            "state": CompactSession.from_state(state).to_dict(),
+        })
+
+    async def _save_checkpoint_async(self, values: GraphState, node: str, state: RequirementState) -> None:
+        """_save_checkpoint의 비동기 버전 (직렬화와 SQLite 쓰기를 워커 스레드에서 실행)"""
+        if values.get("thread_id"):
+            await asyncio.to_thread(self._save_checkpoint, values, node, state)
+
+    def _clear_checkpoint(self, thread_id: Optional[str]) -> None:
+        """턴을 마친 체크포인트 삭제"""
+        if thread_id:
+            self.checkpointer.delete(thread_id)
+
+    # ------------------------------------------------------------------
+    # 라우팅
+    # ------------------------------------------------------------------
+
+    def _first_nodes(self) -> Union[str, List[str]]:
+        """새 턴의 시작 노드 (병렬 모드면 Consultant와 Judge)"""
+        return [NODE_CONSULTANT, NODE_JUDGE] if self.parallel else NODE_CONSULTANT
+
+    def _next_nodes(self, node: str, state: RequirementState) -> Union[str, List[str]]:
+        """끝난 노드 다음에 실행할 노드"""
+        if node == NODE_CONSULTANT:
+            return NODE_JUDGE
+        if node in (NODE_JUDGE, NODE_MERGE):
+            return self._route_after_judge({"state": state})
+        if node == NODE_WRITER:
+            return NODE_FINISH
+        return _DONE
+
+    def _entry(self, values: GraphState) -> Union[str, List[str]]:
+        """START 조건부 엣지 (새 턴이면 시작 노드, 재개면 체크포인트 다음 노드)"""
+        return values["entry"]
+
+    def _route_after_judge(self, values: GraphState) -> str:
+        """Judge가 승인하면 Writer, 아니면 finish"""
+        return NODE_WRITER if values["state"].is_complete else NODE_FINISH
+
+    # ------------------------------------------------------------------
+    # 노드
+    # ------------------------------------------------------------------
+
+    def _consultant_node(self, values: GraphState) -> Dict[str, Any]:
+        if self.parallel:
+            return {"consultant": self._consult(values["state"].model_copy(deep=True), values.get("speculation"))}
+        state = self._consult(values["state"], values.get("speculation"))
+        self._save_checkpoint(values, NODE_CONSULTANT, state)
+        return {"state": state}
+
+    async def _consultant_node_async(self, values: GraphState) -> Dict[str, Any]:
+        if self.parallel:
+            consulted = await self._consult_async(values["state"].model_copy(deep=True), values.get("speculation"))
+            return {"consultant": consulted}
+        state = await self._consult_async(values["state"], values.get("speculation"))
+        await self._save_checkpoint_async(values, NODE_CONSULTANT, state)
+        return {"state": state}
+
+    def _judge_node(self, values: GraphState) -> Dict[str, Any]:
+        if self.parallel:
+            return {"judge": self.judge_agent(values["state"].model_copy(deep=True))}
+        state = self.judge_agent(values["state"])
+        self._save_checkpoint(values, NODE_JUDGE, state)
+        return {"state": state}
+
+    async def _judge_node_async(self, values: GraphState) -> Dict[str, Any]:
+        if self.parallel:
+            return {"judge": await self.judge_agent_async(values["state"].model_copy(deep=True))}
+        state = await self.judge_agent_async(values["state"])
+        await self._save_checkpoint_async(values, NODE_JUDGE, state)
+        return {"state": state}
+
+    def _merge_node(self, values: GraphState) -> Dict[str, Any]:
+        state = self._merge_parallel_results(values["state"], values["consultant"], values["judge"])
+        self._save_checkpoint(values, NODE_MERGE, state)
+        return {"state": state}
+
+    async def _merge_node_async(self, values: GraphState) -> Dict[str, Any]:
+        state = self._merge_parallel_results(values["state"], values["consultant"], values["judge"])
+        await self._save_checkpoint_async(values, NODE_MERGE, state)
+        return {"state": state}
+
+    def _writer_node(self, values: GraphState) -> Dict[str, Any]:
+        with trace_stage(STAGE_WRITER):
+            state = self.writer_agent(values["state"])
+        self._save_checkpoint(values, NODE_WRITER, state)
+        return {"state": state}
+
+    async def _writer_node_async(self, values: GraphState) -> Dict[str, Any]:
+        with trace_stage(STAGE_WRITER):
+            state = await self.writer_agent_async(values["state"])
+        await self._save_checkpoint_async(values, NODE_WRITER, state)
+        return {"state": state}
+
+    def _finish_node(self, values: GraphState) -> Dict[str, Any]:
+        state = values["state"]
+        state.iteration_count += 1
+        self._save_checkpoint(values, NODE_FINISH, state)
+        return {"state": state}
+
+    async def _finish_node_async(self, values: GraphState) -> Dict[str, Any]:
+        state = values["state"]
+        state.iteration_count += 1
+        await self._save_checkpoint_async(values, NODE_FINISH, state)
+        return {"state": state}
+
+    def _node_table(self) -> Dict[str, tuple]:
+        """노드 이름 → (동기 함수, 비동기 함수)"""
+        return {
+            NODE_CONSULTANT: (self._consultant_node, self._consultant_node_async),
+            NODE_JUDGE: (self._judge_node, self._judge_node_async),
+            NODE_MERGE: (self._merge_node, self._merge_node_async),
+            NODE_WRITER: (self._writer_node, self._writer_node_async),
+            NODE_FINISH: (self._finish_node, self._finish_node_async),
+        }
+
+    # ------------------------------------------------------------------
+    # 실행기
+    # ------------------------------------------------------------------
+
+    def _compile(self):
+        """LangGraph StateGraph 컴파일 (invoke/ainvoke 모두 같은 그래프 사용)"""
+        graph = StateGraph(GraphState)
+        for name, (func, afunc) in self._node_table().items():
+            if name == NODE_MERGE and not self.parallel:
+                continue
+            graph.add_node(name, RunnableLambda(func, afunc=afunc, name=name))
+
+        graph.add_conditional_edges(START, self._entry, [NODE_CONSULTANT, NODE_JUDGE, NODE_WRITER, NODE_FINISH])
+        if self.parallel:
+            graph.add_edge([NODE_CONSULTANT, NODE_JUDGE], NODE_MERGE)
+            graph.add_conditional_edges(NODE_MERGE, self._route_after_judge, [NODE_WRITER, NODE_FINISH])
+        else:
+            graph.add_edge(NODE_CONSULTANT, NODE_JUDGE)
+            graph.add_conditional_edges(NODE_JUDGE, self._route_after_judge, [NODE_WRITER, NODE_FINISH])
+        graph.add_edge(NODE_WRITER, NODE_FINISH)
+        graph.add_edge(NODE_FINISH, END)
+        return graph.compile()
+
+    def _run_nodes(self, values: GraphState) -> GraphState:
+        """langgraph 없이 같은 노드를 순서대로 실행"""
+        table = self._node_table()
+        step = values["entry"]
+        while step != _DONE:
+            if isinstance(step, list):
+                # 병렬 단계: 첫 노드를 제외한 노드는 워커 스레드에서 실행 (트레이스 컨텍스트 전달)
+                futures = [
+                    _parallel_pool.submit(contextvars.copy_context().run, table[name][0], values)
+                    for name in step[1:]
+                ]
+                updates = [table[step[0]][0](values)] + [future.result() for future in futures]
+                for update in updates:
+                    values.update(update)
+                step = NODE_MERGE
+                continue
+            values.update(table[step][0](values))
+            step = self._next_nodes(step, values["state"])
+        return values
+
+    async def _run_nodes_async(self, values: GraphState) -> GraphState:
+        """_run_nodes의 비동기 버전 (병렬 단계는 동시 실행)"""
+        table = self._node_table()
+        step = values["entry"]
+        while step != _DONE:
+            if isinstance(step, list):
+                for update in await asyncio.gather(*(table[name][1](values) for name in step)):
+                    values.update(update)
+                step = NODE_MERGE
+                continue
+            values.update(await table[step][1](values))
+            step = self._next_nodes(step, values["state"])
+        return values
+
+
+def _turn_fingerprint(state: RequirementState) -> str:
+    """
+    턴 입력 식별자 (체크포인트가 같은 턴의 것인지 확인)
+
+    세션 저장 버전, 반복 횟수, 사용자 입력이 같으면 같은 턴의 재실행입니다.
+    """
+    digest = hashlib.sha256(state.user_input.encode("utf-8")).hexdigest()[:16]
+    return f"{state.version}:{state.iteration_count}:{digest}"
+
+
+def create_workflow(engine: Optional[str] = None) -> Union[DummyWorkflow, GraphWorkflow]:
+    """
+    설정에 맞는 워크플로우 생성
+
+    Args:
+        engine: 워크플로우 종류 ("dummy" 또는 "graph", None이면 settings.workflow_engine)
+
+    GraphWorkflow는 그래프 컴파일 비용이 있고 노드가 요청별 상태를 갖지 않으므로,
+    요청마다 새 executor를 만들어도 프로세스 전역 인스턴스를 공유합니다.
+
+    Returns:
+        DummyWorkflow 또는 GraphWorkflow 인스턴스
+
+    Raises:
+        ValueError: 알 수 없는 워크플로우 종류인 경우
+    """
+    engine = (engine or settings.workflow_engine).lower()
+
+    if engine == "dummy":
+        return DummyWorkflow(parallel=settings.workflow_parallel)
+    if engine == "graph":
+        return _get_graph_workflow(settings.workflow_parallel)
+
+    raise ValueError(f"Unknown workflow engine: {engine} (expected 'dummy' or 'graph')")
+
+
+# 전역 공유 체크포인터와 컴파일된 그래프 워크플로우 (첫 사용 시 생성)
+_checkpointer: Optional[SQLiteCheckpointer] = None
+_graph_workflows: Dict[bool, GraphWorkflow] = {}
+_graph_workflows_lock = threading.Lock()
+
+
+def _get_graph_workflow(parallel: bool) -> GraphWorkflow:
+    """병렬 여부별 전역 GraphWorkflow 가져오기 (그래프는 한 번만 컴파일)"""
+    with _graph_workflows_lock:
+        workflow = _graph_workflows.get(parallel)
+        if workflow is None:
+            workflow = GraphWorkflow(parallel=parallel, checkpointer=_get_checkpointer())
+            _graph_workflows[parallel] = workflow
+        return workflow
+
+
+def _get_checkpointer() -> SQLiteCheckpointer:
+    """전역 SQLite 체크포인터 가져오기"""
+    global _checkpointer
+    if _checkpointer is None:
+        if not LANGGRAPH_AVAILABLE:
+            logger.warning("langgraph is not installed; running graph nodes without LangGraph")
+        _checkpointer = SQLiteCheckpointer(db_path=settings.workflow_checkpoint_path)
+    return _checkpointer
@@ -0,0 +1,202 @@
+"""Idempotency Store - Idempotency-Key별 첫 실행 결과 보관"""
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+
+class IdempotencyKeyReused(ValueError):
+    """같은 Idempotency-Key를 다른 요청 본문에 다시 사용한 경우"""
+
+
+class IdempotencyStore:
+    """
+    Idempotency-Key 기록 저장소 (In-Memory)
+
+    (scope, key)마다 첫 요청의 결과를 ttl_seconds 동안 보관합니다.
+    scope는 세션 계속이면 세션 ID, 세션 시작이면 고정 문자열입니다.
+    여러 워커로 실행할 때는 같은 DB 파일을 쓰는 SQLiteIdempotencyStore를 사용해야 합니다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        저장소 초기화
+
+        Args:
+            ttl_seconds: 기록 보관 시간 (초)
+            max_entries: 최대 기록 수 (초과 시 오래된 기록부터 제거)
+            clock: 시간 함수 (테스트용)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        # (scope, key) → (값, 만료 시각), 앞쪽이 먼저 기록된 항목
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 메트릭
+        self.replays = 0
+
+    def get(self, scope: str, key: str) -> Optional[str]:
+        """
+        기록 조회
+
+        Args:
+            scope: 범위 (세션 ID 등)
+            key: Idempotency-Key
+
+        Returns:
+            기록된 값 (없거나 만료되면 None)
+        """
+        with self._lock:
+            entry = self._entries.get((scope, key))
+            if entry is None:
+                return None
+            if entry[1] < self._clock():
+                del self._entries[(scope, key)]
+                return None
+            self.replays += 1
+            return entry[0]
+
+    def put(self, scope: str, key: str, value: str) -> None:
+        """
+        기록 저장 (같은 키는 덮어씀)
+
+        Args:
+            scope: 범위 (세션 ID 등)
+            key: Idempotency-Key
+            value: 기록할 값
+        """
+        with self._lock:
+            self._entries.pop((scope, key), None)
+            self._entries[(scope, key)] = (value, self._clock() + self.ttl_seconds)
+            self._evict()
+
+    def setdefault(self, scope: str, key: str, value: str) -> str:
+        """
+        기록이 없을 때만 저장 (동시에 들어온 같은 키의 요청이 같은 값을 받도록)
+
+        Args:
+            scope: 범위
+            key: Idempotency-Key
+            value: 기록할 값
+
+        Returns:
+            저장된 값 (이미 있으면 기존 값)
+        """
+        with self._lock:
+            entry = self._entries.get((scope, key))
+            if entry is not None and entry[1] >= self._clock():
+                return entry[0]
+            self._entries.pop((scope, key), None)
+            self._entries[(scope, key)] = (value, self._clock() + self.ttl_seconds)
+            self._evict()
+            return value
+
+    def stats(self) -> Dict[str, int]:
+        """보관 중인 기록 수와 재생 횟수"""
+        with self._lock:
+            return {"entries": len(self._entries), "replays": self.replays}
+
+    def close(self) -> None:
+        """저장소 종료 (인메모리 구현은 정리할 리소스 없음)"""
+        pass
+
+    def _evict(self) -> None:
+        """만료되었거나 최대 기록 수를 넘은 오래된 기록 제거 (저장 순서 = 만료 순서)"""
+        now = self._clock()
+        while self._entries:
+            oldest = next(iter(self._entries))
+            if self._entries[oldest][1] >= now and len(self._entries) <= self.max_entries:
+                break
+            del self._entries[oldest]
+
+
+class SQLiteIdempotencyStore:
+    """
+    SQLite 기반 Idempotency-Key 기록 저장소
+
+    IdempotencyStore와 같은 인터페이스를 제공하며, 세션 DB 파일에 idempotency_keys 테이블을 두어
+    다른 워커가 처리한 요청의 재시도도 재생합니다.
+    """
+
+    def __init__(self, db_path: str = "data/sessions.db", ttl_seconds: float = 3600):
+        """
+        저장소 초기화
+
+        Args:
+            db_path: SQLite DB 파일 경로 (":memory:" 가능)
+            ttl_seconds: 기록 보관 시간 (초)
+        """
+        self.ttl_seconds = ttl_seconds
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS idempotency_keys ("
+            "scope TEXT NOT NULL, "
+            "key TEXT NOT NULL, "
+            "value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, "
+            "PRIMARY KEY (scope, key))"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_idempotency_expires ON idempotency_keys (expires_at)"
+        )
+        self._lock = threading.Lock()
+
+        # 메트릭 (이 프로세스 기준)
+        self.replays = 0
+
+    def get(self, scope: str, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM idempotency_keys WHERE scope = ? AND key = ? AND expires_at >= ?",
+                (scope, key, time.time())
+            ).fetchone()
+            if row is None:
+                return None
+            self.replays += 1
+            return row[0]
+
+    def put(self, scope: str, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("DELETE FROM idempotency_keys WHERE expires_at < ?", (now,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO idempotency_keys (scope, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (scope, key, value, now + self.ttl_seconds)
+            )
+
+    def setdefault(self, scope: str, key: str, value: str) -> str:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("DELETE FROM idempotency_keys WHERE expires_at < ?", (now,))
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO idempotency_keys (scope, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (scope, key, value, now + self.ttl_seconds)
+            )
+            if cursor.rowcount == 1:
+                return value
+            return self._conn.execute(
+                "SELECT value FROM idempotency_keys WHERE scope = ? AND key = ?", (scope, key)
+            ).fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM idempotency_keys").fetchone()[0]
+        return {"entries": count, "replays": self.replays}
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
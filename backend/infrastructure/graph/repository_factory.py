@@ -0,0 +1,72 @@
+"""Session Repository Factory - 설정 기반 저장소 선택"""
+from typing import Optional
+from backend.infrastructure.graph.idempotency_store import IdempotencyStore, SQLiteIdempotencyStore
+from backend.infrastructure.graph.session_repository import DummySessionRepository
+from backend.infrastructure.graph.sqlite_session_repository import SQLiteSessionRepository
+from config.settings import settings
+
+
+def create_session_repository(backend: Optional[str] = None):
+    """
+    설정에 맞는 세션 저장소 생성
+
+    Args:
+        backend: 저장소 종류 ("memory" 또는 "sqlite", None이면 settings.session_backend)
+
+    Returns:
+        DummySessionRepository 또는 SQLiteSessionRepository 인스턴스
+
+    Raises:
+        ValueError: 알 수 없는 저장소 종류인 경우
+    """
+    backend = (backend or settings.session_backend).lower()
+
+    ttl_seconds = settings.session_timeout or None
+
+    if backend == "memory":
+        return DummySessionRepository(
+            ttl_seconds=ttl_seconds,
+            max_sessions=settings.session_max_count or None,
+            max_bytes=settings.session_max_bytes or None,
+            max_messages=settings.session_history_max_messages or None,
+            lock_timeout=settings.session_lock_timeout,
+            max_traces=settings.session_trace_turns
+        )
+    if backend == "sqlite":
+        return SQLiteSessionRepository(
+            db_path=settings.session_db_path,
+            flush_interval=settings.session_flush_interval,
+            ttl_seconds=ttl_seconds,
+            max_messages=settings.session_history_max_messages or None,
+            lock_timeout=settings.session_lock_timeout,
+            lock_lease=settings.session_lock_lease,
+            max_traces=settings.session_trace_turns
+        )
+
+    raise ValueError(f"Unknown session backend: {backend} (expected 'memory' or 'sqlite')")
+
+
+def create_idempotency_store(backend: Optional[str] = None):
+    """
+    세션 저장소와 같은 종류의 Idempotency-Key 기록 저장소 생성
+
+    Args:
+        backend: 저장소 종류 ("memory" 또는 "sqlite", None이면 settings.session_backend)
+
+    Returns:
+        IdempotencyStore 또는 SQLiteIdempotencyStore 인스턴스
+
+    Raises:
+        ValueError: 알 수 없는 저장소 종류인 경우
+    """
+    backend = (backend or settings.session_backend).lower()
+
+    if backend == "memory":
+        return IdempotencyStore(ttl_seconds=settings.idempotency_key_ttl)
+    if backend == "sqlite":
+        return SQLiteIdempotencyStore(
+            db_path=settings.session_db_path,
+            ttl_seconds=settings.idempotency_key_ttl
+        )
+
+    raise ValueError(f"Unknown session backend: {backend} (expected 'memory' or 'sqlite')")
@@ -0,0 +1,240 @@
+"""Session Locks - 세션별 advisory lock과 버전 충돌, 저장 실패"""
+import asyncio
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator
+
+
+class SessionLockTimeout(TimeoutError):
+    """세션 락을 제한 시간 안에 얻지 못한 경우"""
+
+
+class SessionVersionConflict(Exception):
+    """
+    저장하려는 상태를 읽은 뒤 다른 요청이 먼저 저장한 경우 (compare-and-swap 실패)
+
+    Attributes:
+        session_id: 세션 ID
+        expected_version: 상태를 읽을 때의 버전
+        current_version: 저장소의 현재 버전
+    """
+
+    def __init__(self, session_id: str, expected_version: int, current_version: int):
+        super().__init__(
+            f"Session {session_id} was modified concurrently "
+            f"(expected version {expected_version}, found {current_version})"
+        )
+        self.session_id = session_id
+        self.expected_version = expected_version
+        self.current_version = current_version
+
+
+class SessionSaveFailed(RuntimeError):
+    """저장소가 세션 상태를 저장하지 못한 경우 (직렬화 실패 등, 버전 충돌 제외)"""
+
+    def __init__(self, session_id: str):
+        super().__init__(f"Failed to save session {session_id}")
+        self.session_id = session_id
+
+
+class SessionLocks(ABC):
+    """
+    세션별 advisory lock 추상 기본 클래스
+
+    하위 클래스는 try_acquire/release만 구현하고, 대기는 짧은 간격으로 재시도합니다.
+    같은 세션의 턴(load → 워크플로우 → save)을 직렬화하여 동시 요청이 서로의 저장을 덮어쓰지 않게 합니다.
+    """
+
+    def __init__(self, timeout: float = 30.0, poll_interval: float = 0.005, max_poll_interval: float = 0.05):
+        """
+        락 관리자 초기화
+
+        Args:
+            timeout: 락 대기 최대 시간 (초)
+            poll_interval: 첫 재시도 간격 (초, 재시도마다 두 배)
+            max_poll_interval: 최대 재시도 간격 (초)
+        """
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+
+    @abstractmethod
+    def try_acquire(self, session_id: str, owner: str) -> bool:
+        """
+        락 획득 시도 (기다리지 않음)
+
+        Args:
+            session_id: 세션 ID
+            owner: 락 소유자 토큰
+
+        Returns:
+            획득 여부
+        """
+
+    @abstractmethod
+    def release(self, session_id: str, owner: str) -> None:
+        """
+        락 해제 (owner가 보유한 경우에만)
+
+        Args:
+            session_id: 세션 ID
+            owner: 락 소유자 토큰
+        """
+
+    @contextmanager
+    def lock(self, session_id: str) -> Iterator[None]:
+        """
+        세션 락 보유 구간 (동기)
+
+        Args:
+            session_id: 세션 ID
+
+        Raises:
+            SessionLockTimeout: timeout 안에 락을 얻지 못한 경우
+        """
+        owner = uuid.uuid4().hex
+        deadline = time.monotonic() + self.timeout
+        delay = self.poll_interval
+        while not self.try_acquire(session_id, owner):
+            if time.monotonic() >= deadline:
+                raise SessionLockTimeout(f"Timed out waiting for session lock: {session_id}")
+            time.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+        try:
+            yield
+        finally:
+            self.release(session_id, owner)
+
+    @asynccontextmanager
+    async def lock_async(self, session_id: str) -> AsyncIterator[None]:
+        """
+        세션 락 보유 구간 (비동기, 대기 중 이벤트 루프를 점유하지 않음)
+
+        획득/해제는 DB 쓰기일 수 있으므로 (SQLite lease) 이벤트 루프 밖에서 실행합니다.
+
+        Args:
+            session_id: 세션 ID
+
+        Raises:
+            SessionLockTimeout: timeout 안에 락을 얻지 못한 경우
+        """
+        owner = uuid.uuid4().hex
+        deadline = time.monotonic() + self.timeout
+        delay = self.poll_interval
+        while not await self._try_acquire_async(session_id, owner):
+            if time.monotonic() >= deadline:
+                raise SessionLockTimeout(f"Timed out waiting for session lock: {session_id}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+        try:
+            yield
+        finally:
+            await asyncio.to_thread(self.release, session_id, owner)
+
+    async def _try_acquire_async(self, session_id: str, owner: str) -> bool:
+        """
+        스레드에서 락 획득 시도 (대기 중 취소되어도 뒤늦게 얻은 락은 해제)
+
+        Args:
+            session_id: 세션 ID
+            owner: 락 소유자 토큰
+
+        Returns:
+            획득 여부
+        """
+        attempt = asyncio.ensure_future(asyncio.to_thread(self.try_acquire, session_id, owner))
+        try:
+            return await asyncio.shield(attempt)
+        except asyncio.CancelledError:
+            def release_if_acquired(done: "asyncio.Future[bool]") -> None:
+                if not done.cancelled() and done.exception() is None and done.result():
+                    self.release(session_id, owner)
+            attempt.add_done_callback(release_if_acquired)
+            raise
+
+
+class InProcessSessionLocks(SessionLocks):
+    """프로세스 내 세션 락 (인메모리 저장소용)"""
+
+    def __init__(self, **kwargs):
+        """
+        락 관리자 초기화
+
+        Args:
+            **kwargs: SessionLocks 옵션 (timeout, poll_interval, max_poll_interval)
+        """
+        super().__init__(**kwargs)
+        self._owners: Dict[str, str] = {}
+        self._guard = threading.Lock()
+
+    def try_acquire(self, session_id: str, owner: str) -> bool:
+        with self._guard:
+            if session_id in self._owners:
+                return False
+            self._owners[session_id] = owner
+            return True
+
+    def release(self, session_id: str, owner: str) -> None:
+        with self._guard:
+            if self._owners.get(session_id) == owner:
+                del self._owners[session_id]
+
+
+class SQLiteSessionLocks(SessionLocks):
+    """
+    SQLite lease 기반 세션 락 (여러 프로세스가 같은 DB 파일을 공유할 때)
+
+    session_locks 테이블에 (세션, 소유자, 만료 시각) 행을 두고, 만료되지 않은 행이 있으면
+    다른 소유자는 획득하지 못합니다. 락을 잡은 프로세스가 죽어도 lease가 지나면 회수됩니다.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        db_lock: threading.Lock,
+        lease_seconds: float = 120.0,
+        **kwargs
+    ):
+        """
+        락 관리자 초기화
+
+        Args:
+            conn: autocommit 모드 SQLite 연결
+            db_lock: 연결을 공유하는 스레드 간 락
+            lease_seconds: 락 유효 시간 (초, 턴 처리 최대 시간보다 길어야 함)
+            **kwargs: SessionLocks 옵션 (timeout, poll_interval, max_poll_interval)
+        """
+        super().__init__(**kwargs)
+        self._conn = conn
+        self._db_lock = db_lock
+        self.lease_seconds = lease_seconds
+        with self._db_lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS session_locks ("
+                "session_id TEXT PRIMARY KEY, "
+                "owner TEXT NOT NULL, "
+                "expires_at REAL NOT NULL)"
+            )
+
+    def try_acquire(self, session_id: str, owner: str) -> bool:
+        now = time.time()
+        with self._db_lock:
+            cursor = self._conn.execute(
+                "INSERT INTO session_locks (session_id, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET "
+                "owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE session_locks.expires_at < ?",
+                (session_id, owner, now + self.lease_seconds, now)
+            )
+        return cursor.rowcount == 1
+
+    def release(self, session_id: str, owner: str) -> None:
+        with self._db_lock:
+            self._conn.execute(
+                "DELETE FROM session_locks WHERE session_id = ? AND owner = ?",
+                (session_id, owner)
+            )
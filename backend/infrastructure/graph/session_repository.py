@@ -1,6 +1,14 @@
 """Dummy Session Repository - 더미 구현"""
-from typing import Dict, Optional, List
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import Callable, Dict, Optional, List
+from backend.domain.models.compact_state import CompactSession
 from backend.domain.models.state import RequirementState
+from backend.infrastructure.graph.session_lock import InProcessSessionLocks, SessionVersionConflict
+from backend.utils.tracing import TurnTrace
 
 
 class DummySessionRepository:
@@ -8,28 +16,124 @@ class DummySessionRepository:
     세션 저장소 더미 구현 (In-Memory)
 
     실제 구현에서는 Redis, PostgreSQL 등을 사용할 수 있습니다.
+
+    ttl_seconds가 주어지면 마지막 접근 후 그 시간이 지난 세션을 만료시키고,
+    max_sessions / max_bytes가 주어지면 가장 오래 접근하지 않은 세션부터(LRU) 제거합니다.
+
+    세션은 CompactSession으로 보관하고 load()마다 RequirementState로 복원합니다.
+    저장할 때마다 상태의 version을 올리며, expected_version을 주면 그 사이 다른 요청이 저장한 경우
+    SessionVersionConflict를 발생시킵니다 (compare-and-swap).
+    세션별 최근 턴 트레이스(max_traces개)도 함께 보관하고 세션을 제거할 때 같이 지웁니다.
+    세션 락은 이 프로세스 안에서만 유효하므로 여러 워커로 실행할 때는 SQLite 저장소를 사용해야 합니다.
     """
 
-    def __init__(self):
-        """Repository 초기화"""
-        self._storage: Dict[str, RequirementState] = {}
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        max_sessions: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_messages: Optional[int] = None,
+        lock_timeout: float = 30.0,
+        max_traces: int = 50,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Repository 초기화
+
+        Args:
+            ttl_seconds: 세션 만료 시간 (초, None이면 만료 없음)
+            max_sessions: 최대 세션 수 (None이면 제한 없음)
+            max_bytes: 직렬화 기준 최대 총 크기 (None이면 제한 없음)
+            max_messages: 세션당 원문으로 유지할 최근 메시지 수 (None이면 제한 없음)
+            lock_timeout: 세션 락 대기 최대 시간 (초)
+            max_traces: 세션당 보관할 최근 턴 트레이스 수
+            clock: 시간 함수 (테스트용)
+        """
+        # 접근 순서 유지 (앞쪽이 가장 오래 전 접근)
+        self._storage: "OrderedDict[str, CompactSession]" = OrderedDict()
+        self._last_access: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._traces: Dict[str, List[TurnTrace]] = {}
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.max_messages = max_messages
+        self.max_traces = max_traces
+        self._clock = clock
+        self._locks = InProcessSessionLocks(timeout=lock_timeout)
+
+        # 제거 카운터, 버전 충돌 횟수
+        self.evicted_expired = 0
+        self.evicted_lru = 0
+        self.version_conflicts = 0
+
+    def lock(self, session_id: str) -> AbstractContextManager:
+        """
+        세션 락 (같은 세션의 load → 갱신 → save 구간을 직렬화)
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            락을 보유하는 컨텍스트 매니저 (대기 시간 초과 시 SessionLockTimeout)
+        """
+        return self._locks.lock(session_id)
+
+    def lock_async(self, session_id: str) -> AbstractAsyncContextManager:
+        """
+        세션 락 (비동기)
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            락을 보유하는 비동기 컨텍스트 매니저 (대기 시간 초과 시 SessionLockTimeout)
+        """
+        return self._locks.lock_async(session_id)
 
-    def save(self, session_id: str, state: RequirementState) -> bool:
+    def save(self, session_id: str, state: RequirementState, expected_version: Optional[int] = None) -> bool:
         """
-        세션 상태 저장
+        세션 상태 저장 (성공하면 state.version이 새 버전으로 갱신됨)
 
         Args:
             session_id: 세션 ID
             state: 요구사항 상태
+            expected_version: 상태를 읽을 때의 버전 (None이면 확인하지 않음, 새 세션은 0)
 
         Returns:
             저장 성공 여부
+
+        Raises:
+            SessionVersionConflict: 저장된 버전이 expected_version과 다른 경우
         """
-        try:
-            self._storage[session_id] = state
-            return True
-        except Exception:
-            return False
+        with self._lock:
+            current = self._storage.get(session_id)
+            current_version = current.version if current is not None else 0
+            if expected_version is not None and expected_version != current_version:
+                self.version_conflicts += 1
+                raise SessionVersionConflict(session_id, expected_version, current_version)
+
+            try:
+                compact = CompactSession.from_state(state, self.max_messages)
+                compact.version = current_version + 1
+                self._storage[session_id] = compact
+                self._storage.move_to_end(session_id)
+                self._last_access[session_id] = self._clock()
+
+                # 크기 제한이 있을 때만 직렬화 크기 측정
+                if self.max_bytes:
+                    size = len(json.dumps(compact.to_dict(), ensure_ascii=False))
+                    self._total_bytes += size - self._sizes.get(session_id, 0)
+                    self._sizes[session_id] = size
+
+                self._enforce_limits(protect=session_id)
+                state.version = compact.version
+                return True
+            except Exception:
+                return False
 
     def load(self, session_id: str) -> Optional[RequirementState]:
         """
@@ -39,9 +143,21 @@ class DummySessionRepository:
             session_id: 세션 ID
 
         Returns:
-            요구사항 상태 또는 None
+            요구사항 상태 또는 None (없거나 만료된 경우)
         """
-        return self._storage.get(session_id)
+        with self._lock:
+            compact = self._storage.get(session_id)
+            if compact is None:
+                return None
+
+            if self._is_expired(session_id, self._clock()):
+                self._remove(session_id)
+                self.evicted_expired += 1
+                return None
+
+            self._storage.move_to_end(session_id)
+            self._last_access[session_id] = self._clock()
+        return compact.to_state()
 
     def delete(self, session_id: str) -> bool:
         """
@@ -53,10 +169,39 @@ class DummySessionRepository:
         Returns:
             삭제 성공 여부
         """
-        if session_id in self._storage:
-            del self._storage[session_id]
-            return True
-        return False
+        with self._lock:
+            if session_id in self._storage:
+                self._remove(session_id)
+                return True
+            return False
+
+    def append_trace(self, session_id: str, trace: TurnTrace) -> None:
+        """
+        세션의 턴 트레이스 추가 (최근 max_traces개만 유지, 없는 세션은 무시)
+
+        Args:
+            session_id: 세션 ID
+            trace: 완료된 턴 트레이스
+        """
+        with self._lock:
+            if session_id not in self._storage:
+                return
+            traces = self._traces.setdefault(session_id, [])
+            traces.append(trace)
+            del traces[:-self.max_traces]
+
+    def load_traces(self, session_id: str) -> List[TurnTrace]:
+        """
+        세션의 최근 턴 트레이스 조회
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            오래된 순 턴 트레이스 리스트 (없으면 빈 리스트)
+        """
+        with self._lock:
+            return list(self._traces.get(session_id, ()))
 
     def list_sessions(self) -> List[str]:
         """
@@ -65,4 +210,75 @@ class DummySessionRepository:
         Returns:
             세션 ID 리스트
         """
-        return list(self._storage.keys())
+        with self._lock:
+            return list(self._storage.keys())
+
+    def evict_expired(self) -> int:
+        """
+        만료된 세션 일괄 제거 (백그라운드 sweeper에서 호출)
+
+        Returns:
+            제거된 세션 수
+        """
+        if not self.ttl_seconds:
+            return 0
+
+        removed = 0
+        now = self._clock()
+        with self._lock:
+            # 접근 순서대로 정렬되어 있으므로 만료되지 않은 세션을 만나면 중단
+            while self._storage:
+                oldest_id = next(iter(self._storage))
+                if not self._is_expired(oldest_id, now):
+                    break
+                self._remove(oldest_id)
+                removed += 1
+            self.evicted_expired += removed
+        return removed
+
+    def eviction_stats(self) -> Dict[str, int]:
+        """
+        저장소 크기 및 제거 카운터 조회
+
+        Returns:
+            세션 수, 추적 중인 바이트 수, 만료/LRU 제거 횟수
+        """
+        with self._lock:
+            return {
+                "sessions": len(self._storage),
+                "bytes": self._total_bytes,
+                "evicted_expired": self.evicted_expired,
+                "evicted_lru": self.evicted_lru,
+                "version_conflicts": self.version_conflicts,
+            }
+
+    def close(self) -> None:
+        """저장소 종료 (인메모리 구현은 정리할 리소스 없음)"""
+        pass
+
+    def _is_expired(self, session_id: str, now: float) -> bool:
+        """마지막 접근 후 TTL 경과 여부"""
+        if not self.ttl_seconds:
+            return False
+        return now - self._last_access.get(session_id, now) > self.ttl_seconds
+
+    def _enforce_limits(self, protect: str) -> None:
+        """최대 세션 수 / 바이트 제한 초과 시 LRU 세션 제거 (방금 저장한 세션 제외)"""
+        while len(self._storage) > 1:
+            over_count = self.max_sessions and len(self._storage) > self.max_sessions
+            over_bytes = self.max_bytes and self._total_bytes > self.max_bytes
+            if not (over_count or over_bytes):
+                break
+
+            oldest_id = next(iter(self._storage))
+            if oldest_id == protect:
+                break
+            self._remove(oldest_id)
+            self.evicted_lru += 1
+
+    def _remove(self, session_id: str) -> None:
+        """세션과 부가 정보 제거"""
+        del self._storage[session_id]
+        self._last_access.pop(session_id, None)
+        self._traces.pop(session_id, None)
+        self._total_bytes -= self._sizes.pop(session_id, 0)
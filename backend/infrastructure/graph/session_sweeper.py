@@ -0,0 +1,65 @@
+"""Session Sweeper - 만료 세션 백그라운드 정리"""
+import threading
+from typing import Optional
+from backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class SessionSweeper:
+    """
+    세션 저장소의 evict_expired()를 주기적으로 호출하는 백그라운드 스레드
+
+    사용자가 인터뷰를 중단하고 다시 접근하지 않는 세션도 메모리에서 제거되도록 합니다.
+    """
+
+    def __init__(self, repository, interval: float = 60.0):
+        """
+        Sweeper 초기화
+
+        Args:
+            repository: evict_expired()를 제공하는 세션 저장소
+            interval: 정리 주기 (초)
+        """
+        self.repository = repository
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """백그라운드 정리 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="session-sweeper", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """백그라운드 정리 중지"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def sweep(self) -> int:
+        """
+        즉시 한 번 정리
+
+        Returns:
+            제거된 세션 수
+        """
+        try:
+            removed = self.repository.evict_expired()
+        except Exception:
+            logger.exception("Session sweep failed")
+            return 0
+        if removed:
+            logger.info(f"Evicted {removed} expired sessions")
+        return removed
+
+    def _run(self) -> None:
+        """정리 루프"""
+        while not self._stop.wait(self.interval):
+            self.sweep()
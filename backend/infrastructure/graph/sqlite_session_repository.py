@@ -0,0 +1,498 @@
+"""SQLite Session Repository - 영속 세션 저장소"""
+import asyncio
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, Optional, List, Tuple
+from backend.domain.models.compact_state import FORMAT_VERSION, CompactSession
+from backend.domain.models.state import RequirementState
+from backend.infrastructure.graph.session_lock import SQLiteSessionLocks, SessionVersionConflict
+from backend.utils.logger import setup_logger
+from backend.utils.tracing import TurnTrace
+
+logger = setup_logger(__name__)
+
+
+class SQLiteSessionRepository:
+    """
+    SQLite 기반 세션 저장소
+
+    DummySessionRepository와 같은 save/load/delete/list_sessions 인터페이스를 제공합니다.
+    세션당 한 행에 CompactSession JSON을 저장하며 (이전 형식의 RequirementState JSON도 읽음), WAL 모드로
+    여러 uvicorn 워커가 같은 DB 파일을 공유할 수 있습니다.
+
+    write-behind: expected_version 없는 save()는 메모리 큐에 최신 상태만 남기고(세션별로 병합) 즉시
+    반환하며, 백그라운드 스레드가 flush_interval마다 한 트랜잭션으로 일괄 기록합니다.
+    flush_interval이 0이면 save()가 바로 기록합니다 (write-through).
+
+    ttl_seconds가 주어지면 마지막 저장(매 턴마다 저장됨) 후 그 시간이 지난 세션을 만료시킵니다.
+
+    각 행에는 저장할 때마다 1씩 오르는 version을 두고, expected_version을 주면 그 사이 다른 요청이
+    저장한 경우 SessionVersionConflict를 발생시킵니다 (compare-and-swap). 이 저장은 다른 워커의 기록과
+    경쟁하므로 큐에 넣지 않고 BEGIN IMMEDIATE 트랜잭션 안에서 버전 확인과 기록을 함께 수행합니다.
+    일괄 기록 시에도 DB의 버전보다 높은 행만 덮어쓰므로 늦게 도착한 오래된 상태가 최신 상태를 덮어쓰지 않습니다.
+
+    세션 락은 같은 DB의 session_locks 테이블(lease)로 구현하여 프로세스 간에도 유효하며,
+    락을 풀기 전에 대기 중인 쓰기를 기록하므로 다음 턴을 받은 다른 워커가 최신 상태를 읽습니다.
+
+    세션별 최근 턴 트레이스(max_traces개)는 session_traces 테이블에 보관하므로 어느 워커가 처리한
+    턴이든 /timings에서 조회할 수 있습니다. 트레이스도 write-behind 큐를 거쳐 같은 트랜잭션으로 기록됩니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/sessions.db",
+        flush_interval: float = 0.5,
+        ttl_seconds: Optional[float] = None,
+        max_messages: Optional[int] = None,
+        lock_timeout: float = 30.0,
+        lock_lease: float = 120.0,
+        max_traces: int = 50
+    ):
+        """
+        Repository 초기화
+
+        Args:
+            db_path: SQLite DB 파일 경로 (":memory:" 가능)
+            flush_interval: write-behind 플러시 주기 (초, 0이면 write-through)
+            ttl_seconds: 세션 만료 시간 (초, None이면 만료 없음)
+            max_messages: 세션당 원문으로 유지할 최근 메시지 수 (None이면 제한 없음)
+            lock_timeout: 세션 락 대기 최대 시간 (초)
+            lock_lease: 세션 락 유효 시간 (초, 락을 잡은 워커가 죽으면 이후 다른 워커가 회수)
+            max_traces: 세션당 보관할 최근 턴 트레이스 수
+        """
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.ttl_seconds = ttl_seconds
+        self.max_messages = max_messages
+        self.max_traces = max_traces
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, "
+            "state TEXT NOT NULL, "
+            "updated_at REAL NOT NULL, "
+            "version INTEGER NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(sessions)")}
+        if "version" not in columns:
+            # version 열 이전에 만든 DB
+            self._conn.execute("ALTER TABLE sessions ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS session_traces ("
+            "session_id TEXT NOT NULL, "
+            "trace TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_session_traces_session ON session_traces (session_id)"
+        )
+        self._db_lock = threading.Lock()
+        self._locks = SQLiteSessionLocks(
+            self._conn, self._db_lock, lease_seconds=lock_lease, timeout=lock_timeout
+        )
+
+        # write-behind 큐: session_id → (직렬화된 최신 상태, 버전)
+        self._pending: Dict[str, Tuple[str, int]] = {}
+        # 기록 대기 중인 턴 트레이스: (session_id, 직렬화된 트레이스)
+        self._pending_traces: List[Tuple[str, str]] = []
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+
+        # 통계 (병합 효과 확인용, 만료 제거 횟수, 버전 충돌 횟수)
+        self.saves_requested = 0
+        self.rows_written = 0
+        self.evicted_expired = 0
+        self.version_conflicts = 0
+
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="sqlite-session-flusher", daemon=True
+            )
+            self._flusher.start()
+
+        atexit.register(self.close)
+
+    @contextmanager
+    def lock(self, session_id: str) -> Iterator[None]:
+        """
+        세션 락 (같은 세션의 load → 갱신 → save 구간을 프로세스 간에도 직렬화)
+
+        Args:
+            session_id: 세션 ID
+
+        Raises:
+            SessionLockTimeout: 대기 시간 초과
+        """
+        with self._locks.lock(session_id):
+            try:
+                yield
+            finally:
+                # 다른 워커가 락을 잡기 전에 이번 턴의 저장을 기록
+                self.flush()
+
+    @asynccontextmanager
+    async def lock_async(self, session_id: str) -> AsyncIterator[None]:
+        """
+        세션 락 (비동기)
+
+        Args:
+            session_id: 세션 ID
+
+        Raises:
+            SessionLockTimeout: 대기 시간 초과
+        """
+        async with self._locks.lock_async(session_id):
+            try:
+                yield
+            finally:
+                # 동기 DB 쓰기이므로 이벤트 루프 밖에서 기록
+                await asyncio.to_thread(self.flush)
+
+    def save(self, session_id: str, state: RequirementState, expected_version: Optional[int] = None) -> bool:
+        """
+        세션 상태 저장 (성공하면 state.version이 새 버전으로 갱신됨)
+
+        Args:
+            session_id: 세션 ID
+            state: 요구사항 상태
+            expected_version: 상태를 읽을 때의 버전 (None이면 확인하지 않음, 새 세션은 0)
+
+        Returns:
+            저장 성공 여부
+
+        Raises:
+            SessionVersionConflict: 저장된 버전이 expected_version과 다른 경우
+        """
+        if expected_version is not None:
+            return self._compare_and_swap(session_id, state, expected_version)
+
+        # DB 락을 먼저 잡아 flush()와 같은 순서로 잠금 (버전 확인과 큐 등록 사이에 기록되지 않도록)
+        with self._db_lock:
+            with self._pending_lock:
+                pending = self._pending.get(session_id)
+            if pending is not None:
+                current_version = pending[1]
+            else:
+                row = self._conn.execute(
+                    "SELECT version FROM sessions WHERE session_id = ?", (session_id,)
+                ).fetchone()
+                current_version = row[0] if row else 0
+
+            try:
+                compact = CompactSession.from_state(state, self.max_messages)
+                compact.version = current_version + 1
+                payload = json.dumps(compact.to_dict(), ensure_ascii=False, separators=(",", ":"))
+            except Exception:
+                logger.exception("Failed to serialize session state")
+                return False
+
+            with self._pending_lock:
+                self.saves_requested += 1
+                self._pending[session_id] = (payload, compact.version)
+        state.version = compact.version
+
+        if self._flusher is None:
+            return self.flush()
+        return True
+
+    def _compare_and_swap(self, session_id: str, state: RequirementState, expected_version: int) -> bool:
+        """
+        버전을 확인하고 바로 기록 (다른 워커의 기록과 원자적으로 직렬화)
+
+        Args:
+            session_id: 세션 ID
+            state: 요구사항 상태
+            expected_version: 상태를 읽을 때의 버전 (새 세션은 0)
+
+        Returns:
+            저장 성공 여부
+
+        Raises:
+            SessionVersionConflict: 저장된 버전이 expected_version과 다른 경우
+        """
+        with self._db_lock:
+            with self._pending_lock:
+                pending = self._pending.get(session_id)
+            try:
+                # 쓰기 락을 먼저 잡아 다른 워커가 확인과 기록 사이에 기록하지 못하게 함
+                self._conn.execute("BEGIN IMMEDIATE")
+                row = self._conn.execute(
+                    "SELECT version FROM sessions WHERE session_id = ?", (session_id,)
+                ).fetchone()
+                stored_version = row[0] if row else 0
+                # 이 프로세스에서 아직 기록하지 않은 저장이 더 최신일 수 있음
+                current_version = max(stored_version, pending[1]) if pending is not None else stored_version
+                if expected_version != current_version:
+                    self.version_conflicts += 1
+                    raise SessionVersionConflict(session_id, expected_version, current_version)
+
+                compact = CompactSession.from_state(state, self.max_messages)
+                compact.version = current_version + 1
+                payload = json.dumps(compact.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+                if row is None:
+                    cursor = self._conn.execute(
+                        "INSERT INTO sessions (session_id, state, updated_at, version) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(session_id) DO NOTHING",
+                        (session_id, payload, time.time(), compact.version)
+                    )
+                else:
+                    cursor = self._conn.execute(
+                        "UPDATE sessions SET state = ?, updated_at = ?, version = ? "
+                        "WHERE session_id = ? AND version = ?",
+                        (payload, time.time(), compact.version, session_id, stored_version)
+                    )
+                if cursor.rowcount == 0:
+                    self.version_conflicts += 1
+                    raise SessionVersionConflict(session_id, expected_version, stored_version)
+                self._conn.execute("COMMIT")
+            except SessionVersionConflict:
+                self._conn.execute("ROLLBACK")
+                raise
+            except Exception:
+                logger.exception("Failed to save session state")
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                return False
+
+            # 기록한 상태가 대기 중이던 저장을 대체
+            with self._pending_lock:
+                if self._pending.get(session_id) is pending:
+                    self._pending.pop(session_id, None)
+                self.saves_requested += 1
+                self.rows_written += 1
+        state.version = compact.version
+        return True
+
+    def load(self, session_id: str) -> Optional[RequirementState]:
+        """
+        세션 상태 로드 (아직 기록되지 않은 최신 상태 우선)
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            요구사항 상태 또는 None
+        """
+        with self._pending_lock:
+            pending = self._pending.get(session_id)
+        payload = pending[0] if pending is not None else None
+
+        if payload is None:
+            with self._db_lock:
+                row = self._conn.execute(
+                    "SELECT state, updated_at FROM sessions WHERE session_id = ?", (session_id,)
+                ).fetchone()
+            if row is None:
+                return None
+            if self.ttl_seconds and time.time() - row[1] > self.ttl_seconds:
+                # sweeper가 아직 지우지 않은 만료 세션
+                if self.delete(session_id):
+                    self.evicted_expired += 1
+                return None
+            payload = row[0]
+
+        data = json.loads(payload)
+        if data.get("v") != FORMAT_VERSION:
+            # 이전 형식 (RequirementState JSON)
+            return RequirementState.model_validate(data)
+        return CompactSession.from_dict(data).to_state()
+
+    def append_trace(self, session_id: str, trace: TurnTrace) -> None:
+        """
+        세션의 턴 트레이스 추가 (다음 플러시에 기록, 최근 max_traces개만 유지)
+
+        Args:
+            session_id: 세션 ID
+            trace: 완료된 턴 트레이스
+        """
+        payload = trace.model_dump_json()
+        with self._pending_lock:
+            self._pending_traces.append((session_id, payload))
+        if self._flusher is None:
+            self.flush()
+
+    def load_traces(self, session_id: str) -> List[TurnTrace]:
+        """
+        세션의 최근 턴 트레이스 조회 (다른 워커가 처리한 턴 포함)
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            오래된 순 턴 트레이스 리스트 (없으면 빈 리스트)
+        """
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT trace FROM session_traces WHERE session_id = ? ORDER BY rowid", (session_id,)
+            ).fetchall()
+            with self._pending_lock:
+                pending = [payload for sid, payload in self._pending_traces if sid == session_id]
+        payloads = [row[0] for row in rows] + pending
+        return [TurnTrace.model_validate_json(payload) for payload in payloads[-self.max_traces:]]
+
+    def delete(self, session_id: str) -> bool:
+        """
+        세션 삭제 (턴 트레이스 포함)
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            삭제 성공 여부
+        """
+        with self._db_lock:
+            with self._pending_lock:
+                was_pending = self._pending.pop(session_id, None) is not None
+                self._pending_traces = [item for item in self._pending_traces if item[0] != session_id]
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+            self._conn.execute("DELETE FROM session_traces WHERE session_id = ?", (session_id,))
+        return was_pending or cursor.rowcount > 0
+
+    def list_sessions(self) -> List[str]:
+        """
+        모든 세션 ID 목록 조회
+
+        Returns:
+            세션 ID 리스트
+        """
+        with self._db_lock:
+            rows = self._conn.execute("SELECT session_id FROM sessions").fetchall()
+        session_ids = [row[0] for row in rows]
+
+        known = set(session_ids)
+        with self._pending_lock:
+            pending_ids = [sid for sid in self._pending if sid not in known]
+        return session_ids + pending_ids
+
+    def evict_expired(self) -> int:
+        """
+        만료된 세션 일괄 제거 (백그라운드 sweeper에서 호출)
+
+        Returns:
+            제거된 세션 수
+        """
+        if not self.ttl_seconds:
+            return 0
+
+        cutoff = time.time() - self.ttl_seconds
+        with self._db_lock:
+            self._conn.execute(
+                "DELETE FROM session_traces WHERE session_id IN "
+                "(SELECT session_id FROM sessions WHERE updated_at < ?)", (cutoff,)
+            )
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE updated_at < ?", (cutoff,)
+            )
+        self.evicted_expired += cursor.rowcount
+        return cursor.rowcount
+
+    def eviction_stats(self) -> Dict[str, int]:
+        """
+        저장소 크기 및 제거 카운터 조회
+
+        Returns:
+            세션 수, DB 바이트 수, 만료 제거 횟수 (LRU 제거는 디스크 저장소에서 사용하지 않음)
+        """
+        with self._db_lock:
+            count, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(state)), 0) FROM sessions"
+            ).fetchone()
+        with self._pending_lock:
+            pending = len(self._pending)
+        return {
+            "sessions": count + pending,
+            "bytes": total_bytes,
+            "evicted_expired": self.evicted_expired,
+            "evicted_lru": 0,
+            "version_conflicts": self.version_conflicts,
+        }
+
+    def flush(self) -> bool:
+        """
+        대기 중인 저장 요청과 턴 트레이스를 한 트랜잭션으로 기록
+
+        Returns:
+            기록 성공 여부
+        """
+        # DB 락을 먼저 잡아 delete()와 배치 기록이 교차하지 않도록 함
+        with self._db_lock:
+            with self._pending_lock:
+                if not self._pending and not self._pending_traces:
+                    return True
+                batch = self._pending
+                traces = self._pending_traces
+                self._pending = {}
+                self._pending_traces = []
+
+            now = time.time()
+            rows = [
+                (session_id, payload, now, version)
+                for session_id, (payload, version) in batch.items()
+            ]
+            try:
+                self._conn.execute("BEGIN")
+                # 다른 워커가 더 높은 버전을 이미 기록했으면 덮어쓰지 않음
+                self._conn.executemany(
+                    "INSERT INTO sessions (session_id, state, updated_at, version) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(session_id) DO UPDATE SET "
+                    "state = excluded.state, updated_at = excluded.updated_at, version = excluded.version "
+                    "WHERE excluded.version > sessions.version",
+                    rows
+                )
+                if traces:
+                    self._conn.executemany(
+                        "INSERT INTO session_traces (session_id, trace) VALUES (?, ?)", traces
+                    )
+                    # 세션별 최근 max_traces개만 유지
+                    self._conn.executemany(
+                        "DELETE FROM session_traces WHERE session_id = ? AND rowid NOT IN "
+                        "(SELECT rowid FROM session_traces WHERE session_id = ? ORDER BY rowid DESC LIMIT ?)",
+                        [(session_id, session_id, self.max_traces) for session_id in {sid for sid, _ in traces}]
+                    )
+                self._conn.execute("COMMIT")
+                self.rows_written += len(rows)
+                return True
+            except Exception:
+                logger.exception("Failed to flush session writes")
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                # 실패한 배치는 더 최신 저장이 없을 때만 큐에 되돌림
+                with self._pending_lock:
+                    for session_id, pending in batch.items():
+                        self._pending.setdefault(session_id, pending)
+                    self._pending_traces[:0] = traces
+                return False
+
+    def _flush_loop(self) -> None:
+        """백그라운드 플러시 루프"""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def close(self) -> None:
+        """남은 쓰기를 기록하고 연결 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
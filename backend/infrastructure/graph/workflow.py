@@ -1,8 +1,29 @@
 """Dummy Workflow - 더미 구현"""
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from pydantic import BaseModel
 from backend.domain.models.state import RequirementState
-from backend.domain.agents.consultant_agent import consultant_agent
-from backend.domain.agents.judge_agent import judge_agent
-from backend.domain.agents.writer_agent import writer_agent
+from backend.domain.agents.consultant_agent import (
+    consultant_agent,
+    consultant_agent_async,
+    consultant_agent_stream,
+)
+from backend.domain.agents.judge_agent import judge_agent, judge_agent_async
+from backend.domain.agents.speculation import SpeculativeQuestion, apply_speculative_question
+from backend.domain.agents.writer_agent import (
+    writer_agent,
+    writer_agent_async,
+    iter_srs_sections,
+    build_srs_json,
+    set_final_srs,
+)
+from backend.utils.tracing import STAGE_WRITER, trace_stage
+
+
+# 병렬 모드에서 Consultant를 실행할 공유 스레드 풀 (동기 경로 전용)
+_parallel_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="consultant")
 
 
 class DummyWorkflow:
@@ -10,35 +31,251 @@ class DummyWorkflow:
     다중 에이전트 워크플로우 더미 구현
 
     Consultant → Judge → (conditional) Writer
+
+    parallel=True이면 Consultant와 Judge를 동시에 실행합니다.
+    두 에이전트는 collected_info/messages를 읽기만 하고 서로 다른 필드를 쓰므로,
+    각자 상태 사본에서 실행한 뒤 결과를 병합합니다.
     """
 
-    def __init__(self):
-        """워크플로우 초기화"""
+    def __init__(self, parallel: bool = False):
+        """
+        워크플로우 초기화
+
+        Args:
+            parallel: Consultant/Judge 동시 실행 여부
+        """
+        self.parallel = parallel
         self.consultant_agent = consultant_agent
         self.judge_agent = judge_agent
         self.writer_agent = writer_agent
+        self.consultant_agent_async = consultant_agent_async
+        self.judge_agent_async = judge_agent_async
+        self.writer_agent_async = writer_agent_async
+        self.consultant_agent_stream = consultant_agent_stream
+        self.writer_sections = iter_srs_sections
 
-    def run(self, state: RequirementState) -> RequirementState:
+    def run(
+        self,
+        state: RequirementState,
+        speculation: Optional[SpeculativeQuestion] = None,
+        thread_id: Optional[str] = None
+    ) -> RequirementState:
         """
         워크플로우 실행
 
         Args:
             state: 현재 요구사항 상태
+            speculation: 검증된 미리 만든 질문 (있으면 Consultant LLM 호출 생략)
+            thread_id: 체크포인트 키 (이 워크플로우는 체크포인트를 쓰지 않으므로 무시)
+
+        Returns:
+            업데이트된 요구사항 상태
+        """
+        if self.parallel:
+            # 1-2. Consultant(워커 스레드)와 Judge(현재 스레드) 동시 실행
+            # (트레이스 컨텍스트를 워커 스레드로 전달)
+            consultant_future = _parallel_pool.submit(
+                contextvars.copy_context().run, self._consult, state.model_copy(deep=True), speculation
+            )
+            judge_state = self.judge_agent(state.model_copy(deep=True))
+            state = self._merge_parallel_results(state, consultant_future.result(), judge_state)
+        else:
+            # 1. Consultant 실행 (항상)
+            state = self._consult(state, speculation)
+
+            # 2. Judge 실행 (항상)
+            state = self.judge_agent(state)
+
+        # 3. Writer 실행 (조건부: is_complete가 True일 때만)
+        if state.is_complete:
+            with trace_stage(STAGE_WRITER):
+                state = self.writer_agent(state)
+
+        # 4. iteration_count 증가
+        state.iteration_count += 1
+
+        return state
+
+    async def run_async(
+        self,
+        state: RequirementState,
+        speculation: Optional[SpeculativeQuestion] = None,
+        thread_id: Optional[str] = None
+    ) -> RequirementState:
+        """
+        워크플로우 비동기 실행 (LLM 대기 중 다른 세션 요청 처리 가능)
+
+        Args:
+            state: 현재 요구사항 상태
+            speculation: 검증된 미리 만든 질문 (있으면 Consultant LLM 호출 생략)
+            thread_id: 체크포인트 키 (이 워크플로우는 체크포인트를 쓰지 않으므로 무시)
 
         Returns:
             업데이트된 요구사항 상태
         """
-        # 1. Consultant 실행 (항상)
-        state = self.consultant_agent(state)
+        if self.parallel:
+            # 1-2. Consultant와 Judge 동시 실행
+            consultant_state, judge_state = await asyncio.gather(
+                self._consult_async(state.model_copy(deep=True), speculation),
+                self.judge_agent_async(state.model_copy(deep=True)),
+            )
+            state = self._merge_parallel_results(state, consultant_state, judge_state)
+        else:
+            # 1. Consultant 실행 (항상)
+            state = await self._consult_async(state, speculation)
 
-        # 2. Judge 실행 (항상)
-        state = self.judge_agent(state)
+            # 2. Judge 실행 (항상)
+            state = await self.judge_agent_async(state)
 
         # 3. Writer 실행 (조건부: is_complete가 True일 때만)
         if state.is_complete:
-            state = self.writer_agent(state)
+            with trace_stage(STAGE_WRITER):
+                state = await self.writer_agent_async(state)
+
+        # 4. iteration_count 증가
+        state.iteration_count += 1
+
+        return state
+
+    async def run_stream(
+        self,
+        state: RequirementState,
+        speculation: Optional[SpeculativeQuestion] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        워크플로우 스트리밍 실행 (SSE 응답용)
+
+        Consultant 토큰 → 질문 → Judge 판정 → (승인 시) SRS 섹션 순으로 이벤트를 내보내며,
+        state는 run_async()와 같은 결과로 직접 갱신됩니다.
+
+        Args:
+            state: 현재 요구사항 상태 (직접 갱신됨)
+            speculation: 검증된 미리 만든 질문 (있으면 질문 전체를 토큰 한 개로 전송)
+
+        Yields:
+            (이벤트 이름, 이벤트 데이터) 튜플
+        """
+        if self.parallel:
+            # 1-2. Judge를 백그라운드로 실행하면서 Consultant 토큰 스트리밍
+            judge_task = asyncio.ensure_future(self.judge_agent_async(state.model_copy(deep=True)))
+            consultant_state = state.model_copy(deep=True)
+            try:
+                async for token in self._consult_stream(consultant_state, speculation):
+                    yield "consultant_token", {"text": token}
+                judge_state = await judge_task
+            finally:
+                # 클라이언트 연결이 끊긴 경우 Judge 호출 취소
+                judge_task.cancel()
+            self._merge_parallel_results(state, consultant_state, judge_state)
+            if not state.is_complete:
+                yield "question", self._question_event(state)
+        else:
+            # 1. Consultant 실행 (항상)
+            async for token in self._consult_stream(state, speculation):
+                yield "consultant_token", {"text": token}
+            yield "question", self._question_event(state)
+
+            # 2. Judge 실행 (항상)
+            state = await self.judge_agent_async(state)
+
+        yield "judge", {"is_complete": state.is_complete, "judge_feedback": state.judge_feedback}
+
+        # 3. Writer 실행 (조건부: is_complete가 True일 때만), 섹션마다 전송
+        if state.is_complete:
+            sections = {}
+            with trace_stage(STAGE_WRITER):
+                for name, value in self.writer_sections(state):
+                    sections[name] = value
+                    yield "srs_section", {"section": name, "content": to_jsonable(value)}
+                set_final_srs(state, build_srs_json(sections))
 
         # 4. iteration_count 증가
         state.iteration_count += 1
 
+    def _consult(
+        self,
+        state: RequirementState,
+        speculation: Optional[SpeculativeQuestion]
+    ) -> RequirementState:
+        """Consultant 단계 (미리 만든 질문이 있으면 LLM 대신 사용)"""
+        if speculation is not None:
+            return apply_speculative_question(state, speculation)
+        return self.consultant_agent(state)
+
+    async def _consult_async(
+        self,
+        state: RequirementState,
+        speculation: Optional[SpeculativeQuestion]
+    ) -> RequirementState:
+        """_consult의 비동기 버전"""
+        if speculation is not None:
+            return apply_speculative_question(state, speculation)
+        return await self.consultant_agent_async(state)
+
+    async def _consult_stream(
+        self,
+        state: RequirementState,
+        speculation: Optional[SpeculativeQuestion]
+    ) -> AsyncIterator[str]:
+        """_consult의 스트리밍 버전 (state 직접 갱신)"""
+        if speculation is not None:
+            apply_speculative_question(state, speculation)
+            yield speculation.question
+            return
+        async for token in self.consultant_agent_stream(state):
+            yield token
+
+    def _question_event(self, state: RequirementState) -> Dict[str, Any]:
+        """Consultant 결과 이벤트 데이터 (질문 목록, 마지막 assistant 메시지)"""
+        message = state.messages[-1].content if state.messages and state.messages[-1].role == "assistant" else None
+        return {"questions": state.questions, "message": message}
+
+    def _merge_parallel_results(
+        self,
+        state: RequirementState,
+        consultant_state: RequirementState,
+        judge_state: RequirementState
+    ) -> RequirementState:
+        """
+        병렬 실행 결과 병합 (실행 완료 순서와 무관하게 항상 같은 결과)
+
+        Judge 결과(is_complete, judge_feedback)는 항상 반영하고,
+        Judge가 승인하면 더 이상 질문이 필요 없으므로 Consultant 출력은 버립니다.
+
+        Args:
+            state: 실행 전 원본 상태
+            consultant_state: Consultant 실행 결과 사본
+            judge_state: Judge 실행 결과 사본
+
+        Returns:
+            병합된 요구사항 상태
+        """
+        state.is_complete = judge_state.is_complete
+        state.judge_feedback = judge_state.judge_feedback
+        # Judge 사본은 원본 메시지 기준으로 렌더링했으므로 그대로 이어 받음
+        state.prompt_context = judge_state.prompt_context
+
+        if not state.is_complete:
+            # Consultant가 추가한 메시지만 이어 붙임
+            new_messages = consultant_state.messages[len(state.messages):]
+            state.questions = consultant_state.questions
+            state.messages.extend(new_messages)
+
         return state
+
+
+def to_jsonable(value: Any) -> Any:
+    """
+    SRS 섹션 값을 JSON 직렬화 가능한 형태로 변환
+
+    Args:
+        value: 섹션 값 (문자열, 문자열 리스트, pydantic 모델 리스트)
+
+    Returns:
+        JSON 직렬화 가능한 값
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, list):
+        return [to_jsonable(item) for item in value]
+    return value
@@ -1,4 +1,21 @@
 """LLM Module"""
 from backend.infrastructure.llm.gemini_client import DummyGeminiClient
+from backend.infrastructure.llm.response_cache import LLMResponseCache, get_response_cache
+from backend.infrastructure.llm.simulated_client import SimulatedLLMClient
+from backend.infrastructure.llm.client_registry import (
+    LLMClientRegistry,
+    create_llm_client,
+    get_client_registry,
+    get_llm_client,
+)
 
-__all__ = ["DummyGeminiClient"]
+__all__ = [
+    "DummyGeminiClient",
+    "LLMResponseCache",
+    "get_response_cache",
+    "SimulatedLLMClient",
+    "LLMClientRegistry",
+    "create_llm_client",
+    "get_client_registry",
+    "get_llm_client",
+]
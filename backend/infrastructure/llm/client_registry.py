@@ -0,0 +1,178 @@
+"""LLM Client Registry - 프로세스 전역 LLM 클라이언트 풀"""
+import os
+import threading
+from typing import Dict, Optional, Tuple, Any
+
+from backend.infrastructure.llm.gemini_client import get_gemini_client
+from backend.infrastructure.llm.simulated_client import SimulatedLLMClient
+from config.settings import settings
+
+
+# (model_name, temperature, api_key)
+ClientKey = Tuple[str, float, str]
+
+
+class LLMClientRegistry:
+    """
+    LLM 클라이언트 레지스트리
+
+    (모델, temperature, API 키) 조합마다 하나의 장수명 클라이언트를 보관하여
+    에이전트 호출마다 클라이언트/TLS 연결을 새로 만들지 않도록 합니다.
+    내부 HTTP 연결 풀은 클라이언트 인스턴스와 함께 재사용됩니다.
+    """
+
+    def __init__(self, max_consecutive_failures: int = 5):
+        """
+        Registry 초기화
+
+        Args:
+            max_consecutive_failures: 이 횟수 이상 연속 실패한 클라이언트는 재생성
+        """
+        self._clients: Dict[ClientKey, Any] = {}
+        self._lock = threading.Lock()
+        self.max_consecutive_failures = max_consecutive_failures
+
+    def _make_key(
+        self,
+        model_name: Optional[str],
+        temperature: Optional[float],
+        api_key: Optional[str]
+    ) -> ClientKey:
+        """설정 기본값을 채워 레지스트리 키 생성"""
+        return (
+            model_name or settings.model_name,
+            settings.temperature if temperature is None else float(temperature),
+            api_key or settings.google_api_key or os.getenv("GOOGLE_API_KEY") or "",
+        )
+
+    def get_client(
+        self,
+        model_name: Optional[str] = None,
+        temperature: Optional[float] = None,
+        api_key: Optional[str] = None
+    ) -> Any:
+        """
+        공유 클라이언트 조회 (없거나 비정상이면 생성)
+
+        Args:
+            model_name: 모델명 (None이면 settings 값)
+            temperature: 샘플링 온도 (None이면 settings 값)
+            api_key: Google API 키 (None이면 settings/환경 변수 값)
+
+        Returns:
+            GeminiClient, DummyGeminiClient 또는 SimulatedLLMClient 인스턴스
+        """
+        key = self._make_key(model_name, temperature, api_key)
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None and client.is_healthy(
+                max_consecutive_failures=self.max_consecutive_failures
+            ):
+                return client
+
+            # 비정상 클라이언트는 교체하고, 다른 스레드의 진행 중인 호출이 끝난 뒤 닫음
+            if client is not None:
+                client.close_when_released()
+
+            client = create_llm_client(
+                api_key=key[2] or None,
+                model_name=key[0],
+                temperature=key[1]
+            )
+            self._clients[key] = client
+            return client
+
+    def health_check(self) -> Dict[str, bool]:
+        """
+        등록된 클라이언트 상태 점검
+
+        비정상 클라이언트는 레지스트리에서 제거하고 진행 중인 호출이 끝난 뒤 닫습니다.
+        (다음 get_client 호출 시 새로 생성됨)
+
+        Returns:
+            "모델@temperature" → 정상 여부 딕셔너리
+        """
+        report = {}
+        with self._lock:
+            for key, client in list(self._clients.items()):
+                healthy = client.is_healthy(
+                    max_consecutive_failures=self.max_consecutive_failures
+                )
+                report[f"{key[0]}@{key[1]}"] = healthy
+                if not healthy:
+                    client.close_when_released()
+                    del self._clients[key]
+        return report
+
+    def size(self) -> int:
+        """등록된 클라이언트 수"""
+        with self._lock:
+            return len(self._clients)
+
+    def shutdown(self) -> None:
+        """모든 클라이언트 종료 및 레지스트리 비우기"""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+
+def create_llm_client(
+    api_key: Optional[str] = None,
+    model_name: Optional[str] = None,
+    temperature: Optional[float] = None,
+    backend: Optional[str] = None
+) -> Any:
+    """
+    설정된 백엔드에 맞는 LLM 클라이언트 생성
+
+    Args:
+        api_key: Google API 키 (gemini 전용)
+        model_name: 모델명
+        temperature: 샘플링 온도
+        backend: LLM 백엔드 (None이면 settings.llm_backend)
+
+    Returns:
+        GeminiClient, DummyGeminiClient 또는 SimulatedLLMClient 인스턴스
+
+    Raises:
+        ValueError: 알 수 없는 백엔드인 경우
+    """
+    backend = backend or settings.llm_backend
+    if backend == "gemini":
+        return get_gemini_client(api_key=api_key, model_name=model_name, temperature=temperature)
+    if backend == "simulator":
+        return SimulatedLLMClient(model_name=model_name, temperature=temperature)
+    raise ValueError(f"Unknown LLM backend: {backend} (expected 'gemini' or 'simulator')")
+
+
+# 전역 공유 registry (싱글톤 패턴)
+_shared_registry = LLMClientRegistry()
+
+
+def get_client_registry() -> LLMClientRegistry:
+    """
+    전역 LLM 클라이언트 레지스트리 가져오기
+
+    Returns:
+        LLMClientRegistry 인스턴스
+    """
+    return _shared_registry
+
+
+def get_llm_client(
+    model_name: Optional[str] = None,
+    temperature: Optional[float] = None
+) -> Any:
+    """
+    에이전트용 공유 LLM 클라이언트 가져오기
+
+    Args:
+        model_name: 모델명 (None이면 settings 값)
+        temperature: 샘플링 온도 (None이면 settings 값)
+
+    Returns:
+        GeminiClient 또는 DummyGeminiClient 인스턴스
+    """
+    return _shared_registry.get_client(model_name=model_name, temperature=temperature)
@@ -1,8 +1,11 @@
 """Google Gemini LLM Client"""
 import os
+import re
 import json
 import time
-from typing import Optional, Dict, Any
+import asyncio
+import weakref
+from typing import Optional, Dict, Any, AsyncIterator
 
 try:
     # 새로운 google.genai 패키지 시도
@@ -14,6 +17,11 @@ except ImportError:
     USING_NEW_API = False
 
 from config.settings import settings
+from backend.infrastructure.llm.response_cache import LLMResponseCache, get_response_cache
+from backend.utils.logger import setup_logger
+from backend.utils.tracing import record_llm_call
+
+logger = setup_logger(__name__)
 
 
 class GeminiClient:
@@ -23,12 +31,21 @@ class GeminiClient:
     실제 Gemini API를 사용하여 LLM 응답을 생성합니다.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model_name: Optional[str] = None,
+        temperature: Optional[float] = None,
+        cache: Optional[LLMResponseCache] = None
+    ):
         """
         Gemini 클라이언트 초기화
 
         Args:
             api_key: Google API 키 (None이면 환경 변수에서 가져옴)
+            model_name: 모델명 (None이면 settings 값 사용)
+            temperature: 샘플링 온도 (None이면 settings 값 사용)
+            cache: 응답 캐시 (None이면 전역 캐시, 전역 캐시도 비활성화면 캐시 없음)
         """
         # API 키 설정
         self.api_key = api_key or settings.google_api_key or os.getenv("GOOGLE_API_KEY")
@@ -40,10 +57,17 @@ class GeminiClient:
             )
 
         # 모델 초기화
-        self.model_name = settings.model_name
-        self.temperature = settings.temperature
+        self.model_name = model_name or settings.model_name
+        self.temperature = settings.temperature if temperature is None else temperature
+
+        # 응답 캐시
+        self.cache = cache if cache is not None else get_response_cache()
 
-        print(f"[DEBUG] Initializing Gemini with model: {self.model_name}")
+        # 헬스 체크용 상태 (연속 실패 횟수, 종료 여부)
+        self.consecutive_failures = 0
+        self.closed = False
+
+        logger.debug("Initializing Gemini client with model: %s", self.model_name)
 
         # API 버전에 따라 다르게 초기화
         if USING_NEW_API:
@@ -68,7 +92,8 @@ class GeminiClient:
         self,
         prompt: str,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        use_cache: bool = True
     ) -> str:
         """
         텍스트 응답 생성
@@ -77,6 +102,7 @@ class GeminiClient:
             prompt: 입력 프롬프트
             max_retries: 최대 재시도 횟수
             retry_delay: 재시도 간 대기 시간 (초)
+            use_cache: 응답 캐시 사용 여부 (False면 항상 API 호출)
 
         Returns:
             생성된 응답 문자열
@@ -84,6 +110,11 @@ class GeminiClient:
         Raises:
             Exception: API 호출 실패 시
         """
+        cache_key, cached = self._lookup_cache(prompt, use_cache)
+        if cached is not None:
+            record_llm_call(prompt, cached, attempts=0, cache_hit=True)
+            return cached
+
         for attempt in range(max_retries):
             try:
                 if USING_NEW_API:
@@ -108,7 +139,12 @@ class GeminiClient:
                 if not response_text:
                     raise ValueError("Empty response from Gemini API")
 
-                return response_text.strip()
+                self.consecutive_failures = 0
+                response_text = response_text.strip()
+                if cache_key is not None:
+                    self.cache.set(cache_key, response_text)
+                record_llm_call(prompt, response_text, attempts=attempt + 1)
+                return response_text
 
             except Exception as e:
                 if attempt < max_retries - 1:
@@ -116,12 +152,161 @@ class GeminiClient:
                     time.sleep(retry_delay * (attempt + 1))  # 지수 백오프
                     continue
                 else:
+                    # 재시도를 모두 소진한 호출만 연속 실패로 집계
+                    self.consecutive_failures += 1
+                    record_llm_call(prompt, None, attempts=max_retries)
                     raise Exception(f"Gemini API failed after {max_retries} attempts: {e}")
 
+    async def generate_async(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        use_cache: bool = True
+    ) -> str:
+        """
+        텍스트 응답 비동기 생성 (재시도 대기 중 이벤트 루프를 블로킹하지 않음)
+
+        Args:
+            prompt: 입력 프롬프트
+            max_retries: 최대 재시도 횟수
+            retry_delay: 재시도 간 대기 시간 (초)
+            use_cache: 응답 캐시 사용 여부 (False면 항상 API 호출)
+
+        Returns:
+            생성된 응답 문자열
+
+        Raises:
+            Exception: API 호출 실패 시
+        """
+        cache_key, cached = self._lookup_cache(prompt, use_cache)
+        if cached is not None:
+            record_llm_call(prompt, cached, attempts=0, cache_hit=True)
+            return cached
+
+        for attempt in range(max_retries):
+            try:
+                if USING_NEW_API:
+                    # 새로운 API의 비동기 클라이언트 사용
+                    response = await self.client.aio.models.generate_content(
+                        model=self.model_name,
+                        contents=prompt,
+                        config={
+                            "temperature": self.temperature,
+                            "top_p": 0.95,
+                            "top_k": 40,
+                            "max_output_tokens": 8192,
+                        }
+                    )
+                    response_text = response.text
+                else:
+                    # 레거시 API 사용
+                    response = await self.model.generate_content_async(prompt)
+                    response_text = response.text
+
+                # 응답 검증
+                if not response_text:
+                    raise ValueError("Empty response from Gemini API")
+
+                self.consecutive_failures = 0
+                response_text = response_text.strip()
+                if cache_key is not None:
+                    self.cache.set(cache_key, response_text)
+                record_llm_call(prompt, response_text, attempts=attempt + 1)
+                return response_text
+
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    print(f"Gemini API error (attempt {attempt + 1}/{max_retries}): {e}")
+                    await asyncio.sleep(retry_delay * (attempt + 1))  # 지수 백오프
+                    continue
+                else:
+                    self.consecutive_failures += 1
+                    record_llm_call(prompt, None, attempts=max_retries)
+                    raise Exception(f"Gemini API failed after {max_retries} attempts: {e}")
+
+    async def generate_stream_async(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        use_cache: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        텍스트 응답을 토큰 청크 단위로 스트리밍 생성
+
+        캐시 적중 시 캐시된 응답을 한 번에 내보내고, 완료된 응답은 캐시에 저장합니다.
+        첫 청크를 내보내기 전에 실패한 경우에만 재시도합니다 (중복 출력 방지).
+
+        Args:
+            prompt: 입력 프롬프트
+            max_retries: 최대 재시도 횟수
+            retry_delay: 재시도 간 대기 시간 (초)
+            use_cache: 응답 캐시 사용 여부 (False면 항상 API 호출)
+
+        Yields:
+            응답 텍스트 청크
+
+        Raises:
+            Exception: API 호출 실패 시
+        """
+        cache_key, cached = self._lookup_cache(prompt, use_cache)
+        if cached is not None:
+            record_llm_call(prompt, cached, attempts=0, cache_hit=True)
+            yield cached
+            return
+
+        for attempt in range(max_retries):
+            chunks = []
+            try:
+                if USING_NEW_API:
+                    # 새로운 API의 비동기 스트리밍 사용
+                    stream = await self.client.aio.models.generate_content_stream(
+                        model=self.model_name,
+                        contents=prompt,
+                        config={
+                            "temperature": self.temperature,
+                            "top_p": 0.95,
+                            "top_k": 40,
+                            "max_output_tokens": 8192,
+                        }
+                    )
+                else:
+                    # 레거시 API 사용
+                    stream = await self.model.generate_content_async(prompt, stream=True)
+
+                async for chunk in stream:
+                    text = chunk.text
+                    if text:
+                        chunks.append(text)
+                        yield text
+
+                # 응답 검증
+                response_text = "".join(chunks).strip()
+                if not response_text:
+                    raise ValueError("Empty response from Gemini API")
+
+                self.consecutive_failures = 0
+                if cache_key is not None:
+                    self.cache.set(cache_key, response_text)
+                record_llm_call(prompt, response_text, attempts=attempt + 1)
+                return
+
+            except Exception as e:
+                if not chunks and attempt < max_retries - 1:
+                    print(f"Gemini API error (attempt {attempt + 1}/{max_retries}): {e}")
+                    await asyncio.sleep(retry_delay * (attempt + 1))  # 지수 백오프
+                    continue
+                else:
+                    self.consecutive_failures += 1
+                    record_llm_call(prompt, None, attempts=attempt + 1)
+                    raise Exception(f"Gemini API failed after {attempt + 1} attempts: {e}")
+
     def generate_json(
         self,
         prompt: str,
-        max_retries: int = 3
+        max_retries: int = 3,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         JSON 형식 응답 생성
@@ -129,6 +314,7 @@ class GeminiClient:
         Args:
             prompt: 입력 프롬프트 (JSON 형식 요청 포함)
             max_retries: 최대 재시도 횟수
+            use_cache: 응답 캐시 사용 여부
 
         Returns:
             파싱된 JSON 응답
@@ -139,7 +325,7 @@ class GeminiClient:
         # JSON 형식 요청 추가
         json_prompt = f"{prompt}\n\nPlease respond with valid JSON only, no additional text."
 
-        response_text = self.generate(json_prompt, max_retries=max_retries)
+        response_text = self.generate(json_prompt, max_retries=max_retries, use_cache=use_cache)
 
         # JSON 파싱 시도
         try:
@@ -159,7 +345,8 @@ class GeminiClient:
         self,
         system_prompt: str,
         user_message: str,
-        max_retries: int = 3
+        max_retries: int = 3,
+        use_cache: bool = True
     ) -> str:
         """
         시스템 프롬프트와 사용자 메시지를 결합하여 응답 생성
@@ -168,12 +355,114 @@ class GeminiClient:
             system_prompt: 시스템 역할 프롬프트
             user_message: 사용자 메시지
             max_retries: 최대 재시도 횟수
+            use_cache: 응답 캐시 사용 여부
 
         Returns:
             생성된 응답 문자열
         """
         combined_prompt = f"{system_prompt}\n\nUser Input:\n{user_message}"
-        return self.generate(combined_prompt, max_retries=max_retries)
+        return self.generate(combined_prompt, max_retries=max_retries, use_cache=use_cache)
+
+    async def generate_with_context_async(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_retries: int = 3,
+        use_cache: bool = True
+    ) -> str:
+        """
+        generate_with_context의 비동기 버전
+
+        Args:
+            system_prompt: 시스템 역할 프롬프트
+            user_message: 사용자 메시지
+            max_retries: 최대 재시도 횟수
+            use_cache: 응답 캐시 사용 여부
+
+        Returns:
+            생성된 응답 문자열
+        """
+        combined_prompt = f"{system_prompt}\n\nUser Input:\n{user_message}"
+        return await self.generate_async(combined_prompt, max_retries=max_retries, use_cache=use_cache)
+
+    async def generate_with_context_stream_async(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_retries: int = 3,
+        use_cache: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        generate_with_context의 스트리밍 버전
+
+        Args:
+            system_prompt: 시스템 역할 프롬프트
+            user_message: 사용자 메시지
+            max_retries: 최대 재시도 횟수
+            use_cache: 응답 캐시 사용 여부
+
+        Yields:
+            응답 텍스트 청크
+        """
+        combined_prompt = f"{system_prompt}\n\nUser Input:\n{user_message}"
+        async for chunk in self.generate_stream_async(
+            combined_prompt, max_retries=max_retries, use_cache=use_cache
+        ):
+            yield chunk
+
+    def _lookup_cache(self, prompt: str, use_cache: bool):
+        """
+        응답 캐시 조회
+
+        Args:
+            prompt: 입력 프롬프트
+            use_cache: 캐시 사용 여부
+
+        Returns:
+            (캐시 키 또는 None, 캐시된 응답 또는 None)
+        """
+        if not use_cache or self.cache is None:
+            return None, None
+        cache_key = self.cache.make_key(self.model_name, self.temperature, prompt)
+        return cache_key, self.cache.get(cache_key)
+
+    def is_healthy(self, max_consecutive_failures: int = 5) -> bool:
+        """
+        클라이언트 사용 가능 여부 확인
+
+        Args:
+            max_consecutive_failures: 허용하는 최대 연속 실패 횟수
+
+        Returns:
+            종료되지 않았고 연속 실패가 한도 미만이면 True
+        """
+        return not self.closed and self.consecutive_failures < max_consecutive_failures
+
+    def close(self) -> None:
+        """클라이언트 종료 (HTTP 연결 풀 해제)"""
+        if self.closed:
+            return
+        self.closed = True
+        _close_http_client(self.client)
+
+    def close_when_released(self) -> None:
+        """
+        진행 중인 호출이 끝난 뒤 종료 (레지스트리에서 교체된 클라이언트용)
+
+        다른 스레드가 아직 이 인스턴스로 요청 중일 수 있으므로 바로 닫지 않고,
+        인스턴스에 대한 참조가 모두 사라질 때 HTTP 연결 풀을 해제합니다.
+        """
+        if not self.closed:
+            weakref.finalize(self, _close_http_client, self.client)
+
+
+def _close_http_client(client: Any) -> None:
+    """Gemini SDK 클라이언트의 HTTP 연결 풀 해제 (close가 없거나 실패하면 무시)"""
+    if client is not None and hasattr(client, "close"):
+        try:
+            client.close()
+        except Exception as e:
+            print(f"⚠️ Failed to close Gemini client: {e}")
 
 
 class DummyGeminiClient:
@@ -186,6 +475,7 @@ class DummyGeminiClient:
     def __init__(self):
         """초기화"""
         self.model_name = "gemini-3-pro-dummy"
+        self.closed = False
         print("⚠️ Using DummyGeminiClient - responses will be simulated")
 
     def generate(self, prompt: str, **kwargs) -> str:
@@ -208,19 +498,71 @@ class DummyGeminiClient:
         """더미 컨텍스트 응답 생성"""
         return f"Dummy response to: {user_message[:50]}..."
 
+    async def generate_async(self, prompt: str, **kwargs) -> str:
+        """더미 비동기 응답 생성"""
+        return self.generate(prompt, **kwargs)
+
+    async def generate_with_context_async(
+        self,
+        system_prompt: str,
+        user_message: str,
+        **kwargs
+    ) -> str:
+        """더미 비동기 컨텍스트 응답 생성"""
+        return self.generate_with_context(system_prompt, user_message, **kwargs)
+
+    async def generate_stream_async(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """더미 스트리밍 응답 생성 (단어 단위 청크)"""
+        for chunk in re.findall(r"\s*\S+", self.generate(prompt, **kwargs)):
+            yield chunk
 
-def get_gemini_client() -> GeminiClient:
+    async def generate_with_context_stream_async(
+        self,
+        system_prompt: str,
+        user_message: str,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """더미 스트리밍 컨텍스트 응답 생성 (단어 단위 청크)"""
+        response = self.generate_with_context(system_prompt, user_message, **kwargs)
+        for chunk in re.findall(r"\s*\S+", response):
+            yield chunk
+
+    def is_healthy(self, **kwargs) -> bool:
+        """더미 헬스 체크"""
+        return not self.closed
+
+    def close(self) -> None:
+        """더미 종료"""
+        self.closed = True
+
+    def close_when_released(self) -> None:
+        """더미 종료 (해제할 연결이 없으므로 바로 종료)"""
+        self.close()
+
+
+def get_gemini_client(
+    api_key: Optional[str] = None,
+    model_name: Optional[str] = None,
+    temperature: Optional[float] = None
+) -> GeminiClient:
     """
-    Gemini 클라이언트 인스턴스 가져오기
+    Gemini 클라이언트 인스턴스 생성
 
     API 키가 설정되어 있으면 실제 클라이언트를,
     없으면 더미 클라이언트를 반환합니다.
+    매 호출마다 새 인스턴스를 만들므로, 에이전트에서는
+    client_registry.get_llm_client()로 공유 인스턴스를 사용합니다.
+
+    Args:
+        api_key: Google API 키
+        model_name: 모델명
+        temperature: 샘플링 온도
 
     Returns:
         GeminiClient 또는 DummyGeminiClient 인스턴스
     """
     try:
-        return GeminiClient()
+        return GeminiClient(api_key=api_key, model_name=model_name, temperature=temperature)
     except ValueError as e:
         print(f"⚠️ {e}")
         print("⚠️ Falling back to DummyGeminiClient")
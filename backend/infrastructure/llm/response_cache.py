@@ -0,0 +1,207 @@
+"""LLM Response Cache - 정규화된 프롬프트 기반 응답 캐시"""
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from config.settings import settings
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    캐시 키용 프롬프트 정규화 (앞뒤 공백 제거, 연속 공백/줄바꿈을 한 칸으로)
+
+    Args:
+        prompt: 원본 프롬프트
+
+    Returns:
+        정규화된 프롬프트
+    """
+    return " ".join((prompt or "").split())
+
+
+class LLMResponseCache:
+    """
+    LLM 응답 캐시 (content-addressed)
+
+    (모델, temperature, 정규화된 프롬프트)의 SHA-256 해시를 키로 응답을 저장합니다.
+    1차는 인메모리 LRU, db_path가 주어지면 2차로 SQLite 디스크 캐시를 사용하여
+    프로세스 재시작 후에도 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl_seconds: Optional[float] = 3600,
+        db_path: Optional[str] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        캐시 초기화
+
+        Args:
+            max_entries: 인메모리 최대 항목 수
+            ttl_seconds: 항목 유효 시간 (초, None이면 만료 없음)
+            db_path: SQLite 디스크 캐시 경로 (None이면 메모리만 사용)
+            clock: 시간 함수 (테스트용)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+
+        # key → (응답, 저장 시각)
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            if db_path != ":memory:":
+                Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+        # 메트릭
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model_name: str, temperature: float, prompt: str) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            model_name: 모델명
+            temperature: 샘플링 온도
+            prompt: 프롬프트 (정규화 전)
+
+        Returns:
+            SHA-256 16진수 문자열
+        """
+        raw = f"{model_name}\x1f{temperature}\x1f{normalize_prompt(prompt)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회 (메모리 → 디스크 순)
+
+        Args:
+            key: make_key()로 만든 키
+
+        Returns:
+            캐시된 응답 또는 None
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._is_expired(entry[1], now):
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return entry[0]
+                del self._memory[key]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and not self._is_expired(row[1], now):
+                    # 디스크 적중 항목은 메모리로 승격
+                    self._put_memory(key, row[0], row[1])
+                    self.disk_hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, response: str) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: make_key()로 만든 키
+            response: LLM 응답
+        """
+        now = self._clock()
+        with self._lock:
+            self._put_memory(key, response, now)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, response, now)
+                )
+                self._conn.commit()
+
+    def clear(self) -> None:
+        """모든 캐시 항목 삭제 (메트릭 유지)"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_cache")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        캐시 메트릭 조회
+
+        Returns:
+            적중/실패 횟수, 항목 수, 적중률
+        """
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            total = hits + self.misses
+            return {
+                "hits": hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._memory),
+                "hit_rate": round(hits / total, 4) if total else 0.0,
+            }
+
+    def close(self) -> None:
+        """디스크 캐시 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        """TTL 경과 여부"""
+        return bool(self.ttl_seconds) and now - created_at > self.ttl_seconds
+
+    def _put_memory(self, key: str, response: str, created_at: float) -> None:
+        """메모리 LRU에 저장 (락 보유 상태에서 호출)"""
+        self._memory[key] = (response, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+# 전역 공유 캐시 (비활성화 시 None)
+_shared_cache: Optional[LLMResponseCache] = (
+    LLMResponseCache(
+        max_entries=settings.llm_cache_max_entries,
+        ttl_seconds=settings.llm_cache_ttl or None,
+        db_path=settings.llm_cache_db_path or None
+    )
+    if settings.llm_cache_enabled else None
+)
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """
+    전역 LLM 응답 캐시 가져오기
+
+    Returns:
+        LLMResponseCache 인스턴스 (settings.llm_cache_enabled가 False면 None)
+    """
+    return _shared_cache
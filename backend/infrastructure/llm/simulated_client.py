@@ -0,0 +1,470 @@
+"""Simulated LLM Client - 오프라인 부하 테스트용 LLM 시뮬레이터"""
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from config.settings import settings
+from backend.infrastructure.llm.response_cache import LLMResponseCache, get_response_cache
+from backend.utils.tracing import record_llm_call
+
+# 상대 경로 시나리오 디렉토리의 기준 (저장소 루트)
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# 프롬프트 종류 판별 마커
+_CONSULTANT_MARKER = "Already collected information"
+_JUDGE_MARKER = "SRS 작성 가능 여부"
+_HINT_MARKER = "인라인 예시"
+
+# 스트리밍 시 첫 청크 전에 소비하는 지연 비율 (나머지는 청크 사이에 분배)
+_FIRST_TOKEN_SHARE = 0.3
+
+# 답변 포함 여부 판단에 사용하는 답변 앞부분 길이
+_ANSWER_PREFIX_CHARS = 20
+
+
+class SimulatedLLMError(Exception):
+    """시뮬레이션된 LLM API 오류"""
+
+
+class SimulatedRateLimitError(SimulatedLLMError):
+    """시뮬레이션된 rate limit 응답 (429 RESOURCE_EXHAUSTED)"""
+
+
+class SimulatedLLMClient:
+    """
+    시나리오 기반 LLM 시뮬레이터 (네트워크 없이 전체 백엔드 부하 테스트용)
+
+    demo_data/scenario_*.json의 예상 질문/답변을 재생하여 Consultant 질문,
+    Judge 판정, 예시 힌트를 실제 LLM과 같은 텍스트 형식으로 반환합니다.
+    응답 내용은 프롬프트에 대해 결정적이며, 지연 시간/오류/rate limit은
+    고정 seed의 난수로 주입합니다.
+
+    GeminiClient와 같은 메서드, 재시도, 응답 캐시, 헬스 체크 동작을 제공하므로
+    settings.llm_backend="simulator"로 그대로 교체할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        temperature: Optional[float] = None,
+        scenario_dir: Optional[str] = None,
+        latency_ms: Optional[float] = None,
+        latency_distribution: Optional[str] = None,
+        latency_spread: Optional[float] = None,
+        error_rate: Optional[float] = None,
+        rate_limit_rate: Optional[float] = None,
+        seed: Optional[int] = None,
+        cache: Optional[LLMResponseCache] = None
+    ):
+        """
+        시뮬레이터 초기화 (None인 인자는 settings 값 사용)
+
+        Args:
+            model_name: 모델명 (캐시 키에만 사용)
+            temperature: 샘플링 온도 (캐시 키에만 사용)
+            scenario_dir: 시나리오 JSON 디렉토리
+            latency_ms: 호출당 지연 시간 중앙값 (밀리초)
+            latency_distribution: 지연 분포 (fixed, uniform, lognormal)
+            latency_spread: 분포 폭 (uniform은 중앙값 대비 비율, lognormal은 sigma)
+            error_rate: 호출당 API 오류 확률 (0.0 ~ 1.0)
+            rate_limit_rate: 호출당 rate limit 응답 확률 (0.0 ~ 1.0)
+            seed: 난수 seed
+            cache: 응답 캐시 (None이면 전역 캐시)
+        """
+        self.model_name = model_name or settings.model_name
+        self.temperature = settings.temperature if temperature is None else temperature
+        self.latency_ms = settings.llm_sim_latency_ms if latency_ms is None else latency_ms
+        self.latency_distribution = latency_distribution or settings.llm_sim_latency_distribution
+        self.latency_spread = settings.llm_sim_latency_spread if latency_spread is None else latency_spread
+        self.error_rate = settings.llm_sim_error_rate if error_rate is None else error_rate
+        self.rate_limit_rate = settings.llm_sim_rate_limit_rate if rate_limit_rate is None else rate_limit_rate
+
+        if self.latency_distribution not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {self.latency_distribution}")
+
+        self.scenarios = load_scenarios(scenario_dir or settings.llm_sim_scenario_dir)
+        self.cache = cache if cache is not None else get_response_cache()
+
+        self._random = random.Random(settings.llm_sim_seed if seed is None else seed)
+        self._lock = threading.Lock()
+
+        # 헬스 체크용 상태 (GeminiClient와 동일)
+        self.consecutive_failures = 0
+        self.closed = False
+
+        # 주입 통계
+        self.calls = 0
+        self.injected_errors = 0
+        self.injected_rate_limits = 0
+
+    # ------------------------------------------------------------------
+    # GeminiClient 호환 인터페이스
+    # ------------------------------------------------------------------
+
+    def generate(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        use_cache: bool = True
+    ) -> str:
+        """
+        텍스트 응답 생성 (지연 시간 동안 블로킹)
+
+        Args:
+            prompt: 입력 프롬프트
+            max_retries: 최대 재시도 횟수
+            retry_delay: 재시도 간 대기 시간 (초)
+            use_cache: 응답 캐시 사용 여부
+
+        Returns:
+            시뮬레이션된 응답 문자열
+
+        Raises:
+            Exception: 주입된 오류로 모든 재시도가 실패한 경우
+        """
+        cache_key, cached = self._lookup_cache(prompt, use_cache)
+        if cached is not None:
+            record_llm_call(prompt, cached, attempts=0, cache_hit=True)
+            return cached
+
+        for attempt in range(max_retries):
+            latency, error = self._draw_attempt()
+            time.sleep(latency)
+            try:
+                return self._complete(prompt, error, cache_key, attempt + 1)
+            except SimulatedLLMError as e:
+                if attempt < max_retries - 1:
+                    time.sleep(retry_delay * (attempt + 1))
+                    continue
+                # 재시도를 모두 소진한 호출만 연속 실패로 집계 (GeminiClient와 같음)
+                self.consecutive_failures += 1
+                record_llm_call(prompt, None, attempts=max_retries)
+                raise Exception(f"Gemini API failed after {max_retries} attempts: {e}")
+
+    async def generate_async(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        use_cache: bool = True
+    ) -> str:
+        """
+        텍스트 응답 비동기 생성 (지연 시간 동안 이벤트 루프를 블로킹하지 않음)
+
+        Args:
+            prompt: 입력 프롬프트
+            max_retries: 최대 재시도 횟수
+            retry_delay: 재시도 간 대기 시간 (초)
+            use_cache: 응답 캐시 사용 여부
+
+        Returns:
+            시뮬레이션된 응답 문자열
+        """
+        cache_key, cached = self._lookup_cache(prompt, use_cache)
+        if cached is not None:
+            record_llm_call(prompt, cached, attempts=0, cache_hit=True)
+            return cached
+
+        for attempt in range(max_retries):
+            latency, error = self._draw_attempt()
+            await asyncio.sleep(latency)
+            try:
+                return self._complete(prompt, error, cache_key, attempt + 1)
+            except SimulatedLLMError as e:
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay * (attempt + 1))
+                    continue
+                self.consecutive_failures += 1
+                record_llm_call(prompt, None, attempts=max_retries)
+                raise Exception(f"Gemini API failed after {max_retries} attempts: {e}")
+
+    async def generate_stream_async(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        use_cache: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        텍스트 응답 스트리밍 생성 (지연 시간을 첫 청크 대기와 청크 간격으로 분배)
+
+        Args:
+            prompt: 입력 프롬프트
+            max_retries: 최대 재시도 횟수
+            retry_delay: 재시도 간 대기 시간 (초)
+            use_cache: 응답 캐시 사용 여부
+
+        Yields:
+            응답 텍스트 청크
+        """
+        cache_key, cached = self._lookup_cache(prompt, use_cache)
+        if cached is not None:
+            record_llm_call(prompt, cached, attempts=0, cache_hit=True)
+            yield cached
+            return
+
+        for attempt in range(max_retries):
+            latency, error = self._draw_attempt()
+            await asyncio.sleep(latency * _FIRST_TOKEN_SHARE)
+            try:
+                response_text = self._complete(prompt, error, cache_key, attempt + 1)
+            except SimulatedLLMError as e:
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay * (attempt + 1))
+                    continue
+                self.consecutive_failures += 1
+                record_llm_call(prompt, None, attempts=max_retries)
+                raise Exception(f"Gemini API failed after {max_retries} attempts: {e}")
+
+            chunks = re.findall(r"\s*\S+", response_text) or [response_text]
+            chunk_delay = latency * (1 - _FIRST_TOKEN_SHARE) / len(chunks)
+            for index, chunk in enumerate(chunks):
+                if index:
+                    await asyncio.sleep(chunk_delay)
+                yield chunk
+            return
+
+    def generate_json(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        JSON 형식 응답 생성
+
+        Args:
+            prompt: 입력 프롬프트
+            max_retries: 최대 재시도 횟수
+            use_cache: 응답 캐시 사용 여부
+
+        Returns:
+            시뮬레이션된 JSON 응답
+        """
+        response_text = self.generate(prompt, max_retries=max_retries, use_cache=use_cache)
+        return {"response": response_text}
+
+    def generate_with_context(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_retries: int = 3,
+        use_cache: bool = True
+    ) -> str:
+        """시스템 프롬프트와 사용자 메시지를 결합하여 응답 생성"""
+        combined_prompt = f"{system_prompt}\n\nUser Input:\n{user_message}"
+        return self.generate(combined_prompt, max_retries=max_retries, use_cache=use_cache)
+
+    async def generate_with_context_async(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_retries: int = 3,
+        use_cache: bool = True
+    ) -> str:
+        """generate_with_context의 비동기 버전"""
+        combined_prompt = f"{system_prompt}\n\nUser Input:\n{user_message}"
+        return await self.generate_async(combined_prompt, max_retries=max_retries, use_cache=use_cache)
+
+    async def generate_with_context_stream_async(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_retries: int = 3,
+        use_cache: bool = True
+    ) -> AsyncIterator[str]:
+        """generate_with_context의 스트리밍 버전"""
+        combined_prompt = f"{system_prompt}\n\nUser Input:\n{user_message}"
+        async for chunk in self.generate_stream_async(
+            combined_prompt, max_retries=max_retries, use_cache=use_cache
+        ):
+            yield chunk
+
+    def is_healthy(self, max_consecutive_failures: int = 5) -> bool:
+        """종료되지 않았고 연속 실패가 한도 미만이면 True"""
+        return not self.closed and self.consecutive_failures < max_consecutive_failures
+
+    def close(self) -> None:
+        """시뮬레이터 종료"""
+        self.closed = True
+
+    def close_when_released(self) -> None:
+        """시뮬레이터 종료 (해제할 연결이 없으므로 바로 종료)"""
+        self.close()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        주입 통계 조회
+
+        Returns:
+            호출 횟수, 주입된 오류/rate limit 횟수
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "injected_errors": self.injected_errors,
+                "injected_rate_limits": self.injected_rate_limits,
+            }
+
+    # ------------------------------------------------------------------
+    # 응답 생성
+    # ------------------------------------------------------------------
+
+    def respond(self, prompt: str) -> str:
+        """
+        프롬프트에 대한 결정적 응답 생성 (지연/오류 주입 없음)
+
+        Args:
+            prompt: 입력 프롬프트
+
+        Returns:
+            시뮬레이션된 응답 문자열
+        """
+        scenario = self._match_scenario(prompt)
+
+        if _HINT_MARKER in prompt:
+            return self._respond_hint(prompt, scenario)
+        if _JUDGE_MARKER in prompt:
+            return self._respond_judge(prompt, scenario)
+        if _CONSULTANT_MARKER in prompt:
+            return self._respond_consultant(prompt, scenario)
+        return "요청하신 내용을 확인했습니다."
+
+    def _respond_consultant(self, prompt: str, scenario: Dict[str, Any]) -> str:
+        """아직 묻지 않은 다음 예상 질문 반환"""
+        asked = set(re.findall(r"^Already asked: (.+)$", prompt, flags=re.MULTILINE))
+        for item in scenario["expected_questions"]:
+            if item["question"] not in asked:
+                return item["question"]
+        return "추가로 고려해야 할 기술적 요구사항이 있나요?"
+
+    def _respond_judge(self, prompt: str, scenario: Dict[str, Any]) -> str:
+        """예상 답변이 모두 수집되었으면 approve, 아니면 reject"""
+        expected = scenario["expected_questions"]
+        answered = sum(
+            1 for item in expected
+            if item["answer"][:_ANSWER_PREFIX_CHARS] in prompt
+        )
+        score = round(answered / len(expected), 2) if expected else 1.0
+
+        if answered >= len(expected):
+            return (
+                "decision: approve\n"
+                f"completeness_score: {score}\n"
+                "충분한 정보가 수집되었습니다. SRS 문서를 생성할 수 있습니다."
+            )
+        return (
+            "decision: reject\n"
+            f"completeness_score: {score}\n"
+            f"현재 {answered}개 답변 수집됨. {len(expected) - answered}개 정보가 추가로 필요합니다."
+        )
+
+    def _respond_hint(self, prompt: str, scenario: Dict[str, Any]) -> str:
+        """질문에 대응하는 예상 답변을 예시 힌트 형식으로 반환"""
+        match = re.search(r"^질문: (.+)$", prompt, flags=re.MULTILINE)
+        question = match.group(1).strip() if match else ""
+        # 힌트 프롬프트에는 초기 입력이 없으므로 모든 시나리오에서 질문 검색
+        for candidate in [scenario] + self.scenarios:
+            for item in candidate["expected_questions"]:
+                if item["question"] == question:
+                    example = item["answer"].split(".")[0]
+                    return f"💡 예: {example} 등"
+        return "💡 예: 구체적인 요구사항이나 선호하는 방식 등"
+
+    def _match_scenario(self, prompt: str) -> Dict[str, Any]:
+        """프롬프트에 초기 입력 첫 줄이 포함된 시나리오 선택 (없으면 프롬프트 길이로 결정적 선택)"""
+        for scenario in self.scenarios:
+            if scenario["fingerprint"] in prompt:
+                return scenario
+        return self.scenarios[len(prompt) % len(self.scenarios)]
+
+    # ------------------------------------------------------------------
+    # 지연/오류 주입
+    # ------------------------------------------------------------------
+
+    def _draw_attempt(self):
+        """
+        한 번의 API 호출에 대한 지연 시간과 주입 오류 추첨
+
+        Returns:
+            (지연 시간 초, 주입할 예외 또는 None)
+        """
+        with self._lock:
+            self.calls += 1
+            median = self.latency_ms / 1000.0
+            if self.latency_distribution == "fixed" or median <= 0:
+                latency = max(median, 0.0)
+            elif self.latency_distribution == "uniform":
+                spread = median * self.latency_spread
+                latency = max(self._random.uniform(median - spread, median + spread), 0.0)
+            else:
+                latency = self._random.lognormvariate(0.0, self.latency_spread) * median
+
+            roll = self._random.random()
+            if roll < self.rate_limit_rate:
+                self.injected_rate_limits += 1
+                return latency, SimulatedRateLimitError("429 RESOURCE_EXHAUSTED: simulated rate limit")
+            if roll < self.rate_limit_rate + self.error_rate:
+                self.injected_errors += 1
+                return latency, SimulatedLLMError("503 UNAVAILABLE: simulated API error")
+            return latency, None
+
+    def _complete(
+        self,
+        prompt: str,
+        error: Optional[Exception],
+        cache_key: Optional[str],
+        attempts: int
+    ) -> str:
+        """주입 오류가 있으면 발생시키고, 없으면 응답 생성 후 캐시에 저장"""
+        if error is not None:
+            raise error
+
+        self.consecutive_failures = 0
+        response_text = self.respond(prompt)
+        if cache_key is not None:
+            self.cache.set(cache_key, response_text)
+        record_llm_call(prompt, response_text, attempts=attempts)
+        return response_text
+
+    def _lookup_cache(self, prompt: str, use_cache: bool):
+        """응답 캐시 조회 (GeminiClient와 같은 키 사용)"""
+        if not use_cache or self.cache is None:
+            return None, None
+        cache_key = self.cache.make_key(self.model_name, self.temperature, prompt)
+        return cache_key, self.cache.get(cache_key)
+
+
+def load_scenarios(scenario_dir: str) -> List[Dict[str, Any]]:
+    """
+    시나리오 JSON 로드
+
+    Args:
+        scenario_dir: scenario_*.json이 있는 디렉토리 (상대 경로는 저장소 루트 기준)
+
+    Returns:
+        시나리오 리스트 (fingerprint: 초기 입력 첫 줄 추가)
+
+    Raises:
+        ValueError: 시나리오 파일이 없는 경우
+    """
+    directory = Path(scenario_dir)
+    if not directory.is_absolute():
+        directory = _PROJECT_ROOT / directory
+
+    paths = sorted(directory.glob("scenario_*.json"))
+    if not paths:
+        raise ValueError(f"No scenario files found in {scenario_dir}")
+
+    scenarios = []
+    for path in paths:
+        scenario = json.loads(path.read_text(encoding="utf-8"))
+        scenario["fingerprint"] = scenario["initial_input"].strip().splitlines()[0]
+        scenarios.append(scenario)
+    return scenarios
@@ -1,4 +1,9 @@
-"""Dummy Checkpointer"""
+"""Checkpointer - 워크플로우 체크포인트 저장소"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
 from typing import Any, Optional, Dict
 
 
@@ -53,3 +58,96 @@ class DummyCheckpointer:
     def clear_all(self) -> None:
         """모든 체크포인트 삭제"""
         self._storage.clear()
+
+
+class SQLiteCheckpointer:
+    """
+    SQLite 기반 체크포인터 (영속 저장)
+
+    DummyCheckpointer와 같은 save/load/delete/clear_all 인터페이스를 제공하며,
+    상태는 JSON으로 직렬화할 수 있어야 합니다. 프로세스가 죽어도 체크포인트가 남으므로
+    다음 요청에서 중단된 워크플로우를 이어서 실행할 수 있습니다.
+    """
+
+    def __init__(self, db_path: str = "data/checkpoints.db"):
+        """
+        초기화
+
+        Args:
+            db_path: SQLite DB 파일 경로 (":memory:" 가능)
+        """
+        self.db_path = db_path
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "session_id TEXT PRIMARY KEY, "
+            "state TEXT NOT NULL, "
+            "updated_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def save(self, session_id: str, state: Any) -> bool:
+        """
+        체크포인트 저장
+
+        Args:
+            session_id: 세션 ID
+            state: 저장할 상태 (JSON 직렬화 가능)
+
+        Returns:
+            저장 성공 여부
+        """
+        try:
+            payload = json.dumps(state, ensure_ascii=False, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return False
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (session_id, state, updated_at) VALUES (?, ?, ?)",
+                (session_id, payload, time.time())
+            )
+        return True
+
+    def load(self, session_id: str) -> Optional[Any]:
+        """
+        체크포인트 로드
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            저장된 상태 또는 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM checkpoints WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, session_id: str) -> bool:
+        """
+        체크포인트 삭제
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            삭제 성공 여부
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM checkpoints WHERE session_id = ?", (session_id,))
+        return cursor.rowcount > 0
+
+    def clear_all(self) -> None:
+        """모든 체크포인트 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM checkpoints")
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
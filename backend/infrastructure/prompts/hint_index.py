@@ -0,0 +1,365 @@
+"""Example Hint Index - 질문별 "💡 예:" 힌트 사전 색인"""
+import json
+import math
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from backend.utils.logger import setup_logger
+from config.settings import settings
+
+logger = setup_logger(__name__)
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# 자주 나오는 질문의 키워드 → 예시 힌트 (위에서부터 먼저 일치하는 규칙 사용)
+RULE_HINTS: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("인증", "로그인"), "💡 예: 이메일/비밀번호, 카카오 로그인, 구글 로그인, 네이버 로그인 등"),
+    (("결제", "pg", "페이먼트"), "💡 예: 토스페이먼츠, KG이니시스, 카카오페이, 네이버페이 등"),
+    (("배포", "서버", "클라우드"), "💡 예: AWS, GCP, Azure, 네이버 클라우드, 온프레미스 등"),
+    (("배송", "택배", "물류"), "💡 예: 당일 배송, 익일 배송, 무료 배송(조건부), 배송비 3000원 등"),
+    (("규모", "사용자", "트래픽"), "💡 예: 월 1만명, 일 1000명, 동시 접속 100명 등"),
+    (("데이터베이스", "db", "저장"), "💡 예: PostgreSQL, MySQL, MongoDB, Redis 등"),
+    (("모바일", "앱"), "💡 예: iOS/Android 네이티브, React Native, Flutter 등"),
+    (("알림", "notification"), "💡 예: 푸시 알림, 이메일, SMS, 카카오톡 알림톡 등"),
+)
+
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+
+# 시나리오 답변 → 예시 구절 (소수점은 문장 끝으로 보지 않음)
+_SENTENCE_END = re.compile(r"\.(?!\d)")
+_CLAUSE_END = re.compile(r"(?<=[고며되서]),\s")
+_PREDICATE = re.compile(r"(?:다|요|고|되|서|야|으면|할|하는|싶은|예정|수|볼)$")
+_PARTICLE = re.compile(r"(?:으로|에서|로|을|를|에|은|는|이며)$")
+
+
+def normalize_question(question: str) -> str:
+    """
+    색인 키용 질문 정규화 (소문자, 공백/문장부호 제거)
+
+    Args:
+        question: 질문 문자열
+
+    Returns:
+        정규화된 질문
+    """
+    return _NON_WORD.sub("", (question or "").lower())
+
+
+def _bigrams(text: str) -> Set[str]:
+    """정규화된 문자열의 문자 bigram 집합"""
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def rule_based_hint(question: str) -> Optional[str]:
+    """
+    키워드 규칙으로 예시 힌트 찾기
+
+    Args:
+        question: 질문 문자열
+
+    Returns:
+        예시 힌트 (일치하는 규칙이 없으면 None)
+    """
+    question_lower = (question or "").lower()
+    for keywords, hint in RULE_HINTS:
+        if any(keyword in question_lower for keyword in keywords):
+            return hint
+    return None
+
+
+def scenario_example(answer: str) -> str:
+    """
+    시나리오 답변에서 예시 구절 추출
+
+    첫 문장의 첫 절에서 서술어와 끝 조사를 떼어 냅니다.
+    (예: "AWS 클라우드에 배포하고, Docker로 패키징할 예정입니다." → "AWS 클라우드")
+
+    Args:
+        answer: 1인칭 시나리오 답변
+
+    Returns:
+        예시 구절 (없으면 빈 문자열)
+    """
+    sentence = _SENTENCE_END.split(answer or "", 1)[0].strip()
+    words = _CLAUSE_END.split(sentence, 1)[0].split()
+    while len(words) > 1 and _PREDICATE.search(words[-1]):
+        words.pop()
+    phrase = " ".join(words)
+    return _PARTICLE.sub("", phrase) or phrase
+
+
+class HintIndex:
+    """
+    질문 → 예시 힌트 색인
+
+    키워드 규칙, 데모 시나리오, 이전에 LLM으로 생성한 힌트를 미리 색인해 두고
+    정규화된 질문 완전 일치 또는 문자 bigram Jaccard 유사도로 힌트를 찾습니다.
+    색인에 없는 질문은 백그라운드에서 LLM으로 힌트를 만들어 다음 조회부터 사용합니다.
+
+    유사도 비교는 드문 bigram을 공유하는 질문 중 최대 max_candidates개로 제한하므로,
+    학습한 힌트가 늘어나도 조회 1회 비용은 색인 크기가 아니라 이 상한에 비례합니다.
+    """
+
+    def __init__(
+        self,
+        min_similarity: float = 0.5,
+        path: Optional[str] = None,
+        max_candidates: int = 32
+    ):
+        """
+        색인 초기화
+
+        Args:
+            min_similarity: 유사 질문으로 인정할 최소 Jaccard 유사도
+            path: LLM으로 생성한 힌트를 보관할 JSON 파일 경로 (None이면 메모리만 사용)
+            max_candidates: 조회 1회에 유사도를 계산할 최대 후보 질문 수
+        """
+        self.min_similarity = min_similarity
+        self.path = Path(path) if path else None
+        self.max_candidates = max_candidates
+
+        # 정규화된 질문 → (힌트, 출처)
+        self._exact: Dict[str, Tuple[str, str]] = {}
+        self._grams: Dict[str, Set[str]] = {}
+        # bigram → 정규화된 질문 (후보 검색용 역색인)
+        self._postings: Dict[str, Set[str]] = {}
+        self._learned: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        self._pending: Set[str] = set()
+        self._fill_pool: Optional[ThreadPoolExecutor] = None
+
+        # 메트릭
+        self.hits = 0
+        self.misses = 0
+        self.fills = 0
+
+        if self.path and self.path.exists():
+            try:
+                learned = json.loads(self.path.read_text(encoding="utf-8"))
+                for question, hint in learned.items():
+                    self.add(question, hint, source="learned")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to load hint index {self.path}: {e}")
+
+    def add(self, question: str, hint: str, source: str = "manual") -> None:
+        """
+        질문과 힌트 색인
+
+        Args:
+            question: 질문 문자열
+            hint: "💡 예:" 힌트
+            source: 출처 (scenario, learned 등)
+        """
+        key = normalize_question(question)
+        if not key or not hint:
+            return
+        grams = _bigrams(key)
+        with self._lock:
+            self._exact[key] = (hint, source)
+            self._grams[key] = grams
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(key)
+            if source == "learned":
+                self._learned[question] = hint
+
+    def load_scenarios(self, scenario_dir: str) -> int:
+        """
+        데모 시나리오의 질문/답변을 힌트로 색인 (답변 첫 문장의 예시 구절을 사용)
+
+        Args:
+            scenario_dir: 시나리오 JSON 디렉토리 (상대 경로는 프로젝트 루트 기준)
+
+        Returns:
+            색인한 질문 수
+        """
+        directory = Path(scenario_dir)
+        if not directory.is_absolute():
+            directory = _PROJECT_ROOT / directory
+
+        count = 0
+        for path in sorted(directory.glob("scenario_*.json")):
+            scenario = json.loads(path.read_text(encoding="utf-8"))
+            for item in scenario.get("expected_questions", []):
+                example = scenario_example(item["answer"])
+                if example:
+                    self.add(item["question"], f"💡 예: {example} 등", source="scenario")
+                    count += 1
+        return count
+
+    def lookup(self, question: str) -> Optional[str]:
+        """
+        질문에 맞는 힌트 찾기 (규칙 → 완전 일치 → bigram 유사도 순)
+
+        Args:
+            question: 질문 문자열
+
+        Returns:
+            예시 힌트 (없으면 None)
+        """
+        hint = rule_based_hint(question) or self._match(normalize_question(question))
+        with self._lock:
+            if hint:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return hint
+
+    def _match(self, key: str) -> Optional[str]:
+        """정규화된 질문의 완전 일치 또는 가장 유사한 색인 질문의 힌트"""
+        if not key:
+            return None
+        grams = _bigrams(key)
+        with self._lock:
+            exact = self._exact.get(key)
+            if exact:
+                return exact[0]
+
+            # 유사도가 min_similarity 이상인 질문은 드문 순으로 정렬한 bigram 중
+            # 앞쪽 len(grams) - required + 1개 중 하나를 반드시 공유하므로 (prefix filtering)
+            # 그 bigram의 질문만 최대 max_candidates개 비교
+            required = math.ceil(self.min_similarity * len(grams))
+            by_rarity = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+            postings = (self._postings.get(gram, ()) for gram in by_rarity[:len(grams) - required + 1])
+            candidates = set(islice(chain.from_iterable(postings), self.max_candidates))
+
+            best_key, best_score = None, 0.0
+            for candidate in candidates:
+                candidate_grams = self._grams[candidate]
+                shared = len(grams & candidate_grams)
+                score = shared / (len(grams) + len(candidate_grams) - shared)
+                if score > best_score:
+                    best_key, best_score = candidate, score
+
+            if best_key is not None and best_score >= self.min_similarity:
+                return self._exact[best_key][0]
+        return None
+
+    def schedule_fill(self, question: str, generate: Callable[[str], Optional[str]]) -> bool:
+        """
+        색인에 없는 질문의 힌트를 백그라운드에서 생성하여 색인 (호출한 턴은 기다리지 않음)
+
+        Args:
+            question: 질문 문자열
+            generate: 질문 → 힌트 생성 함수 (LLM 호출, 실패 시 None)
+
+        Returns:
+            새로 예약했는지 여부 (같은 질문을 이미 생성 중이면 False)
+        """
+        key = normalize_question(question)
+        with self._lock:
+            if not key or key in self._pending:
+                return False
+            self._pending.add(key)
+            if self._fill_pool is None:
+                self._fill_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hint-fill")
+            pool = self._fill_pool
+
+        pool.submit(self._fill, key, question, generate)
+        return True
+
+    def _fill(self, key: str, question: str, generate: Callable[[str], Optional[str]]) -> None:
+        """백그라운드 힌트 생성 작업"""
+        try:
+            hint = generate(question)
+            if hint:
+                self.add(question, hint, source="learned")
+                with self._lock:
+                    self.fills += 1
+                self._persist()
+        except Exception as e:
+            logger.warning(f"Background hint fill failed: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def _persist(self) -> None:
+        """LLM으로 생성한 힌트를 JSON 파일에 저장 (임시 파일로 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        with self._lock:
+            data = dict(self._learned)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def wait_for_fills(self) -> None:
+        """진행 중인 백그라운드 힌트 생성이 끝날 때까지 대기 (테스트/종료용)"""
+        with self._lock:
+            pool, self._fill_pool = self._fill_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        색인 통계
+
+        Returns:
+            색인 질문 수, 조회 적중/실패 수, 백그라운드 생성 수
+        """
+        with self._lock:
+            return {
+                "entries": len(self._exact),
+                "hits": self.hits,
+                "misses": self.misses,
+                "fills": self.fills,
+                "pending": len(self._pending),
+            }
+
+
+def build_hint_index(
+    scenario_dir: Optional[str] = None,
+    path: Optional[str] = None,
+    min_similarity: Optional[float] = None,
+    max_candidates: Optional[int] = None
+) -> HintIndex:
+    """
+    데모 시나리오와 저장된 힌트로 색인 생성
+
+    Args:
+        scenario_dir: 시나리오 디렉토리 (None이면 settings.hint_index_scenario_dir)
+        path: 생성 힌트 JSON 경로 (None이면 settings.hint_index_path)
+        min_similarity: 최소 유사도 (None이면 settings.hint_index_min_similarity)
+        max_candidates: 조회당 최대 비교 후보 수 (None이면 settings.hint_index_max_candidates)
+
+    Returns:
+        HintIndex 인스턴스
+    """
+    index = HintIndex(
+        min_similarity=settings.hint_index_min_similarity if min_similarity is None else min_similarity,
+        path=settings.hint_index_path if path is None else path,
+        max_candidates=settings.hint_index_max_candidates if max_candidates is None else max_candidates
+    )
+    try:
+        index.load_scenarios(scenario_dir or settings.hint_index_scenario_dir)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to load hint scenarios: {e}")
+    return index
+
+
+# 전역 공유 색인 (첫 사용 시 생성)
+_hint_index: Optional[HintIndex] = None
+_hint_index_lock = threading.Lock()
+
+
+def get_hint_index() -> HintIndex:
+    """
+    전역 힌트 색인 가져오기
+
+    Returns:
+        HintIndex 인스턴스
+    """
+    global _hint_index
+    if _hint_index is None:
+        with _hint_index_lock:
+            if _hint_index is None:
+                _hint_index = build_hint_index()
+    return _hint_index
@@ -0,0 +1,222 @@
+"""Judge Context Compactor - 토큰 예산 기반 Judge 프롬프트 압축"""
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from backend.domain.models.compact_state import RESPONSE_KEY_PREFIX
+from backend.domain.models.state import PromptContext, RequirementState
+from backend.infrastructure.prompts.judge_prompt import JUDGE_USER_PROMPT
+from backend.infrastructure.prompts.prompt_builder import IncrementalPromptBuilder, get_prompt_builder
+from backend.utils.logger import setup_logger
+from backend.utils.token_utils import estimate_tokens
+from backend.utils.tracing import record_prompt_tokens_saved
+from config.settings import settings
+
+logger = setup_logger(__name__)
+
+SUMMARY_PREFIX = "[이전 대화 요약]"
+
+# collected_info와 히스토리를 뺀 Judge 사용자 프롬프트 템플릿 토큰 수
+_TEMPLATE_TOKENS = estimate_tokens(JUDGE_USER_PROMPT.format(collected_info="", conversation_history=""))
+
+
+class JudgeContextCompactor:
+    """
+    Judge 프롬프트 컨텍스트 압축기
+
+    매 턴 전체 대화와 collected_info 원본을 보내면 세션이 길어질수록 프롬프트가 커지므로
+    다음과 같이 줄입니다.
+    - 대화 히스토리: 증분 빌더의 렌더링에서 assistant 머리말/예시 힌트 제외 (오래된 턴은 빌더가 요약)
+    - collected_info: response_N 백업 중 추출된 항목 값이나 히스토리에 이미 있는 답변 제외
+    - 토큰 예산: 프롬프트 전체가 예산을 넘으면 가장 오래된 요약/턴부터 제외 (마지막 턴은 유지)
+
+    수집된 항목은 판정의 근거이므로 예산과 관계없이 유지합니다.
+    줄인 추정 토큰 수는 누적하고 judge_llm 단계의 prompt_tokens_saved로 기록합니다.
+    """
+
+    def __init__(
+        self,
+        token_budget: Optional[int] = None,
+        prompt_builder: Optional[IncrementalPromptBuilder] = None
+    ):
+        """
+        압축기 초기화
+
+        Args:
+            token_budget: Judge 사용자 프롬프트에 허용할 추정 토큰 수 (None이면 settings 값)
+            prompt_builder: 대화 히스토리 빌더 (None이면 전역 빌더)
+        """
+        self.token_budget = token_budget or settings.judge_context_token_budget
+        self.prompt_builder = prompt_builder or get_prompt_builder()
+        self._lock = threading.Lock()
+
+        # 메트릭
+        self.calls = 0
+        self.tokens_saved = 0
+
+    def build_prompt(self, state: RequirementState) -> str:
+        """
+        압축한 Judge 사용자 프롬프트 생성
+
+        Args:
+            state: 현재 요구사항 상태
+
+        Returns:
+            완성된 프롬프트
+        """
+        extracted, responses = _split_responses(state.collected_info)
+        extracted_text = str(extracted)
+
+        # 수집된 항목을 넣고 남은 예산만큼 최근 대화부터 채움
+        fixed_tokens = _TEMPLATE_TOKENS + estimate_tokens(extracted_text)
+        summary, turns = self._fit_history(state, self.token_budget - fixed_tokens)
+        history = _render_history(summary, turns)
+        collected_info = _compact_responses(extracted, responses, turns)
+        info_text = extracted_text if len(collected_info) == len(extracted) else str(collected_info)
+        prompt = JUDGE_USER_PROMPT.format(collected_info=info_text, conversation_history=history)
+
+        saved = _tokens_saved(state.prompt_context, history, collected_info)
+        with self._lock:
+            self.calls += 1
+            self.tokens_saved += saved
+        record_prompt_tokens_saved(saved)
+        logger.debug(f"Judge context compacted (saved {saved} tokens)")
+        return prompt
+
+    def stats(self) -> Dict[str, int]:
+        """압축 호출 수와 누적 절약 토큰 수"""
+        with self._lock:
+            return {"calls": self.calls, "tokens_saved": self.tokens_saved}
+
+    def _fit_history(self, state: RequirementState, budget: int) -> Tuple[List[str], List[str]]:
+        """
+        예산 안에 들어가는 대화 히스토리 (최근 턴 우선, 그다음 최근 요약 우선)
+
+        세션에 저장된 프롬프트 컨텍스트는 바꾸지 않고 이번 프롬프트에서만 제외합니다.
+        줄별 토큰 수는 빌더가 렌더링할 때 계산한 값을 사용하고, 요약은 최근 것부터 예산만큼만
+        확인하므로 비용은 대화 길이와 무관합니다.
+
+        Returns:
+            (요약 항목 리스트, 최근 턴 리스트)
+        """
+        context = self.prompt_builder.update(state)
+        recent = context.recent_turns
+        if not recent:
+            return [], []
+
+        summary_tokens = estimate_tokens(" / ".join(context.summary_items)) if context.summary_items else 0
+        if context.recent_tokens + len(recent) + summary_tokens <= budget:
+            return context.summary_items, recent
+
+        # 마지막 턴은 예산을 넘어도 유지
+        turn_tokens = context.recent_turn_tokens
+        kept = 1
+        used = turn_tokens[-1]
+        while kept < len(recent) and used + turn_tokens[-kept - 1] + 1 <= budget:
+            used += turn_tokens[-kept - 1] + 1
+            kept += 1
+
+        # 제외된 최근 턴(요약)과 기존 요약을 최근 것부터 채움
+        summary: List[str] = []
+        used += estimate_tokens(SUMMARY_PREFIX) + 1
+        summary_count = len(context.summary_items)
+        for index in range(summary_count + len(recent) - kept - 1, -1, -1):
+            if index >= summary_count:
+                item = self.prompt_builder.summarize(recent[index - summary_count])
+            else:
+                item = context.summary_items[index]
+            cost = estimate_tokens(item) + 1
+            if used + cost > budget:
+                break
+            summary.append(item)
+            used += cost
+        summary.reverse()
+
+        return summary, recent[-kept:]
+
+
+def _render_history(summary_items: List[str], recent_turns: List[str]) -> str:
+    """요약과 최근 턴으로 히스토리 문자열 구성"""
+    recent = "\n".join(recent_turns)
+    if not summary_items:
+        return recent
+    return f"{SUMMARY_PREFIX} {' / '.join(summary_items)}\n{recent}"
+
+
+def compact_collected_info(collected_info: Dict[str, Any], turns: Sequence[str] = ()) -> Dict[str, Any]:
+    """
+    collected_info에서 중복된 response_N 백업 제외
+
+    다음 백업은 Judge에 새 정보를 주지 않으므로 제외합니다.
+    - 추출된 항목 값과 같은 답변
+    - 프롬프트에 넣을 최근 대화에 사용자 메시지로 그대로 있는 답변
+    - 앞선 백업과 같은 답변
+
+    Args:
+        collected_info: 수집된 정보
+        turns: 프롬프트에 함께 넣을 최근 대화 줄 ("role: content")
+
+    Returns:
+        압축한 collected_info (원본은 변경하지 않음)
+    """
+    extracted, responses = _split_responses(collected_info)
+    return _compact_responses(extracted, responses, turns)
+
+
+def _split_responses(collected_info: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Tuple[str, Any]]]:
+    """collected_info를 추출된 항목과 response_N 백업 목록으로 분리"""
+    extracted = {}
+    responses = []
+    for key, value in collected_info.items():
+        if key.startswith(RESPONSE_KEY_PREFIX):
+            responses.append((key, value))
+        else:
+            extracted[key] = value
+    return extracted, responses
+
+
+def _compact_responses(
+    extracted: Dict[str, Any],
+    responses: List[Tuple[str, Any]],
+    turns: Sequence[str]
+) -> Dict[str, Any]:
+    """추출된 항목에 중복되지 않은 response_N 백업만 더한 collected_info"""
+    compacted = dict(extracted)
+    if not responses:
+        return compacted
+
+    seen = {str(value).strip() for value in extracted.values()}
+    shown = set(turns)
+    for key, value in responses:
+        text = str(value).strip() if value is not None else ""
+        if not text or text in seen or f"user: {value}" in shown:
+            continue
+        seen.add(text)
+        compacted[key] = value
+    return compacted
+
+
+def _tokens_saved(context: PromptContext, history: str, collected_info: Dict[str, Any]) -> int:
+    """
+    압축하지 않았을 때(전체 대화 + response_N 백업 전체)보다 줄어든 추정 토큰 수
+
+    전체 크기는 빌더가 메시지를 렌더링할 때 누적한 값을 사용하므로 대화 길이와 무관하게 계산됩니다.
+    """
+    kept_responses = sum(
+        estimate_tokens(value) for key, value in collected_info.items()
+        if key.startswith(RESPONSE_KEY_PREFIX)
+    )
+    saved = (context.transcript_tokens - estimate_tokens(history)) + (context.response_tokens - kept_responses)
+    return max(saved, 0)
+
+
+# 전역 공유 압축기
+_judge_context_compactor = JudgeContextCompactor()
+
+
+def get_judge_context_compactor() -> JudgeContextCompactor:
+    """
+    전역 Judge 컨텍스트 압축기 가져오기
+
+    Returns:
+        JudgeContextCompactor 인스턴스
+    """
+    return _judge_context_compactor
@@ -0,0 +1,166 @@
+"""Incremental Prompt Builder - 대화 히스토리 증분 렌더링"""
+from typing import Optional
+from backend.domain.models.compact_state import INITIAL_REQUEST_KEY
+from backend.domain.models.state import PromptContext, RequirementState
+from backend.infrastructure.prompts.turn_renderer import HINT_PREFIX, QUESTION_HEADER, render_prompt_turn
+from backend.utils.token_utils import estimate_tokens
+from config.settings import settings
+
+
+class IncrementalPromptBuilder:
+    """
+    대화 히스토리 프롬프트를 증분으로 구성하는 빌더
+
+    state.prompt_context에 렌더링 결과를 누적하여, 매 턴 전체 메시지를 다시 join하지 않고
+    새 메시지만 렌더링합니다. 최근 메시지가 토큰 예산을 넘으면 가장 오래된 메시지부터
+    한 줄 요약으로 옮겨 프롬프트 크기를 제한합니다.
+    """
+
+    def __init__(
+        self,
+        token_budget: Optional[int] = None,
+        summary_chars: int = 60,
+        max_summary_items: int = 20
+    ):
+        """
+        빌더 초기화
+
+        Args:
+            token_budget: 최근 메시지에 허용할 추정 토큰 수 (None이면 settings 값)
+            summary_chars: 요약 항목당 최대 글자 수
+            max_summary_items: 유지할 최대 요약 항목 수
+        """
+        self.token_budget = token_budget or settings.prompt_history_token_budget
+        self.summary_chars = summary_chars
+        self.max_summary_items = max_summary_items
+
+    def update(self, state: RequirementState) -> PromptContext:
+        """
+        아직 렌더링하지 않은 메시지를 컨텍스트에 추가
+
+        Args:
+            state: 현재 요구사항 상태
+
+        Returns:
+            갱신된 프롬프트 컨텍스트
+        """
+        context = state.prompt_context
+
+        # 메시지가 교체/축소된 경우 처음부터 다시 렌더링
+        if context.rendered_count > len(state.messages):
+            context = PromptContext()
+            state.prompt_context = context
+
+        # 줄별 토큰 수가 없는 컨텍스트 (직접 구성한 경우)는 한 번 다시 계산
+        if len(context.recent_turn_tokens) != len(context.recent_turns):
+            context.recent_turn_tokens = [estimate_tokens(line) for line in context.recent_turns]
+
+        # 카운터는 지역 변수로 누적 후 한 번에 반영 (모델 필드 대입 비용 절약)
+        initial_request = state.collected_info.get(INITIAL_REQUEST_KEY)
+        recent_tokens = transcript_tokens = response_tokens = 0
+        for msg in state.messages[context.rendered_count:]:
+            line = render_prompt_turn(msg.role, msg.content)
+            tokens = estimate_tokens(line)
+            context.recent_turns.append(line)
+            context.recent_turn_tokens.append(tokens)
+            recent_tokens += tokens
+
+            if msg.role == "assistant":
+                transcript_tokens += estimate_tokens(f"{msg.role}: {msg.content}") + 1
+                context.asked_questions.append(extract_question(msg.content))
+            else:
+                transcript_tokens += tokens + 1
+
+            # 초기 요청 외의 사용자 답변은 collected_info에 response_N으로도 백업됨
+            if msg.role == "user" and msg.content != initial_request:
+                response_tokens += estimate_tokens(msg.content)
+
+        context.recent_tokens += recent_tokens
+        context.transcript_tokens += transcript_tokens
+        context.response_tokens += response_tokens
+        context.rendered_count = len(state.messages)
+        self._compact(context)
+        return context
+
+    def judge_history(self, state: RequirementState) -> str:
+        """
+        Judge용 대화 히스토리 ("role: content", assistant 예시 힌트 제외, 오래된 턴은 요약)
+
+        Args:
+            state: 현재 요구사항 상태
+
+        Returns:
+            대화 히스토리 문자열
+        """
+        context = self.update(state)
+        recent = "\n".join(context.recent_turns)
+        if not context.summary_items:
+            return recent
+        summary = " / ".join(context.summary_items)
+        return f"[이전 대화 요약] {summary}\n{recent}"
+
+    def consultant_history(self, state: RequirementState) -> str:
+        """
+        Consultant용 히스토리 (이미 물어본 질문 목록)
+
+        Args:
+            state: 현재 요구사항 상태
+
+        Returns:
+            "Already asked: ..." 줄 목록 문자열
+        """
+        context = self.update(state)
+        return "\n".join(f"Already asked: {question}" for question in context.asked_questions)
+
+    def _compact(self, context: PromptContext) -> None:
+        """토큰 예산 초과분을 요약으로 이동"""
+        while context.recent_tokens > self.token_budget and len(context.recent_turns) > 1:
+            line = context.recent_turns.pop(0)
+            context.recent_tokens -= context.recent_turn_tokens.pop(0)
+            context.summary_items.append(self.summarize(line))
+
+        overflow = len(context.summary_items) - self.max_summary_items
+        if overflow > 0:
+            del context.summary_items[:overflow]
+
+    def summarize(self, line: str) -> str:
+        """메시지 한 줄 요약 (assistant는 질문만, 그 외는 앞부분만)"""
+        role, _, content = line.partition(": ")
+        if role == "assistant":
+            content = extract_question(content)
+        content = " ".join(content.split())
+        if len(content) > self.summary_chars:
+            content = content[:self.summary_chars] + "…"
+        return f"{role}: {content}"
+
+
+def extract_question(content: str) -> str:
+    """
+    Consultant 메시지에서 질문 본문만 추출 (머리말, 예시 힌트 제외)
+
+    Args:
+        content: assistant 메시지 내용
+
+    Returns:
+        질문 문자열
+    """
+    for line in content.split("\n"):
+        line = line.strip()
+        if not line or line == QUESTION_HEADER or line.startswith(HINT_PREFIX):
+            continue
+        return line
+    return content.strip()
+
+
+# 전역 공유 빌더
+_prompt_builder = IncrementalPromptBuilder()
+
+
+def get_prompt_builder() -> IncrementalPromptBuilder:
+    """
+    전역 프롬프트 빌더 가져오기
+
+    Returns:
+        IncrementalPromptBuilder 인스턴스
+    """
+    return _prompt_builder
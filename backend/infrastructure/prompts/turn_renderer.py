@@ -0,0 +1,38 @@
+"""Prompt Turn Renderer - Judge 히스토리용 메시지 렌더링"""
+
+# Consultant 메시지 머리말과 예시 힌트 접두사 (Judge 히스토리에서 제외)
+QUESTION_HEADER = "추가 정보가 필요합니다:"
+HINT_PREFIX = "💡"
+
+
+def strip_example_hints(content: str) -> str:
+    """
+    Consultant 메시지에서 머리말과 예시 힌트 줄 제거 (Judge 판정에 필요 없는 부분)
+
+    Args:
+        content: assistant 메시지 내용
+
+    Returns:
+        남은 줄을 공백으로 이은 문자열
+    """
+    lines = [
+        line.strip() for line in content.split("\n")
+        if line.strip() and line.strip() != QUESTION_HEADER and not line.strip().startswith(HINT_PREFIX)
+    ]
+    return " ".join(lines) if lines else content.strip()
+
+
+def render_prompt_turn(role: str, content: str) -> str:
+    """
+    Judge 히스토리용 메시지 한 줄
+
+    Args:
+        role: 메시지 역할
+        content: 메시지 내용
+
+    Returns:
+        "role: content" 문자열 (assistant는 머리말과 예시 힌트 제외)
+    """
+    if role == "assistant":
+        content = strip_example_hints(content)
+    return f"{role}: {content}"
@@ -0,0 +1,51 @@
+"""NDJSON 스트리밍 응답 유틸리티"""
+import json
+from typing import Any, AsyncIterator, Dict
+from fastapi.responses import StreamingResponse
+from backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def format_ndjson(record: Dict[str, Any]) -> str:
+    """
+    NDJSON 한 줄 생성
+
+    Args:
+        record: JSON 직렬화할 레코드
+
+    Returns:
+        개행으로 끝나는 JSON 문자열
+    """
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def ndjson_response(records: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """
+    레코드 비동기 이터레이터를 NDJSON 스트리밍 응답으로 변환
+
+    스트림 도중 예외가 발생하면 {"status": "error"} 레코드를 보내고 종료합니다.
+
+    Args:
+        records: 레코드 비동기 이터레이터
+
+    Returns:
+        application/x-ndjson StreamingResponse
+    """
+    async def body() -> AsyncIterator[str]:
+        try:
+            async for record in records:
+                yield format_ndjson(record)
+        except Exception as e:
+            logger.exception("NDJSON stream failed", exc_info=e)
+            yield format_ndjson({"status": "error", "error": str(e)})
+
+    return StreamingResponse(
+        body(),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            # 리버스 프록시 버퍼링 비활성화 (완료된 항목 즉시 전달)
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -1,5 +1,6 @@
 """Session Routes"""
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
 from backend.presentation.api.schemas.request_schemas import (
     StartSessionRequest,
     ContinueSessionRequest,
@@ -9,28 +10,37 @@ from backend.presentation.api.schemas.response_schemas import (
     SessionStatusResponse,
     CollectedInfoResponse,
     ResetResponse,
+    SessionStoreStatsResponse,
+    SessionTimingsResponse,
 )
 from backend.application.use_cases.start_session_use_case import StartSessionUseCase
 from backend.application.use_cases.continue_session_use_case import ContinueSessionUseCase
 from backend.application.use_cases.reset_session_use_case import ResetSessionUseCase
-from backend.infrastructure.graph.executor import DummyExecutor
+from backend.infrastructure.graph.executor import DummyExecutor, get_shared_repository
+from backend.presentation.api.sse import sse_response
 
 router = APIRouter(prefix="/api/session", tags=["session"])
 
 
 @router.post("/start", response_model=SessionResponse)
-def start_session(request: StartSessionRequest):
-    """세션 시작"""
+async def start_session(
+    request: StartSessionRequest,
+    idempotency_key: Optional[str] = Header(default=None, max_length=255)
+):
+    """세션 시작 (Idempotency-Key가 같은 재시도는 첫 응답을 그대로 반환)"""
     use_case = StartSessionUseCase()
-    result = use_case.execute(request.initial_input)
+    result = await use_case.execute_async(request.initial_input, idempotency_key)
     return SessionResponse(**result)
 
 
 @router.post("/continue", response_model=SessionResponse)
-def continue_session(request: ContinueSessionRequest):
-    """세션 계속"""
+async def continue_session(
+    request: ContinueSessionRequest,
+    idempotency_key: Optional[str] = Header(default=None, max_length=255)
+):
+    """세션 계속 (Idempotency-Key가 같은 재시도는 워크플로우 없이 첫 응답을 그대로 반환)"""
     use_case = ContinueSessionUseCase()
-    result = use_case.execute(request.session_id, request.user_response)
+    result = await use_case.execute_async(request.session_id, request.user_response, idempotency_key)
 
     if "error" in result:
         raise HTTPException(status_code=404, detail=result["error"])
@@ -38,6 +48,24 @@ def continue_session(request: ContinueSessionRequest):
     return SessionResponse(**result)
 
 
+@router.post("/continue/stream")
+async def continue_session_stream(request: ContinueSessionRequest):
+    """세션 계속 (SSE: consultant_token → question → judge → srs_section → done)"""
+    use_case = ContinueSessionUseCase()
+    events = use_case.stream(request.session_id, request.user_response)
+
+    if events is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return sse_response(events)
+
+
+@router.get("/stats", response_model=SessionStoreStatsResponse)
+def get_session_store_stats():
+    """세션 저장소 크기 및 제거 카운터 조회"""
+    return SessionStoreStatsResponse(**get_shared_repository().eviction_stats())
+
+
 @router.get("/{session_id}/status", response_model=SessionStatusResponse)
 def get_session_status(session_id: str):
     """세션 상태 조회"""
@@ -66,6 +94,20 @@ def reset_session(session_id: str):
     return ResetResponse(**result)
 
 
+@router.get("/{session_id}/timings", response_model=SessionTimingsResponse)
+def get_session_timings(session_id: str):
+    """세션의 최근 턴별 단계 소요 시간 조회 (세션 저장소에 보관된 트레이스, 처리한 워커와 무관)"""
+    turns = get_shared_repository().load_traces(session_id)
+
+    if not turns and DummyExecutor().get_state(session_id) is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return SessionTimingsResponse(
+        session_id=session_id,
+        turns=[turn.model_dump() for turn in turns],
+    )
+
+
 @router.get("/{session_id}/collected-info", response_model=CollectedInfoResponse)
 def get_collected_info(session_id: str):
     """수집된 정보 조회"""
@@ -1,21 +1,96 @@
 """SRS Routes"""
-from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
+from backend.presentation.api.schemas.request_schemas import BatchSRSRequest
 from backend.presentation.api.schemas.response_schemas import SRSResponse
+from backend.application.use_cases.batch_srs_use_case import BatchSRSUseCase
 from backend.application.use_cases.get_srs_use_case import GetSRSUseCase
+from backend.presentation.api.ndjson import ndjson_response
+from backend.presentation.api.sse import sse_response
 
 router = APIRouter(prefix="/api/srs", tags=["srs"])
 
 
+@router.post("/batch")
+async def batch_srs(request: BatchSRSRequest):
+    """
+    일괄 SRS 생성 (NDJSON: 항목이 끝나는 순서대로 한 줄씩)
+
+    각 항목은 정보 추출 → Judge → Writer를 대화 없이 실행하며,
+    생성된 세션은 /api/srs/{session_id}로 다시 조회할 수 있습니다.
+    """
+    use_case = BatchSRSUseCase()
+    results = use_case.stream(
+        [item.model_dump() for item in request.items],
+        concurrency=request.concurrency
+    )
+    return ndjson_response(results)
+
+
+@router.get("/{session_id}/stream")
+def stream_srs(session_id: str):
+    """SRS 문서 섹션 스트리밍 (SSE: srs_section → done)"""
+    use_case = GetSRSUseCase()
+    events = use_case.stream(session_id)
+
+    if events is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return sse_response(events)
+
+
 @router.get("/{session_id}", response_model=SRSResponse)
 def get_srs(
     session_id: str,
-    format: str = Query("json", description="문서 형식 (json, markdown)")
+    request: Request,
+    format: str = Query("json", pattern="^(json|markdown)$", description="문서 형식 (json, markdown)")
 ):
-    """SRS 문서 조회"""
+    """
+    SRS 문서 조회
+
+    format=markdown이면 완료 시점에 저장된 Markdown을 text/markdown으로 반환합니다.
+    SRS가 있으면 ETag를 붙이고, If-None-Match가 일치하면 본문 없이 304를 반환합니다.
+    """
     use_case = GetSRSUseCase()
     result = use_case.execute(session_id, format)
 
     if "error" in result:
         raise HTTPException(status_code=404, detail=result["error"])
 
-    return SRSResponse(**result)
+    headers = {}
+    if result["etag"]:
+        # 같은 SRS라도 형식마다 표현이 다르므로 형식을 포함
+        etag = f'"{result["etag"]}-{format}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+    if format == "markdown" and result["content"] is not None:
+        return PlainTextResponse(
+            result["content"], media_type="text/markdown; charset=utf-8", headers=headers
+        )
+
+    return JSONResponse(SRSResponse(**result).model_dump(), headers=headers)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 확인 (목록, 약한 검증자, * 지원)
+
+    Args:
+        if_none_match: If-None-Match 헤더 값
+        etag: 현재 ETag (따옴표 포함)
+
+    Returns:
+        일치 여부
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
@@ -1,6 +1,7 @@
 """Request Schemas"""
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from config.settings import settings
+from typing import List, Optional
 
 
 class StartSessionRequest(BaseModel):
@@ -51,3 +52,64 @@ class ContinueSessionRequest(BaseModel):
         if len(v) > 2000:
             raise ValueError("응답이 너무 깁니다. 최대 2000자까지 입력 가능합니다.")
         return v
+
+
+class BatchSRSItem(BaseModel):
+    """일괄 SRS 생성 항목"""
+    id: Optional[str] = Field(
+        None,
+        max_length=200,
+        description="호출자가 지정하는 항목 식별자 (결과에 그대로 반환)"
+    )
+    initial_input: str = Field(
+        ...,
+        min_length=10,
+        max_length=5000,
+        description="프로젝트 초기 입력 (10-5000자)"
+    )
+    answers: List[str] = Field(
+        default_factory=list,
+        max_length=20,
+        description="미리 준비된 답변 목록 (최대 20개, 각 2000자 이하)"
+    )
+
+    @field_validator('initial_input')
+    @classmethod
+    def validate_initial_input(cls, v: str) -> str:
+        """입력 검증 및 정제"""
+        v = v.strip()
+        if len(v) < 10:
+            raise ValueError("입력이 너무 짧습니다. 최소 10자 이상 입력해주세요.")
+        return v
+
+    @field_validator('answers')
+    @classmethod
+    def validate_answers(cls, v: List[str]) -> List[str]:
+        """빈 답변 제거 및 길이 검증"""
+        answers = [answer.strip() for answer in v if answer and answer.strip()]
+        if any(len(answer) > 2000 for answer in answers):
+            raise ValueError("답변이 너무 깁니다. 최대 2000자까지 입력 가능합니다.")
+        return answers
+
+
+class BatchSRSRequest(BaseModel):
+    """일괄 SRS 생성 요청"""
+    items: List[BatchSRSItem] = Field(
+        ...,
+        min_length=1,
+        description="생성할 프로젝트 목록 (최대 settings.batch_max_items개)"
+    )
+    concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        description="동시 처리 항목 수 (서버 상한을 넘으면 상한으로 제한)"
+    )
+
+    @field_validator('items')
+    @classmethod
+    def validate_items(cls, v: List[BatchSRSItem]) -> List[BatchSRSItem]:
+        """항목 수 상한 검증"""
+        if len(v) > settings.batch_max_items:
+            raise ValueError(f"항목이 너무 많습니다. 최대 {settings.batch_max_items}개까지 가능합니다.")
+        return v
+
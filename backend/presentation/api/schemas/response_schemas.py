@@ -39,6 +39,21 @@ class ResetResponse(BaseModel):
     session_id: str
 
 
+class SessionStoreStatsResponse(BaseModel):
+    """세션 저장소 통계 응답"""
+    sessions: int
+    bytes: int
+    evicted_expired: int
+    evicted_lru: int
+    version_conflicts: int = 0
+
+
+class SessionTimingsResponse(BaseModel):
+    """세션 턴별 단계 소요 시간 응답"""
+    session_id: str
+    turns: List[Dict[str, Any]] = []
+
+
 class ErrorResponse(BaseModel):
     """에러 응답"""
     error: str
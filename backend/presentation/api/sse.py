@@ -0,0 +1,52 @@
+"""Server-Sent Events 응답 유틸리티"""
+import json
+from typing import Any, AsyncIterator, Dict, Tuple
+from fastapi.responses import StreamingResponse
+from backend.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """
+    SSE 이벤트 문자열 생성
+
+    Args:
+        event: 이벤트 이름
+        data: 이벤트 데이터 (JSON 직렬화)
+
+    Returns:
+        "event: ...\\ndata: ...\\n\\n" 형식 문자열
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def sse_response(events: AsyncIterator[Tuple[str, Dict[str, Any]]]) -> StreamingResponse:
+    """
+    (이벤트 이름, 데이터) 비동기 이터레이터를 SSE 스트리밍 응답으로 변환
+
+    스트림 도중 예외가 발생하면 "error" 이벤트를 보내고 종료합니다.
+
+    Args:
+        events: 이벤트 비동기 이터레이터
+
+    Returns:
+        text/event-stream StreamingResponse
+    """
+    async def body() -> AsyncIterator[str]:
+        try:
+            async for event, data in events:
+                yield format_sse(event, data)
+        except Exception as e:
+            logger.exception("SSE stream failed", exc_info=e)
+            yield format_sse("error", {"error": str(e)})
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # 리버스 프록시 버퍼링 비활성화 (토큰 즉시 전달)
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -1,12 +1,38 @@
 """FastAPI Application"""
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from backend.presentation.api.routes import session_routes, srs_routes
+from backend.infrastructure.llm.client_registry import get_client_registry
+from backend.infrastructure.graph.executor import (
+    get_idempotency_store,
+    get_shared_repository,
+    get_session_sweeper,
+)
+from backend.infrastructure.graph.idempotency_store import IdempotencyKeyReused
+from backend.infrastructure.graph.session_lock import SessionLockTimeout, SessionSaveFailed, SessionVersionConflict
+from backend.utils.tracing import get_trace_recorder
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 수명주기 (시작 시 만료 세션 정리 시작, 종료 시 공유 리소스 정리)"""
+    get_session_sweeper().start()
+    yield
+    # 공유 LLM 클라이언트 연결 종료
+    get_client_registry().shutdown()
+    # 세션 정리 중지 및 저장소의 대기 중인 쓰기 기록 후 종료
+    get_session_sweeper().stop()
+    get_shared_repository().close()
+    get_idempotency_store().close()
+
 
 app = FastAPI(
     title="SpecPilot API",
     description="AI-based SRS Automation Agent",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -18,6 +44,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(SessionLockTimeout)
+async def session_lock_timeout_handler(request: Request, exc: SessionLockTimeout):
+    """같은 세션의 이전 요청이 끝나지 않아 락을 얻지 못한 경우 409"""
+    return JSONResponse(
+        status_code=409,
+        content={"detail": "Session is busy with another request"},
+        headers={"Retry-After": "1"}
+    )
+
+
+@app.exception_handler(SessionVersionConflict)
+async def session_version_conflict_handler(request: Request, exc: SessionVersionConflict):
+    """재시도해도 다른 요청이 먼저 세션을 저장한 경우 409 (클라이언트가 최신 상태를 다시 조회)"""
+    return JSONResponse(
+        status_code=409,
+        content={"detail": "Session was modified by another request", "version": exc.current_version}
+    )
+
+
+@app.exception_handler(SessionSaveFailed)
+async def session_save_failed_handler(request: Request, exc: SessionSaveFailed):
+    """저장소가 턴 결과를 저장하지 못한 경우 503 (턴은 기록되지 않았으므로 같은 요청을 다시 보낼 수 있음)"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Failed to save session state"},
+        headers={"Retry-After": "1"}
+    )
+
+
+@app.exception_handler(IdempotencyKeyReused)
+async def idempotency_key_reused_handler(request: Request, exc: IdempotencyKeyReused):
+    """같은 Idempotency-Key를 다른 요청 본문에 다시 사용한 경우 422"""
+    return JSONResponse(status_code=422, content={"detail": str(exc)})
+
+
 # 라우터 등록
 app.include_router(session_routes.router)
 app.include_router(srs_routes.router)
@@ -37,3 +98,12 @@ def root():
 def health_check():
     """헬스 체크"""
     return {"status": "healthy"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Prometheus 메트릭 (턴/단계별 지연 시간, LLM 호출/재시도/프롬프트 크기)"""
+    return PlainTextResponse(
+        get_trace_recorder().render_prometheus(),
+        media_type="text/plain; version=0.0.4"
+    )
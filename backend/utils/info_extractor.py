@@ -1,67 +1,105 @@
 """Info Extractor - 사용자 입력에서 정보 추출"""
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import re
 from backend.utils.string_utils import safe_lower, safe_upper
 
 
+# 카테고리별 탐지 키워드 (이 중 하나라도 포함되면 해당 카테고리 추출 시도)
+CATEGORY_KEYWORDS = {
+    "payment": ["KG", "이니시스", "토스", "나이스", "페이팔", "페이코", "카카오페이", "네이버페이"],
+    "authentication": ["OAuth", "JWT", "소셜로그인", "카카오", "네이버", "구글"],
+    "deployment": ["AWS", "GCP", "Azure", "클라우드", "온프레미스", "도커", "쿠버네티스"],
+    "scale": ["명", "만", "동시접속", "사용자", "트래픽"],
+    "project_type": ["쇼핑몰", "이커머스", "인트라넷", "사내", "그룹웨어", "SNS", "커뮤니티", "배달", "예약"],
+    "core_features": ["기능", "주요", "필요", "지원", "포함"],
+}
+
+# 결과 딕셔너리 키 순서 (기존 동작과 동일하게 유지)
+CATEGORY_ORDER = list(CATEGORY_KEYWORDS.keys())
+
+
+# 소문자로 미리 변환한 카테고리별 키워드 (호출마다 keyword.lower() 반복 방지)
+_CATEGORY_KEYWORDS_LOWER = {
+    category: tuple(keyword.lower() for keyword in keywords)
+    for category, keywords in CATEGORY_KEYWORDS.items()
+}
+
+# 결제 PG사 매핑 (소문자 키워드 → 정규화된 이름)
+_PG_MAP = {
+    "kg": "KG 이니시스",
+    "이니시스": "KG 이니시스",
+    "토스": "토스페이먼츠",
+    "나이스": "나이스페이먼츠",
+    "페이팔": "PayPal",
+    "페이코": "PAYCO",
+    "카카오페이": "카카오페이",
+    "네이버페이": "네이버페이"
+}
+
+# 프로젝트 타입 매핑
+_TYPE_MAP = {
+    "쇼핑몰": "이커머스",
+    "이커머스": "이커머스",
+    "커머스": "이커머스",
+    "인트라넷": "사내 인트라넷",
+    "사내": "사내 인트라넷",
+    "그룹웨어": "사내 인트라넷",
+    "sns": "소셜 네트워크",
+    "커뮤니티": "커뮤니티",
+    "배달": "배달 서비스",
+    "예약": "예약 시스템",
+    "블로그": "블로그/콘텐츠"
+}
+
+# 규모 패턴: "월 1만 명", "동시접속 500명", "일 10만 건" 등
+_SCALE_PATTERNS = [
+    re.compile(r'(\d+(?:,\d+)?)\s*만\s*명'),  # "1만 명"
+    re.compile(r'(\d+(?:,\d+)?)\s*천\s*명'),  # "5천 명"
+    re.compile(r'(\d+(?:,\d+)?)\s*명'),       # "500명"
+    re.compile(r'동시접속\s*(\d+(?:,\d+)?)'), # "동시접속 500"
+    re.compile(r'월\s*(\d+(?:,\d+)?)\s*만'),  # "월 1만"
+    re.compile(r'일\s*(\d+(?:,\d+)?)\s*만'),  # "일 10만"
+]
+
+# "주요 기능:", "기능:" 뒤에 나오는 불릿 리스트
+_FEATURE_PATTERNS = [
+    re.compile(r'주요\s*기능[:\s]*\n((?:[-\*]\s*.+\n?)+)'),
+    re.compile(r'기능[:\s]*\n((?:[-\*]\s*.+\n?)+)'),
+]
+
+
 class InfoExtractor:
     """
     사용자 입력 텍스트에서 구조화된 정보를 추출하는 유틸리티
 
     스마트 추출: 전체 문장이 아닌 핵심 정보만 추출
+
+    입력은 한 번만 소문자로 변환하여 탐지와 모든 추출 함수가 공유하고,
+    키워드 테이블과 정규식은 모듈 로드 시 한 번만 준비합니다.
     """
 
     def __init__(self):
         """InfoExtractor 초기화"""
         # 각 카테고리별 추출 패턴
         self.patterns = {
-            "payment": {
-                "keywords": ["KG", "이니시스", "토스", "나이스", "페이팔", "페이코", "카카오페이", "네이버페이"],
-                "extractor": self._extract_payment
-            },
-            "authentication": {
-                "keywords": ["OAuth", "JWT", "소셜로그인", "카카오", "네이버", "구글"],
-                "extractor": self._extract_authentication
-            },
-            "deployment": {
-                "keywords": ["AWS", "GCP", "Azure", "클라우드", "온프레미스", "도커", "쿠버네티스"],
-                "extractor": self._extract_deployment
-            },
-            "scale": {
-                "keywords": ["명", "만", "동시접속", "사용자", "트래픽"],
-                "extractor": self._extract_scale
-            },
-            "project_type": {
-                "keywords": ["쇼핑몰", "이커머스", "인트라넷", "사내", "그룹웨어", "SNS", "커뮤니티", "배달", "예약"],
-                "extractor": self._extract_project_type
-            },
-            "core_features": {
-                "keywords": ["기능", "주요", "필요", "지원", "포함"],
-                "extractor": self._extract_core_features
+            category: {
+                "keywords": keywords,
+                "extractor": getattr(self, f"_extract_{category}")
             }
+            for category, keywords in CATEGORY_KEYWORDS.items()
         }
 
-    def _extract_payment(self, text: str) -> str:
+    def _extract_payment(self, text: str, text_lower: Optional[str] = None) -> str:
         """결제 수단 추출"""
-        text_lower = safe_lower(text)
-        pg_map = {
-            "kg": "KG 이니시스",
-            "이니시스": "KG 이니시스",
-            "토스": "토스페이먼츠",
-            "나이스": "나이스페이먼츠",
-            "페이팔": "PayPal",
-            "페이코": "PAYCO",
-            "카카오페이": "카카오페이",
-            "네이버페이": "네이버페이"
-        }
-        for keyword, pg_name in pg_map.items():
+        text_lower = safe_lower(text) if text_lower is None else text_lower
+        for keyword, pg_name in _PG_MAP.items():
             if keyword in text_lower:
                 return pg_name
         return None
 
-    def _extract_authentication(self, text: str) -> str:
+    def _extract_authentication(self, text: str, text_lower: Optional[str] = None) -> str:
         """인증 방식 추출"""
-        text_lower = safe_lower(text)
+        text_lower = safe_lower(text) if text_lower is None else text_lower
         if "oauth" in text_lower:
             return "OAuth 2.0"
         if "jwt" in text_lower:
@@ -79,7 +117,7 @@ class InfoExtractor:
             return "소셜 로그인"
         return None
 
-    def _extract_deployment(self, text: str) -> str:
+    def _extract_deployment(self, text: str, text_lower: Optional[str] = None) -> str:
         """배포 환경 추출"""
         text_upper = safe_upper(text)
         text_safe = text if text else ""
@@ -99,20 +137,10 @@ class InfoExtractor:
             return "Kubernetes"
         return None
 
-    def _extract_scale(self, text: str) -> str:
+    def _extract_scale(self, text: str, text_lower: Optional[str] = None) -> str:
         """규모 정보 추출 (숫자 + 단위)"""
-        # 패턴: "월 1만 명", "동시접속 500명", "일 10만 건" 등
-        patterns = [
-            r'(\d+(?:,\d+)?)\s*만\s*명',  # "1만 명"
-            r'(\d+(?:,\d+)?)\s*천\s*명',  # "5천 명"
-            r'(\d+(?:,\d+)?)\s*명',       # "500명"
-            r'동시접속\s*(\d+(?:,\d+)?)', # "동시접속 500"
-            r'월\s*(\d+(?:,\d+)?)\s*만',  # "월 1만"
-            r'일\s*(\d+(?:,\d+)?)\s*만',  # "일 10만"
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _SCALE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 number = match.group(1)
                 # 컨텍스트 추출 (숫자 주변 5단어)
@@ -130,40 +158,21 @@ class InfoExtractor:
 
         return None
 
-    def _extract_project_type(self, text: str) -> str:
+    def _extract_project_type(self, text: str, text_lower: Optional[str] = None) -> str:
         """프로젝트 타입 추출"""
-        text_lower = safe_lower(text)
-        type_map = {
-            "쇼핑몰": "이커머스",
-            "이커머스": "이커머스",
-            "커머스": "이커머스",
-            "인트라넷": "사내 인트라넷",
-            "사내": "사내 인트라넷",
-            "그룹웨어": "사내 인트라넷",
-            "sns": "소셜 네트워크",
-            "커뮤니티": "커뮤니티",
-            "배달": "배달 서비스",
-            "예약": "예약 시스템",
-            "블로그": "블로그/콘텐츠"
-        }
-        for keyword, ptype in type_map.items():
+        text_lower = safe_lower(text) if text_lower is None else text_lower
+        for keyword, ptype in _TYPE_MAP.items():
             if keyword in text_lower:
                 return ptype
         return None
 
-    def _extract_core_features(self, text: str) -> str:
+    def _extract_core_features(self, text: str, text_lower: Optional[str] = None) -> str:
         """주요 기능 추출 - 리스트 형태로 명시된 기능들만 추출"""
         if not text:
             return None
 
-        # "주요 기능:", "기능:" 뒤에 나오는 불릿 리스트 추출
-        feature_patterns = [
-            r'주요\s*기능[:\s]*\n((?:[-\*]\s*.+\n?)+)',
-            r'기능[:\s]*\n((?:[-\*]\s*.+\n?)+)',
-        ]
-
-        for pattern in feature_patterns:
-            match = re.search(pattern, text)
+        for pattern in _FEATURE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 features_text = match.group(1)
                 # 각 라인에서 기능만 추출 (불릿 제거)
@@ -180,6 +189,22 @@ class InfoExtractor:
 
         return None
 
+    def _detect_categories(self, text_lower: str, wanted: set) -> set:
+        """
+        소문자 텍스트에서 키워드가 등장한 카테고리 탐지
+
+        Args:
+            text_lower: 소문자 변환된 텍스트
+            wanted: 탐지가 필요한 카테고리 집합
+
+        Returns:
+            키워드가 발견된 카테고리 집합 (wanted의 부분집합)
+        """
+        return {
+            category for category in wanted
+            if any(keyword in text_lower for keyword in _CATEGORY_KEYWORDS_LOWER[category])
+        }
+
     def extract(self, text: str, existing_info: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         텍스트에서 정보 추출
@@ -198,25 +223,24 @@ class InfoExtractor:
         if existing_info is None:
             existing_info = {}
 
-        result = {}
+        # 이미 수집된 정보는 건너뛰기
+        wanted = {category for category in CATEGORY_ORDER if category not in existing_info}
+        if not wanted:
+            return {}
 
-        # 각 카테고리별로 스마트 추출
-        for category, config in self.patterns.items():
-            # 이미 수집된 정보는 건너뛰기
-            if category in existing_info:
-                continue
+        text_lower = safe_lower(text)
+        found = self._detect_categories(text_lower, wanted)
 
-            # 키워드가 포함되어 있는지 확인
-            keywords = config["keywords"]
-            text_lower = safe_lower(text)
-            has_keyword = any(safe_lower(keyword) in text_lower for keyword in keywords)
+        result = {}
+        for category in CATEGORY_ORDER:
+            if category not in found:
+                continue
 
-            if has_keyword:
-                # 카테고리별 추출 함수 실행
-                extractor = config["extractor"]
-                extracted_value = extractor(text)
+            # 카테고리별 추출 함수 실행
+            extractor = self.patterns[category]["extractor"]
+            extracted_value = extractor(text, text_lower)
 
-                if extracted_value:
-                    result[category] = extracted_value
+            if extracted_value:
+                result[category] = extracted_value
 
         return result
@@ -1,6 +1,7 @@
 """SRS Formatter - SRS 문서 포맷팅"""
+import hashlib
 import json
-from backend.domain.models.srs import SRSDocument
+from backend.domain.models.srs import SRSDocument, SRSRenditions
 
 
 class SRSFormatter:
@@ -98,3 +99,34 @@ class SRSFormatter:
         data = json.loads(json_str)
         srs = SRSDocument(**data)
         return self.to_markdown(srs)
+
+
+def srs_content_hash(final_srs: str) -> str:
+    """
+    SRS JSON 문자열의 콘텐츠 해시
+
+    Args:
+        final_srs: SRS 문서 JSON 문자열
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    return hashlib.sha256(final_srs.encode("utf-8")).hexdigest()
+
+
+def build_srs_renditions(final_srs: str) -> SRSRenditions:
+    """
+    SRS JSON에서 Markdown / 파싱된 딕셔너리 표현을 한 번에 생성
+
+    Args:
+        final_srs: SRS 문서 JSON 문자열
+
+    Returns:
+        SRSRenditions 인스턴스
+    """
+    data = json.loads(final_srs)
+    return SRSRenditions(
+        content_hash=srs_content_hash(final_srs),
+        markdown=SRSFormatter().to_markdown(data),
+        data=data
+    )
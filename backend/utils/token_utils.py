@@ -0,0 +1,25 @@
+"""Token Utility Functions - 로컬 토큰 수 추정"""
+import math
+
+
+def estimate_tokens(text) -> int:
+    """
+    텍스트의 LLM 토큰 수 추정 (외부 토크나이저 없이)
+
+    ASCII 문자는 약 4자당 1토큰, 한글 등 비ASCII 문자는 약 1.5자당 1토큰으로 계산합니다.
+    Gemini 토크나이저와 정확히 일치하지는 않지만 예산 관리용으로 충분합니다.
+
+    Args:
+        text: 추정할 텍스트 (None 허용)
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    if not isinstance(text, str):
+        text = str(text)
+
+    ascii_count = len(text.encode("ascii", "ignore"))
+    non_ascii_count = len(text) - ascii_count
+    return math.ceil(ascii_count / 4 + non_ascii_count / 1.5)
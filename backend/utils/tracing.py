@@ -0,0 +1,331 @@
+"""Turn Tracing - 워크플로우 단계별 지연 시간 계측"""
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+from pydantic import BaseModel, Field
+
+# 계측 단계 이름
+STAGE_INFO_EXTRACTION = "info_extraction"
+STAGE_CONSULTANT_LLM = "consultant_llm"
+STAGE_SPECULATIVE_QUESTION = "speculative_question"
+STAGE_EXAMPLE_HINT_LLM = "example_hint_llm"
+STAGE_JUDGE_RULES = "judge_rules"
+STAGE_JUDGE_LLM = "judge_llm"
+STAGE_WRITER = "writer"
+STAGE_REPOSITORY_SAVE = "repository_save"
+
+# Prometheus histogram 버킷 (초)
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class StageSpan(BaseModel):
+    """한 단계의 실행 기록"""
+    name: str
+    start_ms: float = Field(description="턴 시작 기준 시작 시각 (밀리초)")
+    duration_ms: float = 0.0
+    llm_calls: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    llm_calls_saved: int = 0
+    prompt_tokens_saved: int = 0
+    prompt_chars: int = 0
+    response_chars: int = 0
+    error: Optional[str] = None
+
+
+class TurnTrace(BaseModel):
+    """한 턴(start/continue 요청 1회)의 단계별 실행 기록"""
+    session_id: str
+    iteration: int = 0
+    started_at: float = Field(description="턴 시작 시각 (Unix time)")
+    duration_ms: float = 0.0
+    stages: List[StageSpan] = Field(default_factory=list)
+
+
+_current_trace: ContextVar[Optional[TurnTrace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[StageSpan]] = ContextVar("current_span", default=None)
+
+
+class _Histogram:
+    """누적 버킷 histogram (락 보유 상태에서 갱신)"""
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(DURATION_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        index = bisect_left(DURATION_BUCKETS, seconds)
+        if index < len(DURATION_BUCKETS):
+            self.bucket_counts[index] += 1
+        self.count += 1
+        self.total += seconds
+
+
+class TraceRecorder:
+    """
+    턴 트레이스 수집기
+
+    세션별 최근 턴 트레이스를 보관하고(/timings), 단계별 지연 시간 histogram과
+    LLM 호출/재시도/프롬프트 크기 카운터를 누적합니다(/metrics).
+    """
+
+    def __init__(self, max_sessions: int = 1000, max_turns_per_session: int = 50):
+        """
+        수집기 초기화
+
+        Args:
+            max_sessions: 트레이스를 보관할 최대 세션 수 (LRU)
+            max_turns_per_session: 세션당 보관할 최근 턴 수
+        """
+        self.max_sessions = max_sessions
+        self.max_turns_per_session = max_turns_per_session
+        self._traces: "OrderedDict[str, List[TurnTrace]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._turns = _Histogram()
+        self._stages: Dict[str, _Histogram] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def record(self, trace: TurnTrace) -> None:
+        """
+        완료된 턴 트레이스 저장 및 메트릭 반영
+
+        Args:
+            trace: 완료된 턴 트레이스
+        """
+        with self._lock:
+            turns = self._traces.setdefault(trace.session_id, [])
+            turns.append(trace)
+            del turns[:-self.max_turns_per_session]
+            self._traces.move_to_end(trace.session_id)
+            while len(self._traces) > self.max_sessions:
+                self._traces.popitem(last=False)
+
+            self._turns.observe(trace.duration_ms / 1000)
+            for span in trace.stages:
+                self._stages.setdefault(span.name, _Histogram()).observe(span.duration_ms / 1000)
+                counters = self._counters.setdefault(span.name, {
+                    "llm_calls": 0, "retries": 0, "cache_hits": 0, "llm_calls_saved": 0,
+                    "prompt_tokens_saved": 0, "prompt_chars": 0, "response_chars": 0, "errors": 0,
+                })
+                counters["llm_calls"] += span.llm_calls
+                counters["retries"] += span.retries
+                counters["cache_hits"] += span.cache_hits
+                counters["llm_calls_saved"] += span.llm_calls_saved
+                counters["prompt_tokens_saved"] += span.prompt_tokens_saved
+                counters["prompt_chars"] += span.prompt_chars
+                counters["response_chars"] += span.response_chars
+                counters["errors"] += 1 if span.error else 0
+
+    def get_session_traces(self, session_id: str) -> Optional[List[TurnTrace]]:
+        """
+        세션의 최근 턴 트레이스 조회
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            오래된 순 턴 트레이스 리스트 (기록이 없으면 None)
+        """
+        with self._lock:
+            turns = self._traces.get(session_id)
+            return list(turns) if turns is not None else None
+
+    def discard_session(self, session_id: str) -> None:
+        """세션 트레이스 삭제 (세션 리셋 시)"""
+        with self._lock:
+            self._traces.pop(session_id, None)
+
+    def render_prometheus(self) -> str:
+        """
+        Prometheus text exposition 형식으로 메트릭 출력
+
+        Returns:
+            메트릭 텍스트
+        """
+        lines = []
+        with self._lock:
+            lines.append("# HELP specpilot_turn_duration_seconds Wall time of one workflow turn.")
+            lines.append("# TYPE specpilot_turn_duration_seconds histogram")
+            lines.extend(_histogram_lines("specpilot_turn_duration_seconds", "", self._turns))
+
+            lines.append("# HELP specpilot_stage_duration_seconds Wall time of one workflow stage.")
+            lines.append("# TYPE specpilot_stage_duration_seconds histogram")
+            for name in sorted(self._stages):
+                lines.extend(_histogram_lines(
+                    "specpilot_stage_duration_seconds", f'stage="{name}"', self._stages[name]
+                ))
+
+            for counter, help_text in (
+                ("llm_calls", "LLM calls made within a stage."),
+                ("retries", "LLM retry attempts within a stage."),
+                ("cache_hits", "LLM response cache hits within a stage."),
+                ("llm_calls_saved", "LLM calls skipped because rules already decided the outcome."),
+                ("prompt_tokens_saved", "Estimated prompt tokens removed by context compaction."),
+                ("prompt_chars", "Prompt characters sent to the LLM."),
+                ("response_chars", "Response characters received from the LLM."),
+                ("errors", "Stages that ended with an error."),
+            ):
+                metric = f"specpilot_stage_{counter}_total"
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} counter")
+                for name in sorted(self._counters):
+                    lines.append(f'{metric}{{stage="{name}"}} {self._counters[name][counter]}')
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """모든 트레이스와 메트릭 초기화"""
+        with self._lock:
+            self._traces.clear()
+            self._turns = _Histogram()
+            self._stages.clear()
+            self._counters.clear()
+
+
+def _histogram_lines(metric: str, labels: str, histogram: _Histogram) -> List[str]:
+    """histogram 한 개의 _bucket/_sum/_count 줄 생성"""
+    prefix = f"{labels}," if labels else ""
+    lines = []
+    cumulative = 0
+    for bound, count in zip(DURATION_BUCKETS, histogram.bucket_counts):
+        cumulative += count
+        lines.append(f'{metric}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+    lines.append(f'{metric}_bucket{{{prefix}le="+Inf"}} {histogram.count}')
+    suffix = f"{{{labels}}}" if labels else ""
+    lines.append(f"{metric}_sum{suffix} {histogram.total:.6f}")
+    lines.append(f"{metric}_count{suffix} {histogram.count}")
+    return lines
+
+
+@contextmanager
+def trace_turn(session_id: str, iteration: int = 0) -> Iterator[TurnTrace]:
+    """
+    턴 트레이스 시작 (블록 종료 시 수집기에 기록)
+
+    블록 안의 trace_stage() 호출이 이 트레이스에 기록됩니다.
+    asyncio.gather/to_thread로 만든 하위 작업에도 컨텍스트가 전달됩니다.
+
+    Args:
+        session_id: 세션 ID
+        iteration: 턴 시작 시점의 iteration_count
+
+    Yields:
+        진행 중인 턴 트레이스
+    """
+    trace = TurnTrace(session_id=session_id, iteration=iteration, started_at=time.time())
+    started = time.perf_counter()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        trace.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+        _reset(_current_trace, token)
+        _recorder.record(trace)
+
+
+@contextmanager
+def trace_stage(name: str) -> Iterator[Optional[StageSpan]]:
+    """
+    단계 실행 시간 기록 (진행 중인 턴 트레이스가 없으면 아무것도 하지 않음)
+
+    Args:
+        name: 단계 이름 (STAGE_* 상수)
+
+    Yields:
+        진행 중인 단계 기록 (트레이스가 없으면 None)
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    started = time.perf_counter()
+    span = StageSpan(
+        name=name,
+        start_ms=round((time.time() - trace.started_at) * 1000, 3)
+    )
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.error = type(e).__name__
+        raise
+    finally:
+        span.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+        _reset(_current_span, token)
+        trace.stages.append(span)
+
+
+def record_llm_call(
+    prompt: str,
+    response: Optional[str],
+    attempts: int = 1,
+    cache_hit: bool = False
+) -> None:
+    """
+    진행 중인 단계에 LLM 호출 1건 기록 (단계 밖이면 무시)
+
+    Args:
+        prompt: 전송한 프롬프트
+        response: 받은 응답 (실패 시 None)
+        attempts: API 호출 시도 횟수 (캐시 적중이면 0)
+        cache_hit: 응답 캐시 적중 여부
+    """
+    span = _current_span.get()
+    if span is None:
+        return
+    span.llm_calls += 1
+    span.retries += max(attempts - 1, 0)
+    span.cache_hits += 1 if cache_hit else 0
+    span.prompt_chars += len(prompt or "")
+    span.response_chars += len(response or "")
+
+
+def record_llm_call_saved() -> None:
+    """진행 중인 단계에 규칙 기반 판정으로 생략한 LLM 호출 1건 기록 (단계 밖이면 무시)"""
+    span = _current_span.get()
+    if span is None:
+        return
+    span.llm_calls_saved += 1
+
+
+def record_prompt_tokens_saved(tokens: int) -> None:
+    """
+    진행 중인 단계에 컨텍스트 압축으로 줄인 추정 프롬프트 토큰 수 기록 (단계 밖이면 무시)
+
+    Args:
+        tokens: 줄인 추정 토큰 수
+    """
+    span = _current_span.get()
+    if span is None:
+        return
+    span.prompt_tokens_saved += max(tokens, 0)
+
+
+def _reset(var: ContextVar, token) -> None:
+    """컨텍스트 변수 복원 (async generator가 다른 컨텍스트에서 종료된 경우 None으로 설정)"""
+    try:
+        var.reset(token)
+    except ValueError:
+        var.set(None)
+
+
+# 전역 공유 수집기
+_recorder = TraceRecorder()
+
+
+def get_trace_recorder() -> TraceRecorder:
+    """
+    전역 턴 트레이스 수집기 가져오기
+
+    Returns:
+        TraceRecorder 인스턴스
+    """
+    return _recorder
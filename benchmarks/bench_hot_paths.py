@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+"""
+턴마다 실행되는 순수 Python 경로 마이크로 벤치마크
+
+InfoExtractor, Writer 생성 함수, SRSFormatter, RequirementState 직렬화와 저장용 변환,
+프롬프트 빌더, 예시 힌트 색인을 합성 입력(대화 턴 수 기준 small/medium/large)으로 측정하고,
+저장된 기준값보다 허용 범위 이상 느려지면 실패(종료 코드 1)합니다.
+
+사용법:
+    python benchmarks/bench_hot_paths.py                   # 측정 + 기준값 비교
+    python benchmarks/bench_hot_paths.py --save-baseline   # 현재 측정값을 기준값으로 저장
+    python benchmarks/bench_hot_paths.py --filter writer --tolerance 0.5
+
+기준값은 측정한 머신에 종속적이므로, 다른 환경에서는 먼저 --save-baseline으로 갱신하세요.
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.domain.agents.consultant_agent import _build_consultant_prompt
+from backend.domain.agents.judge_agent import _build_judge_prompt
+from backend.domain.agents.writer_agent import (
+    ProjectProfile,
+    _extract_info_smart,
+    _generate_functional_requirements,
+    _generate_tech_stack,
+    _generate_test_scenarios,
+    build_srs_json,
+    iter_srs_sections,
+)
+from backend.domain.models.compact_state import CompactSession
+from backend.domain.models.state import Message, PromptContext, RequirementState
+from backend.infrastructure.prompts.hint_index import build_hint_index
+from backend.infrastructure.prompts.prompt_builder import IncrementalPromptBuilder
+from backend.utils.info_extractor import InfoExtractor
+from backend.utils.srs_formatter import SRSFormatter
+
+DEMO_DIR = Path(__file__).parent.parent / "demo_data"
+BASELINE_PATH = Path(__file__).parent / "baselines" / "hot_paths.json"
+
+# 입력 크기 (대화 턴 수)
+SIZES = {"small": 4, "medium": 16, "large": 64}
+
+
+def build_state(turns: int) -> RequirementState:
+    """
+    데모 시나리오를 이어 붙여 지정한 턴 수의 합성 상태 생성
+
+    Args:
+        turns: 질문/답변 쌍의 수
+
+    Returns:
+        메시지, collected_info가 채워진 RequirementState
+    """
+    scenarios = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(DEMO_DIR.glob("scenario_*.json"))
+    ]
+    pairs = [item for scenario in scenarios for item in scenario["expected_questions"]]
+
+    state = RequirementState(user_input=scenarios[0]["initial_input"])
+    state.messages.append(Message(role="user", content=state.user_input))
+    state.collected_info["initial_request"] = state.user_input
+
+    extractor = InfoExtractor()
+    for i in range(turns):
+        item = pairs[i % len(pairs)]
+        state.messages.append(Message(role="assistant", content=f"추가 정보가 필요합니다:\n{item['question']}"))
+        state.messages.append(Message(role="user", content=item["answer"]))
+        state.collected_info[f"response_{i + 1}"] = item["answer"]
+        state.collected_info.update(extractor.extract(item["answer"], state.collected_info))
+    state.iteration_count = turns
+    return state
+
+
+def build_cases(size: str, turns: int) -> Dict[str, Callable[[], object]]:
+    """
+    한 입력 크기에 대한 벤치마크 케이스 생성
+
+    Args:
+        size: 크기 이름
+        turns: 대화 턴 수
+
+    Returns:
+        케이스 이름 → 측정할 함수
+    """
+    state = build_state(turns)
+    info = state.collected_info
+    user_input = state.user_input
+    answers_text = "\n".join(msg.content for msg in state.messages if msg.role == "user")
+
+    profile = ProjectProfile.classify(user_input, info, info.get("scale"))
+    auth = _extract_info_smart(info, "authentication")
+    payment = _extract_info_smart(info, "payment")
+
+    final_srs = build_srs_json(dict(iter_srs_sections(state)))
+    json_state = state.model_dump_json()
+    compact = CompactSession.from_state(state)
+
+    extractor = InfoExtractor()
+    formatter = SRSFormatter()
+    builder = IncrementalPromptBuilder()
+    hint_index = build_hint_index(path="")
+    questions = [msg.content.split("\n")[-1] for msg in state.messages if msg.role == "assistant"]
+
+    def render_history_cold():
+        # 첫 렌더링 비용 (세션 복원 직후와 동일)
+        state.prompt_context = PromptContext()
+        return builder.judge_history(state)
+
+    cases = {
+        "info_extractor.extract": lambda: extractor.extract(answers_text),
+        "writer._extract_info_smart": lambda: [
+            _extract_info_smart(info, category)
+            for category in ("payment", "authentication", "scale", "deployment", "project_type")
+        ],
+        "writer.ProjectProfile.classify": lambda: ProjectProfile.classify(user_input, info, info.get("scale")),
+        "writer._generate_functional_requirements": lambda: _generate_functional_requirements(
+            user_input, info, auth, payment, profile
+        ),
+        "writer._generate_tech_stack": lambda: _generate_tech_stack(
+            user_input, info, info.get("scale"), info.get("deployment"), payment, profile
+        ),
+        "writer._generate_test_scenarios": lambda: _generate_test_scenarios(
+            user_input, info, auth, payment, profile
+        ),
+        "srs_formatter.json_to_markdown": lambda: formatter.json_to_markdown(final_srs),
+        "state.model_dump_json": state.model_dump_json,
+        "state.model_validate_json": lambda: RequirementState.model_validate_json(json_state),
+        "compact_state.from_state": lambda: CompactSession.from_state(state),
+        "compact_state.to_state": compact.to_state,
+        "prompt_builder.judge_history_cold": render_history_cold,
+        "hint_index.lookup": lambda: [hint_index.lookup(question) for question in questions],
+        "prompt.consultant": lambda: _build_consultant_prompt(state),
+        "prompt.judge": lambda: _build_judge_prompt(state),
+    }
+
+    # to_markdown은 파싱된 문서를 받으므로 JSON 파싱 비용 제외
+    srs_data = json.loads(final_srs)
+    cases["srs_formatter.to_markdown"] = lambda: formatter.to_markdown(srs_data)
+
+    return {f"{name}[{size}]": func for name, func in cases.items()}
+
+
+def measure(func: Callable[[], object], repeat: int, target_seconds: float = 0.1) -> float:
+    """
+    호출당 최소 소요 시간 측정
+
+    Args:
+        func: 측정할 함수
+        repeat: 반복 측정 횟수
+        target_seconds: 측정 1회당 목표 시간 (반복 횟수 결정용)
+
+    Returns:
+        호출당 시간 (µs)
+    """
+    timer = timeit.Timer(func)
+    # 워밍업 겸 1회 소요 시간으로 반복 횟수 결정
+    single = timer.timeit(number=1)
+    number = max(int(target_seconds / max(single, 1e-7)), 1)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def check_regressions(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    tolerance: float
+) -> List[str]:
+    """
+    기준값 대비 회귀 케이스 찾기
+
+    Args:
+        results: 케이스 → 측정값 (µs)
+        baseline: 케이스 → 기준값 (µs)
+        tolerance: 허용 증가율 (0.5 = 50%)
+
+    Returns:
+        회귀한 케이스 이름 리스트
+    """
+    return [
+        name for name, value in results.items()
+        if name in baseline and value > baseline[name] * (1 + tolerance)
+    ]
+
+
+def main():
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="Hot path 마이크로 벤치마크")
+    parser.add_argument("--filter", default="", help="이름에 이 문자열이 포함된 케이스만 실행")
+    parser.add_argument("--repeat", type=int, default=7, help="반복 측정 횟수 (기본: 7)")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="허용 증가율 (기본: 0.5, 공유 머신 노이즈 고려)")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="기준값 JSON 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="측정값을 기준값으로 저장")
+    args = parser.parse_args()
+
+    baseline_path = Path(args.baseline)
+    baseline = {}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results_us"]
+
+    cases = {}
+    results = {}
+    for size, turns in SIZES.items():
+        for name, func in build_cases(size, turns).items():
+            if args.filter not in name:
+                continue
+            cases[name] = func
+            results[name] = measure(func, args.repeat)
+            line = f"  {name:<52} {results[name]:10.1f} µs"
+            if name in baseline:
+                line += f"  ({(results[name] - baseline[name]) / baseline[name] * 100:+6.1f}%)"
+            print(line)
+
+    if args.save_baseline:
+        merged = {**baseline, **{name: round(value, 2) for name, value in results.items()}}
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps({
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results_us": dict(sorted(merged.items())),
+        }, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"기준값 저장: {baseline_path}")
+        return
+
+    regressions = check_regressions(results, baseline, args.tolerance)
+    # 일시적 노이즈와 구분하기 위해 회귀 케이스는 한 번 더 측정하여 더 빠른 값 사용
+    for name in regressions:
+        results[name] = min(results[name], measure(cases[name], args.repeat))
+    regressions = check_regressions(results, baseline, args.tolerance)
+    if regressions:
+        print(f"❌ 기준값 대비 {args.tolerance:.0%} 이상 느려진 케이스: {', '.join(regressions)}")
+        sys.exit(1)
+    if baseline:
+        print(f"✅ 회귀 없음 (허용 범위 {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
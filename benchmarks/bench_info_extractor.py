@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+InfoExtractor.extract 마이크로 벤치마크
+
+사용법:
+    python benchmarks/bench_info_extractor.py
+    python benchmarks/bench_info_extractor.py --size 5000 --number 2000
+"""
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.utils.info_extractor import InfoExtractor
+
+DEMO_DIR = Path(__file__).parent.parent / "demo_data"
+
+
+def build_inputs(size: int) -> dict:
+    """
+    벤치마크 입력 생성 (StartSessionRequest 최대 길이 기준)
+
+    Args:
+        size: 입력 길이 (문자 수)
+
+    Returns:
+        케이스 이름 → 입력 텍스트
+    """
+    demo_text = "\n".join(
+        json.loads(path.read_text(encoding="utf-8"))["initial_input"]
+        for path in sorted(DEMO_DIR.glob("scenario_*.json"))
+    )
+    filler = "프로젝트 설명 문장입니다. 일반적인 내용이 계속됩니다. "
+
+    return {
+        # 데모 시나리오 반복 (키워드가 앞쪽에 몰려 있음)
+        "demo_repeated": (demo_text * (size // len(demo_text) + 1))[:size],
+        # 키워드가 끝에만 있는 경우 (전체 스캔)
+        "keywords_at_end": (filler * (size // len(filler) + 1))[:size - 40] + " AWS 배포, 카카오페이, 월 1만 명",
+        # 키워드가 전혀 없는 경우
+        "no_keywords": ("lorem ipsum dolor sit amet " * (size // 27 + 1))[:size],
+    }
+
+
+def main():
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="InfoExtractor.extract 벤치마크")
+    parser.add_argument("--size", type=int, default=5000, help="입력 길이 (기본: 5000)")
+    parser.add_argument("--number", type=int, default=1000, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    extractor = InfoExtractor()
+    print(f"InfoExtractor.extract ({args.size}자 입력, {args.number}회 반복)")
+    for name, text in build_inputs(args.size).items():
+        best = min(timeit.repeat(lambda: extractor.extract(text), number=args.number, repeat=5))
+        print(f"  {name:<18} {best / args.number * 1e6:9.1f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+#!/usr/bin/env python
+"""
+세션 API 부하 테스트
+
+demo_data의 시나리오 5개를 N명의 가상 사용자가 동시에 재생하며
+/api/session/start → /api/session/continue (SRS 완료까지)를 호출하고,
+엔드포인트별 p50/p95/p99 지연 시간, 처리량, 오류율을 측정합니다.
+
+사용법:
+    # 실행 중인 서버 대상
+    python benchmarks/load_test.py --users 20 --sessions 3
+
+    # 서버 없이 앱을 프로세스 내에서 호출 (LLM 시뮬레이터와 함께 사용)
+    LLM_BACKEND=simulator python benchmarks/load_test.py --in-process --users 50
+
+    # 프로세스 내 실행은 LLM 응답 캐시를 끄고 측정 (가상 사용자들이 같은 시나리오를 재생하므로
+    # 캐시가 켜져 있으면 대부분의 LLM 호출이 캐시 적중이 됨). 캐시 효과를 볼 때만 켬
+    LLM_BACKEND=simulator python benchmarks/load_test.py --in-process --llm-cache
+
+    # 결과 저장 및 이전 실행과 비교
+    python benchmarks/load_test.py --output results/run2.json --compare results/run1.json
+
+httpx가 필요합니다 (pip install httpx).
+"""
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+
+DEMO_DIR = Path(__file__).parent.parent / "demo_data"
+
+START_ENDPOINT = "/api/session/start"
+CONTINUE_ENDPOINT = "/api/session/continue"
+
+# 시나리오 답변을 모두 소진한 뒤 Judge의 필수 항목(배포/인증/결제/규모)을 채우는 보충 답변
+FOLLOW_UP_ANSWER = (
+    "AWS 클라우드에 Docker로 배포하고, JWT 인증을 사용합니다. "
+    "결제는 토스페이먼츠를 쓰고, 사용자는 월 1만 명 정도입니다."
+)
+
+
+def load_scenarios() -> List[Dict[str, Any]]:
+    """
+    데모 시나리오 로드
+
+    Returns:
+        시나리오 리스트 (파일명 순)
+    """
+    return [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(DEMO_DIR.glob("scenario_*.json"))
+    ]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    nearest-rank 방식 백분위수
+
+    Args:
+        sorted_values: 오름차순 정렬된 값
+        pct: 백분위 (0 ~ 100)
+
+    Returns:
+        백분위수 (값이 없으면 0.0)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class LoadTestRecorder:
+    """엔드포인트별 지연 시간/오류 및 세션 결과 집계"""
+
+    def __init__(self):
+        """집계 초기화"""
+        self.latencies: Dict[str, List[float]] = {START_ENDPOINT: [], CONTINUE_ENDPOINT: []}
+        self.errors: Dict[str, int] = {START_ENDPOINT: 0, CONTINUE_ENDPOINT: 0}
+        self.error_samples: List[str] = []
+        self.sessions = {"completed": 0, "incomplete": 0, "failed": 0}
+        self.session_durations: List[float] = []
+
+    def record(self, endpoint: str, elapsed_ms: float, error: Optional[str] = None) -> None:
+        """
+        요청 1건 기록
+
+        Args:
+            endpoint: 엔드포인트 경로
+            elapsed_ms: 응답 시간 (밀리초)
+            error: 오류 설명 (성공이면 None)
+        """
+        self.latencies[endpoint].append(elapsed_ms)
+        if error is not None:
+            self.errors[endpoint] += 1
+            if len(self.error_samples) < 10:
+                self.error_samples.append(f"{endpoint}: {error}")
+
+    def summary(self, wall_seconds: float) -> Dict[str, Any]:
+        """
+        측정 결과 요약
+
+        Args:
+            wall_seconds: 전체 실행 시간 (초)
+
+        Returns:
+            엔드포인트별 통계와 전체 처리량/오류율
+        """
+        endpoints = {}
+        for endpoint, values in self.latencies.items():
+            ordered = sorted(values)
+            count = len(ordered)
+            endpoints[endpoint] = {
+                "requests": count,
+                "errors": self.errors[endpoint],
+                "error_rate": round(self.errors[endpoint] / count, 4) if count else 0.0,
+                "mean_ms": round(sum(ordered) / count, 2) if count else 0.0,
+                "p50_ms": round(percentile(ordered, 50), 2),
+                "p95_ms": round(percentile(ordered, 95), 2),
+                "p99_ms": round(percentile(ordered, 99), 2),
+                "max_ms": round(ordered[-1], 2) if count else 0.0,
+            }
+
+        total_requests = sum(len(values) for values in self.latencies.values())
+        total_errors = sum(self.errors.values())
+        durations = sorted(self.session_durations)
+        return {
+            "wall_seconds": round(wall_seconds, 3),
+            "requests": total_requests,
+            "errors": total_errors,
+            "error_rate": round(total_errors / total_requests, 4) if total_requests else 0.0,
+            "throughput_rps": round(total_requests / wall_seconds, 2) if wall_seconds else 0.0,
+            "sessions": dict(self.sessions),
+            "session_p50_s": round(percentile(durations, 50), 3),
+            "session_p95_s": round(percentile(durations, 95), 3),
+            "endpoints": endpoints,
+            "error_samples": list(self.error_samples),
+        }
+
+
+async def timed_post(
+    client: httpx.AsyncClient,
+    recorder: LoadTestRecorder,
+    endpoint: str,
+    payload: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    POST 요청 1건 실행 및 기록
+
+    Args:
+        client: HTTP 클라이언트
+        recorder: 결과 집계기
+        endpoint: 엔드포인트 경로
+        payload: 요청 본문
+
+    Returns:
+        성공 시 응답 JSON, 실패 시 None
+    """
+    started = time.perf_counter()
+    try:
+        response = await client.post(endpoint, json=payload)
+    except httpx.HTTPError as e:
+        recorder.record(endpoint, (time.perf_counter() - started) * 1000, f"{type(e).__name__}: {e}")
+        return None
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if response.status_code >= 400:
+        recorder.record(endpoint, elapsed_ms, f"HTTP {response.status_code}")
+        return None
+
+    recorder.record(endpoint, elapsed_ms)
+    return response.json()
+
+
+async def run_session(
+    client: httpx.AsyncClient,
+    recorder: LoadTestRecorder,
+    scenario: Dict[str, Any],
+    max_turns: int
+) -> None:
+    """
+    시나리오 1개를 인터뷰 완료까지 재생
+
+    예상 답변을 순서대로 보내고, 소진되면 보충 답변으로 완료될 때까지 이어갑니다.
+
+    Args:
+        client: HTTP 클라이언트
+        recorder: 결과 집계기
+        scenario: 데모 시나리오
+        max_turns: 세션당 최대 continue 호출 수
+    """
+    started = time.perf_counter()
+    result = await timed_post(client, recorder, START_ENDPOINT, {"initial_input": scenario["initial_input"]})
+    if result is None:
+        recorder.sessions["failed"] += 1
+        return
+
+    session_id = result["session_id"]
+    answers = [item["answer"] for item in scenario["expected_questions"]]
+    for turn in range(max_turns):
+        if result["is_complete"]:
+            break
+        answer = answers[turn] if turn < len(answers) else FOLLOW_UP_ANSWER
+        result = await timed_post(
+            client, recorder, CONTINUE_ENDPOINT,
+            {"session_id": session_id, "user_response": answer}
+        )
+        if result is None:
+            recorder.sessions["failed"] += 1
+            return
+
+    recorder.sessions["completed" if result["is_complete"] else "incomplete"] += 1
+    recorder.session_durations.append(time.perf_counter() - started)
+
+
+async def virtual_user(
+    user_index: int,
+    client: httpx.AsyncClient,
+    recorder: LoadTestRecorder,
+    scenarios: List[Dict[str, Any]],
+    sessions: int,
+    max_turns: int,
+    start_delay: float
+) -> None:
+    """
+    가상 사용자 1명 (시나리오를 순환하며 세션을 연속 실행)
+
+    Args:
+        user_index: 사용자 번호 (시나리오 선택 오프셋)
+        client: HTTP 클라이언트
+        recorder: 결과 집계기
+        scenarios: 데모 시나리오 목록
+        sessions: 실행할 세션 수
+        max_turns: 세션당 최대 continue 호출 수
+        start_delay: 시작 지연 (ramp-up, 초)
+    """
+    await asyncio.sleep(start_delay)
+    for k in range(sessions):
+        await run_session(client, recorder, scenarios[(user_index + k) % len(scenarios)], max_turns)
+
+
+def make_client(args: argparse.Namespace) -> httpx.AsyncClient:
+    """대상 서버 또는 프로세스 내 앱에 연결된 클라이언트 생성"""
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    if args.in_process:
+        # 전역 응답 캐시는 모듈 로드 시 설정으로 만들어지므로 앱을 불러오기 전에 설정
+        settings.llm_cache_enabled = args.llm_cache
+        from backend.presentation.main import app
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://loadtest",
+            timeout=args.timeout,
+        )
+    return httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits)
+
+
+async def run_load_test(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    부하 테스트 실행
+
+    Args:
+        args: CLI 인자
+
+    Returns:
+        실행 설정과 측정 요약
+    """
+    scenarios = load_scenarios()
+    recorder = LoadTestRecorder()
+
+    async with make_client(args) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            virtual_user(
+                i, client, recorder, scenarios, args.sessions, args.max_turns,
+                args.ramp_up * i / args.users
+            )
+            for i in range(args.users)
+        ])
+        wall_seconds = time.perf_counter() - started
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "target": "in-process" if args.in_process else args.base_url,
+            "users": args.users,
+            "sessions_per_user": args.sessions,
+            "ramp_up_s": args.ramp_up,
+            "llm_backend": settings.llm_backend,
+            "workflow_parallel": settings.workflow_parallel,
+            "llm_cache_enabled": settings.llm_cache_enabled,
+        },
+        "summary": recorder.summary(wall_seconds),
+    }
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    """측정 요약 출력"""
+    meta, summary = result["meta"], result["summary"]
+    print(
+        f"대상: {meta['target']} | 사용자 {meta['users']}명 × 세션 {meta['sessions_per_user']}개 | "
+        f"LLM 캐시 {'켬' if meta.get('llm_cache_enabled') else '끔'}"
+    )
+    print(f"  {'endpoint':<24}{'reqs':>7}{'err%':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}  (ms)")
+    for endpoint, stats in summary["endpoints"].items():
+        print(
+            f"  {endpoint:<24}{stats['requests']:>7}{stats['error_rate'] * 100:>7.1f}%"
+            f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}"
+        )
+    sessions = summary["sessions"]
+    print(
+        f"  처리량 {summary['throughput_rps']:.1f} req/s | 오류율 {summary['error_rate'] * 100:.2f}% | "
+        f"세션 완료 {sessions['completed']} / 미완료 {sessions['incomplete']} / 실패 {sessions['failed']} | "
+        f"소요 {summary['wall_seconds']:.1f}s"
+    )
+    for sample in summary["error_samples"]:
+        print(f"  ⚠️ {sample}")
+
+
+def print_comparison(result: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """이전 실행 결과 대비 변화율 출력"""
+    def delta(current: float, previous: float) -> str:
+        if not previous:
+            return "    n/a"
+        return f"{(current - previous) / previous * 100:+7.1f}%"
+
+    current, previous = result["summary"], baseline["summary"]
+    print(f"비교 기준: {baseline['meta']['timestamp']} ({baseline['meta']['target']})")
+    for endpoint, stats in current["endpoints"].items():
+        before = previous["endpoints"].get(endpoint)
+        if before is None:
+            continue
+        print(
+            f"  {endpoint:<24} p50 {delta(stats['p50_ms'], before['p50_ms'])}"
+            f"  p95 {delta(stats['p95_ms'], before['p95_ms'])}"
+            f"  p99 {delta(stats['p99_ms'], before['p99_ms'])}"
+        )
+    print(
+        f"  처리량 {delta(current['throughput_rps'], previous['throughput_rps'])}"
+        f" | 오류율 {previous['error_rate'] * 100:.2f}% → {current['error_rate'] * 100:.2f}%"
+    )
+
+
+def main():
+    """부하 테스트 CLI"""
+    parser = argparse.ArgumentParser(description="세션 API 부하 테스트")
+    parser.add_argument("--base-url", default=settings.backend_url, help="대상 서버 URL")
+    parser.add_argument("--in-process", action="store_true", help="서버 없이 앱을 직접 호출")
+    parser.add_argument("--users", type=int, default=10, help="동시 가상 사용자 수 (기본: 10)")
+    parser.add_argument("--sessions", type=int, default=1, help="사용자당 세션 수 (기본: 1)")
+    parser.add_argument("--max-turns", type=int, default=8, help="세션당 최대 답변 횟수 (기본: 8)")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="사용자 시작을 분산할 시간 (초)")
+    parser.add_argument(
+        "--llm-cache", action="store_true",
+        help="--in-process 실행에서 LLM 응답 캐시 사용 (기본: 끔, 원격 서버는 서버 설정을 따름)"
+    )
+    parser.add_argument("--timeout", type=float, default=120.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+
+    if args.users < 1 or args.sessions < 1:
+        parser.error("--users와 --sessions는 1 이상이어야 합니다")
+
+    result = asyncio.run(run_load_test(args))
+    print_report(result)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print_comparison(result, baseline)
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
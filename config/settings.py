@@ -20,8 +20,44 @@ class Settings(BaseSettings):
     model_name: str = "gemini-2.0-flash-exp"
     temperature: float = 0.7
 
+    # LLM 응답 캐시 설정
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = 1000
+    llm_cache_ttl: int = 3600  # 초 (0이면 만료 없음)
+    llm_cache_db_path: str = ""  # 비어 있으면 디스크 캐시 사용 안 함
+
+    # LLM 백엔드 설정 (simulator: 네트워크 없이 시나리오 기반 응답, 부하 테스트용)
+    llm_backend: str = "gemini"  # gemini | simulator
+    llm_sim_scenario_dir: str = "demo_data"
+    llm_sim_latency_ms: float = 800.0  # 호출당 지연 시간 중앙값
+    llm_sim_latency_distribution: str = "lognormal"  # fixed | uniform | lognormal
+    llm_sim_latency_spread: float = 0.5  # uniform: 중앙값 대비 비율, lognormal: sigma
+    llm_sim_error_rate: float = 0.0  # 호출당 API 오류 확률
+    llm_sim_rate_limit_rate: float = 0.0  # 호출당 429 응답 확률
+    llm_sim_seed: int = 42
+
     # 워크플로우 설정
     max_iterations: int = 5
+    workflow_parallel: bool = False  # Consultant/Judge LLM 호출 동시 실행
+    workflow_engine: str = "dummy"  # dummy | graph (노드 그래프 + 노드별 체크포인트)
+    workflow_checkpoint_path: str = "data/checkpoints.db"  # graph 엔진 체크포인트 DB 경로
+    prompt_history_token_budget: int = 1500  # 프롬프트 대화 히스토리 토큰 예산
+    judge_context_token_budget: int = 2000  # Judge 사용자 프롬프트 전체 토큰 예산
+    judge_fast_path_enabled: bool = True  # 필수 항목 누락 시 Judge LLM 호출 생략
+    speculative_question_enabled: bool = False  # 사용자 답변 전에 다음 질문 미리 생성
+
+    # 예시 힌트 색인 설정 (색인에 없는 질문은 폴백 힌트로 응답하고 LLM 힌트는 백그라운드 생성)
+    hint_index_enabled: bool = True
+    hint_index_scenario_dir: str = "demo_data"
+    hint_index_path: str = ""  # 비어 있으면 생성한 힌트를 디스크에 저장하지 않음
+    hint_index_min_similarity: float = 0.5  # 유사 질문 판정 bigram Jaccard 유사도
+    hint_index_max_candidates: int = 32  # 조회 1회에 유사도를 계산할 최대 후보 질문 수
+
+    # 일괄 SRS 생성 설정
+    batch_max_items: int = 100  # 요청당 최대 항목 수
+    batch_concurrency: int = 4  # 요청당 기본 동시 처리 항목 수
+    batch_max_concurrency: int = 16  # 프로세스 전체 동시 처리 항목 수 상한
+    batch_item_timeout: float = 300.0  # 항목당 처리 제한 시간 (초)
 
     # API 설정
     api_host: str = "0.0.0.0"
@@ -35,6 +71,18 @@ class Settings(BaseSettings):
 
     # Session 설정
     session_timeout: int = 3600
+    session_backend: str = "memory"  # memory | sqlite
+    session_db_path: str = "data/sessions.db"
+    session_flush_interval: float = 0.5  # write-behind 주기 (초, 0이면 즉시 기록)
+    session_sweep_interval: float = 60.0  # 만료 세션 정리 주기 (초)
+    session_max_count: int = 0  # 최대 세션 수 (0이면 제한 없음, memory 전용)
+    session_max_bytes: int = 0  # 최대 세션 총 크기 (0이면 제한 없음, memory 전용)
+    session_history_max_messages: int = 40  # 세션당 원문으로 보관할 최근 메시지 수 (0이면 제한 없음)
+    session_lock_timeout: float = 30.0  # 같은 세션의 이전 턴이 끝나기를 기다리는 최대 시간 (초)
+    session_lock_lease: float = 120.0  # 세션 락 유효 시간 (초, sqlite 전용, 워커가 죽으면 이후 회수)
+    session_save_retries: int = 2  # 저장 버전 충돌 시 턴 재실행 횟수 (초과하면 409)
+    session_trace_turns: int = 50  # 세션과 함께 보관할 최근 턴 트레이스 수 (/timings)
+    idempotency_key_ttl: int = 3600  # Idempotency-Key별 첫 응답 보관 시간 (초)
 
     # 로깅 설정
     log_level: str = "INFO"
@@ -487,17 +487,15 @@ def show_completion_screen():
     st.divider()
 
     try:
-        # SRS 조회
-        result = api_client.get_srs(st.session_state.session_id)
+        # SRS 조회 (완료 시점에 미리 만들어 둔 Markdown / 파싱된 딕셔너리 사용)
+        result = api_client.get_srs(st.session_state.session_id, format="markdown")
         srs_json = result.get("final_srs")
 
         if srs_json:
-            # final_srs가 이미 문자열이므로 JSON 파싱
-            if isinstance(srs_json, str):
-                srs_data = json.loads(srs_json)
-            else:
-                # 이미 딕셔너리인 경우 그대로 사용
-                srs_data = srs_json
+            srs_data = result.get("srs_data")
+            if srs_data is None:
+                # final_srs가 이미 문자열이므로 JSON 파싱
+                srs_data = json.loads(srs_json) if isinstance(srs_json, str) else srs_json
 
 
             # 다운로드 섹션 - Download Buttons
@@ -507,8 +505,7 @@ def show_completion_screen():
 
             with col1:
                 # Markdown 다운로드 (파란색 버튼)
-                formatter = SRSFormatter()
-                markdown_content = formatter.to_markdown(srs_data)
+                markdown_content = result.get("content") or SRSFormatter().to_markdown(srs_data)
 
                 st.download_button(
                     label="📄 Markdown",
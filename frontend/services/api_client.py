@@ -51,17 +51,18 @@ class APIClient:
         """
         return self.continue_session_uc.execute(session_id, user_response)
 
-    def get_srs(self, session_id: str) -> Dict[str, Any]:
+    def get_srs(self, session_id: str, format: str = "json") -> Dict[str, Any]:
         """
         SRS 문서 조회
 
         Args:
             session_id: 세션 ID
+            format: 문서 형식 (json, markdown)
 
         Returns:
-            SRS 문서
+            SRS 문서 (content: 요청한 형식의 문서, srs_data: 파싱된 딕셔너리)
         """
-        return self.get_srs_uc.execute(session_id)
+        return self.get_srs_uc.execute(session_id, format)
 
     def get_session_status(self, session_id: str) -> Dict[str, Any]:
         """
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+"""
+일괄 SRS 생성 CLI
+
+스프레드시트에서 내보낸 프로젝트 요청(CSV/JSON/JSONL)을 읽어 대화 없이 SRS를 생성하고,
+항목이 끝나는 순서대로 결과를 NDJSON으로 출력합니다.
+
+입력 형식:
+    CSV   : initial_input 열 필수, id 열 선택, answer로 시작하는 열(answer_1, answer_2, ...)은 답변
+    JSON  : [{"id": ..., "initial_input": ..., "answers": [...]}, ...] 또는 {"items": [...]}
+    JSONL : 한 줄에 항목 하나
+
+사용법:
+    python scripts/batch_srs.py requests.csv > results.ndjson
+    python scripts/batch_srs.py requests.jsonl --concurrency 8 --output results.ndjson
+    python scripts/batch_srs.py requests.csv --url http://localhost:8000   # 실행 중인 서버의 /api/srs/batch 사용
+
+--url을 쓰려면 httpx가 필요합니다 (pip install httpx).
+"""
+import argparse
+import asyncio
+import csv
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, TextIO
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+
+
+def load_items(path: Path) -> List[Dict[str, Any]]:
+    """
+    입력 파일에서 항목 로드
+
+    Args:
+        path: CSV, JSON, JSONL 파일 경로
+
+    Returns:
+        {"id", "initial_input", "answers"} 항목 리스트
+    """
+    suffix = path.suffix.lower()
+    text = path.read_text(encoding="utf-8-sig")
+
+    if suffix == ".csv":
+        rows = list(csv.DictReader(text.splitlines()))
+        items = []
+        for number, row in enumerate(rows, start=1):
+            answer_columns = sorted(
+                (column for column in row if column and column.lower().startswith("answer")),
+                key=_column_order
+            )
+            items.append({
+                "id": row.get("id") or str(number),
+                "initial_input": row.get("initial_input") or "",
+                "answers": [row[column] for column in answer_columns if row[column]],
+            })
+        return items
+
+    if suffix == ".jsonl":
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    data = json.loads(text)
+    return data["items"] if isinstance(data, dict) else data
+
+
+def _column_order(column: str):
+    """answer_2 < answer_10 순서가 되도록 숫자 접미사 기준 정렬 키"""
+    digits = "".join(ch for ch in column if ch.isdigit())
+    return (int(digits) if digits else 0, column)
+
+
+def chunked(items: List[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """요청당 최대 항목 수 단위로 나누기"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+async def run_local(items: List[Dict[str, Any]], concurrency: int, out: TextIO) -> Dict[str, int]:
+    """
+    프로세스 내 Use Case로 일괄 생성
+
+    Args:
+        items: 입력 항목
+        concurrency: 동시 처리 항목 수
+        out: NDJSON 출력 스트림
+
+    Returns:
+        상태별 항목 수
+    """
+    from backend.application.use_cases.batch_srs_use_case import BatchSRSUseCase
+
+    counts = {"ok": 0, "error": 0}
+    use_case = BatchSRSUseCase()
+    offset = 0
+    for chunk in chunked(items, settings.batch_max_items):
+        async for result in use_case.stream(chunk, concurrency=concurrency):
+            result["index"] += offset
+            _write(out, result, counts)
+        offset += len(chunk)
+    return counts
+
+
+async def run_remote(items: List[Dict[str, Any]], concurrency: int, url: str, out: TextIO) -> Dict[str, int]:
+    """
+    서버의 /api/srs/batch로 일괄 생성 (NDJSON 응답을 받는 대로 출력)
+
+    Args:
+        items: 입력 항목
+        concurrency: 동시 처리 항목 수
+        url: 서버 URL
+        out: NDJSON 출력 스트림
+
+    Returns:
+        상태별 항목 수
+    """
+    import httpx
+
+    counts = {"ok": 0, "error": 0}
+    offset = 0
+    async with httpx.AsyncClient(base_url=url, timeout=None) as client:
+        for chunk in chunked(items, settings.batch_max_items):
+            async with client.stream(
+                "POST", "/api/srs/batch",
+                json={"items": chunk, "concurrency": concurrency}
+            ) as response:
+                if response.status_code != 200:
+                    body = await response.aread()
+                    raise SystemExit(f"❌ 요청 실패 (HTTP {response.status_code}): {body.decode('utf-8')}")
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    result = json.loads(line)
+                    if "index" in result:
+                        result["index"] += offset
+                    _write(out, result, counts)
+            offset += len(chunk)
+    return counts
+
+
+def _write(out: TextIO, result: Dict[str, Any], counts: Dict[str, int]) -> None:
+    """결과 한 줄 출력 및 집계, 진행 상황은 stderr로"""
+    out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    out.flush()
+    status = result.get("status", "error")
+    counts[status] = counts.get(status, 0) + 1
+    mark = "✅" if status == "ok" else "❌"
+    print(f"{mark} [{result.get('index')}] {result.get('id')} ({result.get('duration_ms', 0)} ms)", file=sys.stderr)
+
+
+def main():
+    """일괄 SRS 생성 CLI"""
+    parser = argparse.ArgumentParser(description="일괄 SRS 생성")
+    parser.add_argument("input", help="입력 파일 (.csv, .json, .jsonl)")
+    parser.add_argument("--output", help="NDJSON 출력 파일 (기본: stdout)")
+    parser.add_argument("--concurrency", type=int, default=settings.batch_concurrency, help="동시 처리 항목 수")
+    parser.add_argument("--url", help="서버 URL (지정하지 않으면 프로세스 내에서 실행)")
+    args = parser.parse_args()
+
+    items = load_items(Path(args.input))
+    if not items:
+        parser.error("입력 항목이 없습니다")
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if args.url:
+            counts = asyncio.run(run_remote(items, args.concurrency, args.url, out))
+        else:
+            counts = asyncio.run(run_local(items, args.concurrency, out))
+    finally:
+        if args.output:
+            out.close()
+
+    print(f"완료: 성공 {counts.get('ok', 0)} / 실패 {counts.get('error', 0)} (총 {len(items)}개)", file=sys.stderr)
+    if counts.get("error"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
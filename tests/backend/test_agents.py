@@ -1,9 +1,18 @@
 """Domain Agents Test Suite"""
+import asyncio
 import pytest
 from backend.domain.models.state import RequirementState, Message
-from backend.domain.agents.consultant_agent import consultant_agent
-from backend.domain.agents.judge_agent import judge_agent
-from backend.domain.agents.writer_agent import writer_agent
+from backend.domain.agents.consultant_agent import consultant_agent, consultant_agent_async
+from backend.domain.agents.judge_agent import judge_agent, judge_agent_async
+from backend.domain.agents.writer_agent import writer_agent, writer_agent_async, ProjectProfile
+from backend.domain.agents.speculation import (
+    SpeculativeQuestion,
+    is_speculation_valid,
+    predict_next_category,
+    question_category,
+)
+from backend.infrastructure.graph.workflow import DummyWorkflow
+from backend.utils.tracing import TraceRecorder, trace_turn
 
 
 class TestConsultantAgent:
@@ -82,6 +91,88 @@ class TestJudgeAgent:
         assert result.judge_feedback is not None
         assert isinstance(result.judge_feedback, str)
 
+    def test_judge_agent_fast_path_skips_llm(self, monkeypatch):
+        """필수 항목이 빠져 있으면 LLM 없이 reject하고 절약한 호출을 기록하는지 테스트"""
+        def fail():
+            raise AssertionError("LLM client should not be used")
+
+        monkeypatch.setattr("backend.domain.agents.judge_agent.get_llm_client", fail)
+        monkeypatch.setattr("backend.utils.tracing._recorder", TraceRecorder())
+        state = RequirementState(
+            user_input="쇼핑몰",
+            collected_info={"project_type": "이커머스", "authentication": "JWT"}
+        )
+
+        with trace_turn("judge-fast-path") as trace:
+            result = asyncio.run(judge_agent_async(state))
+
+        assert result.is_complete is False
+        assert result.judge_feedback == "추가 정보 필요: 배포 환경, 예상 규모, 결제 수단"
+        assert [stage.name for stage in trace.stages] == ["judge_rules"]
+        assert trace.stages[0].llm_calls == 0
+        assert trace.stages[0].llm_calls_saved == 1
+
+
+class TestSpeculativeQuestion:
+    """다음 질문 사전 생성 테스트"""
+
+    def _asked_payment_state(self):
+        """결제 수단을 방금 물어본 이커머스 상태"""
+        state = RequirementState(
+            user_input="쇼핑몰",
+            collected_info={"project_type": "이커머스"},
+            questions=["어떤 결제 수단을 지원하시겠습니까?"],
+            iteration_count=1
+        )
+        state.messages.append(Message(role="assistant", content="추가 정보가 필요합니다:\n\n어떤 결제 수단을 지원하시겠습니까?"))
+        return state
+
+    def test_predicts_next_priority_category(self):
+        """방금 한 질문의 항목은 답변된다고 보고 다음 우선순위 항목을 추측하는지 테스트"""
+        state = self._asked_payment_state()
+
+        assert question_category("회원 인증 방식은?") == "authentication"
+        assert question_category("관리자 페이지가 필요한가요?") is None
+        assert predict_next_category(state) == "authentication"
+
+    def test_speculation_validated_against_new_answer(self):
+        """새로 추출한 정보로도 같은 항목을 물어야 할 때만 유효한지 테스트"""
+        speculation = SpeculativeQuestion(category="authentication", question="회원 인증 방식은?", iteration=1)
+
+        answered = self._asked_payment_state()
+        answered.collected_info["payment"] = "카카오페이"
+        assert is_speculation_valid(speculation, answered) is True
+
+        unanswered = self._asked_payment_state()
+        assert is_speculation_valid(speculation, unanswered) is False
+
+        answered.iteration_count = 2
+        assert is_speculation_valid(speculation, answered) is False
+
+    def test_workflow_serves_speculation_without_consultant_llm(self, monkeypatch):
+        """검증된 질문이 있으면 Consultant LLM 없이 질문과 힌트를 적용하는지 테스트"""
+        async def fail(state):
+            raise AssertionError("consultant should not run")
+
+        workflow = DummyWorkflow()
+        monkeypatch.setattr(workflow, "consultant_agent_async", fail)
+        state = self._asked_payment_state()
+        state.collected_info["payment"] = "카카오페이"
+        speculation = SpeculativeQuestion(
+            category="authentication", question="회원 인증 방식은?",
+            example_hint="💡 예: 이메일/비밀번호 등", iteration=1
+        )
+
+        monkeypatch.setattr("backend.utils.tracing._recorder", TraceRecorder())
+        with trace_turn("speculation") as trace:
+            result = asyncio.run(workflow.run_async(state, speculation))
+
+        assert result.questions == ["회원 인증 방식은?"]
+        stages = {stage.name: stage for stage in trace.stages}
+        assert "consultant_llm" not in stages
+        assert stages["speculative_question"].llm_calls_saved == 1
+        assert result.messages[-1].content.endswith("회원 인증 방식은?\n\n💡 예: 이메일/비밀번호 등")
+
 
 class TestWriterAgent:
     """Writer Agent 테스트"""
@@ -118,3 +209,49 @@ class TestWriterAgent:
         result = writer_agent(state)
 
         assert result.final_srs is not None
+
+    def test_project_profile_classifies_once(self):
+        """ProjectProfile이 입력과 초기 요청을 함께 분류하는지 테스트"""
+        profile = ProjectProfile.classify(
+            "모바일 앱으로 예약하고 실시간 알림을 받고 싶습니다",
+            {"initial_request": "숙박 예약 플랫폼"},
+            "대규모 트래픽"
+        )
+
+        assert profile.is_booking
+        assert profile.is_realtime
+        assert profile.is_mobile
+        assert profile.is_large_scale
+        assert not profile.is_ecommerce
+        assert not profile.is_small_scale
+
+
+class TestAsyncAgents:
+    """비동기 에이전트 테스트"""
+
+    def test_consultant_agent_async_generates_questions(self):
+        """비동기 Consultant가 질문과 메시지를 생성하는지 테스트"""
+        state = RequirementState(user_input="쇼핑몰을 만들고 싶습니다")
+        result = asyncio.run(consultant_agent_async(state))
+
+        assert len(result.questions) > 0
+        assert result.messages[-1].role == "assistant"
+
+    def test_judge_agent_async_matches_sync(self):
+        """비동기 Judge가 동기 버전과 같은 판정을 내리는지 테스트"""
+        info = {"project_type": "이커머스", "authentication": "JWT"}
+        sync_result = judge_agent(RequirementState(user_input="쇼핑몰", collected_info=dict(info)))
+        async_result = asyncio.run(
+            judge_agent_async(RequirementState(user_input="쇼핑몰", collected_info=dict(info)))
+        )
+
+        assert async_result.is_complete == sync_result.is_complete
+        assert async_result.judge_feedback == sync_result.judge_feedback
+
+    def test_writer_agent_async_generates_srs(self):
+        """비동기 Writer가 SRS를 생성하는지 테스트"""
+        state = RequirementState(user_input="쇼핑몰 프로젝트", is_complete=True)
+        result = asyncio.run(writer_agent_async(state))
+
+        assert result.final_srs is not None
+
@@ -1,4 +1,5 @@
 """API Test Suite"""
+import json
 import pytest
 from fastapi.testclient import TestClient
 from backend.presentation.main import app
@@ -44,6 +45,31 @@ class TestSessionAPI:
         data = continue_response.json()
         assert data["session_id"] == session_id
 
+    def test_idempotency_key_replays_first_response(self):
+        """같은 Idempotency-Key 재시도가 턴을 다시 실행하지 않고 첫 응답을 반환하는지 테스트"""
+        start_body = {"initial_input": "온라인 쇼핑몰을 만들고 싶습니다"}
+        first_start = client.post("/api/session/start", json=start_body, headers={"Idempotency-Key": "start-1"})
+        retried_start = client.post("/api/session/start", json=start_body, headers={"Idempotency-Key": "start-1"})
+        assert first_start.status_code == 200
+        assert retried_start.json() == first_start.json()
+        session_id = first_start.json()["session_id"]
+
+        body = {"session_id": session_id, "user_response": "카카오 로그인을 사용합니다"}
+        first = client.post("/api/session/continue", json=body, headers={"Idempotency-Key": "turn-1"})
+        retried = client.post("/api/session/continue", json=body, headers={"Idempotency-Key": "turn-1"})
+
+        assert first.status_code == 200
+        assert retried.json() == first.json()
+        timings = client.get(f"/api/session/{session_id}/timings").json()
+        assert len(timings["turns"]) == 2
+
+        reused = client.post(
+            "/api/session/continue",
+            json={**body, "user_response": "AWS에 배포합니다"},
+            headers={"Idempotency-Key": "turn-1"}
+        )
+        assert reused.status_code == 422
+
     def test_get_session_status(self):
         """세션 상태 조회 API 테스트"""
         # 세션 생성
@@ -113,3 +139,132 @@ class TestSRSAPI:
         data = info_response.json()
         assert "session_id" in data
         assert "collected_info" in data
+
+    def test_continue_session_stream(self):
+        """세션 계속 SSE 스트리밍 API 테스트"""
+        start_response = client.post(
+            "/api/session/start",
+            json={"initial_input": "온라인 쇼핑몰을 만들고 싶습니다"}
+        )
+        session_id = start_response.json()["session_id"]
+
+        response = client.post(
+            "/api/session/continue/stream",
+            json={"session_id": session_id, "user_response": "카드 결제 지원"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "event: consultant_token" in response.text
+        assert "event: judge" in response.text
+        assert response.text.rstrip().split("\n\n")[-1].startswith("event: done")
+
+    def test_continue_session_stream_not_found(self):
+        """존재하지 않는 세션 스트리밍 시 404 테스트"""
+        response = client.post(
+            "/api/session/continue/stream",
+            json={"session_id": "missing-session", "user_response": "답변"}
+        )
+
+        assert response.status_code == 404
+
+    def test_stream_srs(self):
+        """SRS 섹션 SSE 스트리밍 API 테스트"""
+        start_response = client.post(
+            "/api/session/start",
+            json={"initial_input": "사내 인트라넷 테스트 프로젝트"}
+        )
+        session_id = start_response.json()["session_id"]
+
+        response = client.get(f"/api/srs/{session_id}/stream")
+
+        assert response.status_code == 200
+        assert "event: srs_section" in response.text
+        assert "event: done" in response.text
+        # 진행 중인 세션의 미리보기는 저장하지 않음
+        assert '"final_srs": null' in response.text
+        assert client.get(f"/api/srs/{session_id}").json()["final_srs"] is None
+
+    def test_get_srs_markdown_with_etag(self):
+        """Markdown 조회 및 If-None-Match 304 응답 테스트"""
+        batch_response = client.post(
+            "/api/srs/batch",
+            json={"items": [{"initial_input": "사내 인트라넷 테스트 프로젝트"}]}
+        )
+        session_id = json.loads(batch_response.text.splitlines()[0])["session_id"]
+
+        response = client.get(f"/api/srs/{session_id}?format=markdown")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/markdown")
+        assert response.text.startswith("# ")
+        etag = response.headers["etag"]
+
+        cached = client.get(
+            f"/api/srs/{session_id}?format=markdown",
+            headers={"If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        # JSON 표현은 ETag가 다름
+        json_response = client.get(f"/api/srs/{session_id}", headers={"If-None-Match": etag})
+        assert json_response.status_code == 200
+        assert json_response.headers["etag"] != etag
+
+    def test_get_session_timings_and_metrics(self):
+        """턴별 단계 소요 시간 및 Prometheus 메트릭 API 테스트"""
+        start_response = client.post(
+            "/api/session/start",
+            json={"initial_input": "온라인 쇼핑몰을 만들고 싶습니다"}
+        )
+        session_id = start_response.json()["session_id"]
+
+        response = client.get(f"/api/session/{session_id}/timings")
+
+        assert response.status_code == 200
+        turns = response.json()["turns"]
+        assert len(turns) == 1
+        stages = [stage["name"] for stage in turns[0]["stages"]]
+        assert stages[0] == "info_extraction"
+        assert stages[-1] == "repository_save"
+        assert "consultant_llm" in stages
+
+        metrics = client.get("/metrics")
+        assert metrics.status_code == 200
+        assert metrics.headers["content-type"].startswith("text/plain")
+        assert 'specpilot_stage_duration_seconds_count{stage="repository_save"}' in metrics.text
+
+        assert client.get("/api/session/missing-session/timings").status_code == 404
+
+    def test_batch_srs(self):
+        """일괄 SRS 생성 NDJSON API 테스트"""
+        response = client.post(
+            "/api/srs/batch",
+            json={
+                "items": [
+                    {"id": "a", "initial_input": "온라인 쇼핑몰을 만들고 싶습니다", "answers": ["웹 배포, 이메일 로그인"]},
+                    {"id": "b", "initial_input": "사내 인트라넷 테스트 프로젝트"},
+                ],
+                "concurrency": 2
+            }
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        results = [json.loads(line) for line in response.text.splitlines() if line]
+        assert sorted(result["id"] for result in results) == ["a", "b"]
+        assert all(result["status"] == "ok" for result in results)
+        assert all(result["srs"]["project_name"] for result in results)
+
+        invalid = client.post("/api/srs/batch", json={"items": [{"initial_input": "짧음"}]})
+        assert invalid.status_code == 422
+
+    def test_get_session_store_stats(self):
+        """세션 저장소 통계 API 테스트"""
+        response = client.get("/api/session/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert {"sessions", "bytes", "evicted_expired", "evicted_lru"} <= set(data)
+
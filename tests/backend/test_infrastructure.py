@@ -1,7 +1,21 @@
 """Infrastructure Layer Test Suite"""
+import json
+import threading
 import pytest
 from backend.infrastructure.llm.gemini_client import DummyGeminiClient
-from backend.infrastructure.persistence.checkpointer import DummyCheckpointer
+from types import SimpleNamespace
+from backend.infrastructure.llm.gemini_client import GeminiClient, USING_NEW_API
+from backend.infrastructure.llm.client_registry import LLMClientRegistry, create_llm_client
+from backend.infrastructure.llm.simulated_client import SimulatedLLMClient
+from backend.infrastructure.llm.response_cache import LLMResponseCache
+from backend.infrastructure.prompts.hint_index import HintIndex, build_hint_index, normalize_question
+from backend.infrastructure.prompts.prompt_builder import IncrementalPromptBuilder, extract_question
+from backend.infrastructure.prompts.consultant_prompt import get_consultant_prompt
+from backend.infrastructure.prompts.judge_prompt import get_judge_prompt
+from backend.infrastructure.prompts.judge_context import JudgeContextCompactor, compact_collected_info
+from backend.utils.token_utils import estimate_tokens
+from backend.infrastructure.persistence.checkpointer import DummyCheckpointer, SQLiteCheckpointer
+from backend.domain.models.state import RequirementState, Message
 from backend.infrastructure.persistence.state_store import DummyStateStore
 
 
@@ -21,6 +35,358 @@ class TestDummyGeminiClient:
         assert len(response) > 0
 
 
+class TestLLMClientRegistry:
+    """LLM 클라이언트 레지스트리 테스트"""
+
+    def test_same_key_returns_same_client(self):
+        """동일 설정이면 같은 인스턴스를 재사용하는지 테스트"""
+        registry = LLMClientRegistry()
+        first = registry.get_client(model_name="m", temperature=0.5)
+        second = registry.get_client(model_name="m", temperature=0.5)
+        assert first is second
+        assert registry.size() == 1
+
+    def test_different_key_returns_different_client(self):
+        """설정이 다르면 별도 인스턴스를 만드는지 테스트"""
+        registry = LLMClientRegistry()
+        first = registry.get_client(model_name="m", temperature=0.5)
+        second = registry.get_client(model_name="m", temperature=0.9)
+        assert first is not second
+        assert registry.size() == 2
+
+    def test_unhealthy_client_is_replaced(self):
+        """비정상 클라이언트가 교체되는지 테스트"""
+        registry = LLMClientRegistry()
+        first = registry.get_client(model_name="m")
+        first.close()
+
+        report = registry.health_check()
+        assert list(report.values()) == [False]
+        assert registry.size() == 0
+
+        second = registry.get_client(model_name="m")
+        assert second is not first
+
+    def test_replaced_client_closed_after_callers_release(self, monkeypatch):
+        """교체된 Gemini 클라이언트는 사용 중인 호출자가 참조를 놓은 뒤에 닫히는지 테스트"""
+        monkeypatch.setattr(
+            "backend.infrastructure.llm.client_registry.create_llm_client",
+            lambda **kwargs: GeminiClient(api_key="test-key", cache=LLMResponseCache())
+        )
+        registry = LLMClientRegistry(max_consecutive_failures=1)
+        in_use = registry.get_client(model_name="m")
+        closed = []
+        monkeypatch.setattr(in_use.client, "close", lambda: closed.append(True), raising=False)
+
+        in_use.consecutive_failures = 1
+        replacement = registry.get_client(model_name="m")
+        assert replacement is not in_use
+        assert closed == []
+
+        del in_use
+        assert closed == [True]
+
+    def test_shutdown_closes_clients(self):
+        """shutdown이 모든 클라이언트를 닫는지 테스트"""
+        registry = LLMClientRegistry()
+        client = registry.get_client(model_name="m")
+        registry.shutdown()
+        assert registry.size() == 0
+        assert client.is_healthy() is False
+
+
+class TestLLMResponseCache:
+    """LLM 응답 캐시 테스트"""
+
+    def test_key_normalizes_whitespace(self):
+        """공백만 다른 프롬프트는 같은 키인지 테스트"""
+        key1 = LLMResponseCache.make_key("m", 0.7, "질문:  결제\n\n수단은?")
+        key2 = LLMResponseCache.make_key("m", 0.7, " 질문: 결제 수단은? ")
+        assert key1 == key2
+        assert key1 != LLMResponseCache.make_key("m", 0.2, "질문: 결제 수단은?")
+
+    def test_hit_miss_and_ttl(self):
+        """적중/실패 집계와 TTL 만료 테스트"""
+        now = [0.0]
+        cache = LLMResponseCache(ttl_seconds=10, clock=lambda: now[0])
+        key = cache.make_key("m", 0.7, "p")
+
+        assert cache.get(key) is None
+        cache.set(key, "응답")
+        assert cache.get(key) == "응답"
+
+        now[0] = 11
+        assert cache.get(key) is None
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    def test_lru_eviction(self):
+        """최대 항목 수 초과 시 LRU 항목이 제거되는지 테스트"""
+        cache = LLMResponseCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """디스크 캐시가 재시작 후에도 적중하는지 테스트"""
+        db_path = str(tmp_path / "cache.db")
+        first = LLMResponseCache(db_path=db_path)
+        first.set("k", "저장된 응답")
+        first.close()
+
+        second = LLMResponseCache(db_path=db_path)
+        assert second.get("k") == "저장된 응답"
+        assert second.stats()["disk_hits"] == 1
+        second.close()
+
+    @pytest.mark.skipif(not USING_NEW_API, reason="google.genai 클라이언트 필요")
+    def test_client_uses_cache_and_honors_opt_out(self):
+        """GeminiClient가 캐시를 사용하고 use_cache=False면 우회하는지 테스트"""
+        calls = []
+
+        def fake_generate_content(**kwargs):
+            calls.append(kwargs["contents"])
+            return SimpleNamespace(text=f"응답 {len(calls)}")
+
+        client = GeminiClient(api_key="test-key", cache=LLMResponseCache())
+        client.client = SimpleNamespace(models=SimpleNamespace(generate_content=fake_generate_content))
+
+        assert client.generate("같은 질문") == "응답 1"
+        assert client.generate("같은  질문") == "응답 1"
+        assert client.generate("같은 질문", use_cache=False) == "응답 2"
+        assert len(calls) == 2
+
+
+class TestSimulatedLLMClient:
+    """오프라인 LLM 시뮬레이터 테스트"""
+
+    ECOMMERCE_INPUT = "온라인 의류 쇼핑몰을 만들고 싶습니다.\n\n주요 기능:\n- 장바구니"
+
+    def _client(self, **kwargs):
+        """지연 없는 시뮬레이터 생성"""
+        options = {"latency_ms": 0, "latency_distribution": "fixed", "cache": LLMResponseCache(), "seed": 7}
+        options.update(kwargs)
+        return SimulatedLLMClient(**options)
+
+    def test_consultant_replays_next_expected_question(self):
+        """시나리오의 예상 질문을 순서대로 재생하는지 테스트"""
+        client = self._client()
+        prompt = get_consultant_prompt({}, self.ECOMMERCE_INPUT)
+        assert client.generate(prompt) == "사용자 인증 방식은 어떻게 하시겠습니까?"
+
+        history = "Already asked: 사용자 인증 방식은 어떻게 하시겠습니까?"
+        prompt = get_consultant_prompt({}, self.ECOMMERCE_INPUT, history)
+        assert client.generate(prompt) == "어떤 결제 수단을 지원하시겠습니까?"
+
+    def test_judge_approves_only_when_all_answers_collected(self):
+        """예상 답변이 모두 수집되어야 approve하는지 테스트"""
+        client = self._client()
+        scenario = client.scenarios[0]
+        answers = {
+            f"response_{i}": item["answer"]
+            for i, item in enumerate(scenario["expected_questions"])
+        }
+
+        history = f"user: {self.ECOMMERCE_INPUT}"
+
+        partial = get_judge_prompt({"response_0": answers["response_0"]}, history)
+        assert client.generate(partial).startswith("decision: reject")
+
+        complete = get_judge_prompt(answers, history)
+        assert client.generate(complete).startswith("decision: approve")
+
+    def test_injected_faults_are_retried(self):
+        """주입된 오류는 재시도되고, 모두 실패하면 예외가 발생하는지 테스트"""
+        flaky = self._client(error_rate=0.3, seed=1)
+        responses = [flaky.generate(f"프롬프트 {i}", retry_delay=0, max_retries=10) for i in range(20)]
+        assert all(responses)
+        assert flaky.stats()["injected_errors"] > 0
+
+        limited = self._client(rate_limit_rate=1.0)
+        with pytest.raises(Exception, match="429"):
+            limited.generate("프롬프트", retry_delay=0)
+        assert limited.stats()["injected_rate_limits"] == 3
+        # 재시도가 아닌 소진된 호출 단위로 집계
+        assert limited.consecutive_failures == 1
+        with pytest.raises(Exception, match="429"):
+            limited.generate("프롬프트 2", retry_delay=0)
+        assert limited.consecutive_failures == 2
+
+    def test_same_seed_is_deterministic(self):
+        """같은 seed면 지연 시간과 오류 주입 순서가 같은지 테스트"""
+        first = self._client(latency_ms=100, latency_distribution="lognormal", error_rate=0.3)
+        second = self._client(latency_ms=100, latency_distribution="lognormal", error_rate=0.3)
+        assert [first._draw_attempt()[0] for _ in range(5)] == [second._draw_attempt()[0] for _ in range(5)]
+
+    def test_factory_selects_backend(self):
+        """llm_backend 설정에 따라 클라이언트가 선택되는지 테스트"""
+        assert isinstance(create_llm_client(backend="simulator"), SimulatedLLMClient)
+        assert not isinstance(create_llm_client(backend="gemini"), SimulatedLLMClient)
+        with pytest.raises(ValueError):
+            create_llm_client(backend="unknown")
+
+
+class TestHintIndex:
+    """예시 힌트 색인 테스트"""
+
+    def test_lookup_rules_scenarios_and_similar_questions(self):
+        """규칙, 시나리오 완전 일치, 유사 질문 순으로 힌트를 찾는지 테스트"""
+        index = build_hint_index(path="")
+
+        assert index.lookup("결제 수단은?") == "💡 예: 토스페이먼츠, KG이니시스, 카카오페이, 네이버페이 등"
+        assert index.lookup("예약 취소는 몇 시간 전까지 가능한가요?").startswith("💡 예:")
+        assert index.lookup("예약 취소는 몇 시간 전까지 가능할까요") == \
+            index.lookup("예약 취소는 몇 시간 전까지 가능한가요?")
+        assert index.lookup("어떤 색상 테마를 원하시나요?") is None
+        assert index.stats()["misses"] == 1
+
+    def test_scenario_hints_use_example_phrase(self, tmp_path):
+        """시나리오 답변에서 서술어를 뺀 예시 구절만 힌트로 쓰는지 테스트 (소수점은 자르지 않음)"""
+        scenario = {"expected_questions": [
+            {"question": "배포 환경은?", "answer": "AWS 클라우드에 배포하고, Docker로 패키징할 예정입니다."},
+            {"question": "응답 시간 목표는?", "answer": "평균 0.5초 이내여야 합니다. 피크 시간도 포함합니다."},
+        ]}
+        (tmp_path / "scenario_1_test.json").write_text(json.dumps(scenario, ensure_ascii=False), encoding="utf-8")
+        index = HintIndex()
+
+        assert index.load_scenarios(str(tmp_path)) == 2
+        assert index.lookup("응답 시간 목표는?") == "💡 예: 평균 0.5초 등"
+        assert index._match(normalize_question("배포 환경은?")) == "💡 예: AWS 클라우드 등"
+
+    def test_similarity_candidates_are_capped(self):
+        """공통 bigram이 많은 큰 색인에서도 드문 bigram으로 후보를 좁혀 상한 안에서 찾는지 테스트"""
+        index = HintIndex(max_candidates=4)
+        for i in range(200):
+            index.add(f"프로젝트 관련 {i}번 항목을 알려주시겠어요?", f"💡 예: 항목 {i} 등")
+        index.add("선호하는 색상 테마를 알려주시겠어요?", "💡 예: 파란색, 다크 모드 등")
+
+        assert index._match(normalize_question("선호하는 색상 테마를 알려주시겠습니까?")) == "💡 예: 파란색, 다크 모드 등"
+
+    def test_background_fill_learns_and_persists(self, tmp_path):
+        """색인에 없는 질문은 백그라운드에서 한 번만 생성되고 저장되는지 테스트"""
+        path = tmp_path / "hints.json"
+        index = HintIndex(path=str(path))
+        release = threading.Event()
+        calls = []
+
+        def generate(question):
+            calls.append(question)
+            release.wait(timeout=5)
+            return "💡 예: 파란색, 다크 모드 등"
+
+        question = "어떤 색상 테마를 원하시나요?"
+        assert index.schedule_fill(question, generate) is True
+        # 생성 중인 질문은 다시 예약하지 않음
+        assert index.schedule_fill(question + " ", generate) is False
+        release.set()
+        index.wait_for_fills()
+
+        assert index.lookup(question) == "💡 예: 파란색, 다크 모드 등"
+        assert len(calls) == 1
+        # 저장된 힌트는 새 색인에서 다시 사용됨
+        assert HintIndex(path=str(path)).lookup(question) == "💡 예: 파란색, 다크 모드 등"
+
+
+class TestIncrementalPromptBuilder:
+    """증분 프롬프트 빌더 테스트"""
+
+    def test_renders_only_new_messages(self):
+        """이미 렌더링한 메시지는 다시 렌더링하지 않는지 테스트"""
+        builder = IncrementalPromptBuilder(token_budget=10_000)
+        state = RequirementState(user_input="a", messages=[Message(role="user", content="쇼핑몰")])
+        assert builder.judge_history(state) == "user: 쇼핑몰"
+
+        state.messages.append(Message(role="assistant", content="추가 정보가 필요합니다:\n\n결제 수단은?\n\n💡 예: 토스 등"))
+        builder.update(state)
+        builder.update(state)
+
+        assert state.prompt_context.rendered_count == 2
+        assert len(state.prompt_context.recent_turns) == 2
+        assert builder.consultant_history(state) == "Already asked: 결제 수단은?"
+
+    def test_matches_full_join_within_budget(self):
+        """예산 이내에서는 전체 join과 같은 결과인지 테스트"""
+        builder = IncrementalPromptBuilder(token_budget=10_000)
+        messages = [Message(role="user" if i % 2 else "assistant", content=f"메시지 {i}") for i in range(6)]
+        state = RequirementState(user_input="a", messages=messages)
+
+        expected = "\n".join(f"{m.role}: {m.content}" for m in messages)
+        assert builder.judge_history(state) == expected
+
+    def test_budget_moves_old_turns_to_summary(self):
+        """토큰 예산 초과 시 오래된 턴이 요약으로 이동하는지 테스트"""
+        builder = IncrementalPromptBuilder(token_budget=50, summary_chars=10)
+        state = RequirementState(user_input="a")
+        for i in range(10):
+            state.messages.append(Message(role="user", content=f"{i}번째 긴 답변입니다 " * 3))
+            builder.update(state)
+
+        context = state.prompt_context
+        assert context.recent_tokens <= 50
+        assert len(context.summary_items) > 0
+        assert builder.judge_history(state).startswith("[이전 대화 요약]")
+
+    def test_extract_question_skips_header_and_hint(self):
+        """질문 추출 시 머리말과 예시 힌트가 제외되는지 테스트"""
+        content = "추가 정보가 필요합니다:\n\n배포 환경은?\n\n💡 예: AWS 등"
+        assert extract_question(content) == "배포 환경은?"
+
+
+class TestJudgeContextCompactor:
+    """Judge 컨텍스트 압축기 테스트"""
+
+    def test_dedupes_responses_and_strips_hints(self):
+        """추출 항목/히스토리와 중복된 답변 백업과 예시 힌트가 프롬프트에서 빠지는지 테스트"""
+        state = RequirementState(
+            user_input="AWS",
+            collected_info={
+                "initial_request": "쇼핑몰",
+                "deployment": "AWS",
+                "response_0": "AWS",
+                "response_1": "카카오 로그인을 사용합니다",
+                "response_2": "월 1만명 정도 예상합니다",
+            },
+            messages=[
+                Message(role="user", content="쇼핑몰"),
+                Message(role="assistant", content="추가 정보가 필요합니다:\n\n인증 방식은?\n\n💡 예: 이메일, 카카오 등"),
+                Message(role="user", content="카카오 로그인을 사용합니다"),
+            ]
+        )
+        compactor = JudgeContextCompactor(token_budget=10_000, prompt_builder=IncrementalPromptBuilder(token_budget=10_000))
+
+        prompt = compactor.build_prompt(state)
+
+        assert "💡" not in prompt
+        assert "assistant: 인증 방식은?" in prompt
+        assert "response_0" not in prompt and "response_1" not in prompt
+        assert "월 1만명 정도 예상합니다" in prompt
+        assert compactor.stats()["tokens_saved"] > 0
+        # 원본 collected_info는 그대로
+        assert "response_0" in state.collected_info
+        assert compact_collected_info({"response_0": "A", "response_1": " A "}) == {"response_0": "A"}
+
+    def test_budget_keeps_recent_turns(self):
+        """예산을 넘으면 오래된 대화부터 빠지고 마지막 턴은 유지되는지 테스트"""
+        state = RequirementState(user_input="a", collected_info={"project_type": "쇼핑몰"})
+        for i in range(20):
+            state.messages.append(Message(role="user", content=f"{i}번째 답변은 조금 긴 문장입니다 " * 4))
+        compactor = JudgeContextCompactor(token_budget=300, prompt_builder=IncrementalPromptBuilder(token_budget=10_000))
+
+        prompt = compactor.build_prompt(state)
+
+        assert estimate_tokens(prompt) <= 300
+        assert "user: 0번째" not in prompt
+        assert state.messages[-1].content.strip() in prompt
+        # 세션의 프롬프트 컨텍스트는 줄이지 않음
+        assert len(state.prompt_context.recent_turns) == 20
+
+
 class TestDummyCheckpointer:
     """더미 Checkpointer 테스트"""
 
@@ -45,6 +411,17 @@ class TestDummyCheckpointer:
         assert loaded is not None
         assert loaded["iteration"] == 1
 
+    def test_sqlite_checkpointer_persists_across_instances(self, tmp_path):
+        """SQLite 체크포인트가 다른 인스턴스(재시작한 프로세스)에서도 로드되는지 테스트"""
+        db_path = str(tmp_path / "checkpoints.db")
+        SQLiteCheckpointer(db_path=db_path).save("session_1", {"node": "judge", "iteration": 1})
+
+        checkpointer = SQLiteCheckpointer(db_path=db_path)
+        assert checkpointer.load("session_1") == {"node": "judge", "iteration": 1}
+        assert checkpointer.delete("session_1") is True
+        assert checkpointer.load("session_1") is None
+        assert checkpointer.save("session_2", {"state": object()}) is False
+
 
 class TestDummyStateStore:
     """더미 State Store 테스트"""
@@ -1,9 +1,21 @@
 """Infrastructure Graph Test Suite"""
+import asyncio
+import json
+import threading
 import pytest
+from backend.domain.models.compact_state import CompactSession
 from backend.domain.models.state import RequirementState, Message
 from backend.infrastructure.graph.workflow import DummyWorkflow
+from backend.infrastructure.graph.graph_workflow import GraphWorkflow, _turn_fingerprint, create_workflow
+from backend.infrastructure.persistence.checkpointer import DummyCheckpointer, SQLiteCheckpointer
 from backend.infrastructure.graph.executor import DummyExecutor
 from backend.infrastructure.graph.session_repository import DummySessionRepository
+from backend.infrastructure.graph.sqlite_session_repository import SQLiteSessionRepository
+from backend.infrastructure.graph.repository_factory import create_session_repository
+from backend.infrastructure.graph.session_sweeper import SessionSweeper
+from backend.infrastructure.graph.session_lock import SessionLockTimeout, SessionSaveFailed, SessionVersionConflict
+from backend.infrastructure.graph.idempotency_store import IdempotencyStore, SQLiteIdempotencyStore
+from backend.utils.tracing import TurnTrace
 
 
 class TestDummyWorkflow:
@@ -62,6 +74,318 @@ class TestDummyWorkflow:
 
         assert result.iteration_count >= state.iteration_count
 
+    def test_workflow_run_async(self):
+        """비동기 Workflow 실행 테스트"""
+        workflow = DummyWorkflow()
+        state = RequirementState(user_input="쇼핑몰을 만들고 싶습니다")
+        result = asyncio.run(workflow.run_async(state))
+
+        assert isinstance(result, RequirementState)
+        assert len(result.questions) > 0
+        assert result.iteration_count == 1
+
+
+class TestParallelWorkflow:
+    """병렬 모드 DummyWorkflow 테스트"""
+
+    @staticmethod
+    def _approving_judge(state):
+        state.is_complete = True
+        state.judge_feedback = "충분"
+        return state
+
+    def test_parallel_run_incomplete_path(self):
+        """병렬 모드에서도 질문과 메시지가 반영되는지 테스트"""
+        workflow = DummyWorkflow(parallel=True)
+        state = RequirementState(user_input="쇼핑몰을 만들고 싶습니다")
+        result = workflow.run(state)
+
+        assert result.is_complete is False
+        assert len(result.questions) > 0
+        assert result.messages[-1].role == "assistant"
+        assert result.iteration_count == 1
+
+    def test_parallel_run_skips_consultant_on_approve(self):
+        """Judge가 승인하면 Consultant 출력을 버리는지 테스트"""
+        workflow = DummyWorkflow(parallel=True)
+        workflow.judge_agent = self._approving_judge
+        state = RequirementState(user_input="쇼핑몰 프로젝트")
+        result = workflow.run(state)
+
+        assert result.is_complete is True
+        assert result.questions == []
+        assert result.messages == []
+        assert result.final_srs is not None
+
+    def test_parallel_run_async_matches_sync(self):
+        """비동기 병렬 실행이 동기 병렬 실행과 같은 결과를 내는지 테스트"""
+        sync_result = DummyWorkflow(parallel=True).run(RequirementState(user_input="쇼핑몰"))
+        async_result = asyncio.run(
+            DummyWorkflow(parallel=True).run_async(RequirementState(user_input="쇼핑몰"))
+        )
+
+        assert async_result.questions == sync_result.questions
+        assert async_result.judge_feedback == sync_result.judge_feedback
+        assert len(async_result.messages) == len(sync_result.messages)
+
+
+class _FakeRunnable:
+    """RunnableLambda 대역 (동기/비동기 함수 보관)"""
+
+    def __init__(self, func, afunc=None, name=None):
+        self.func = func
+        self.afunc = afunc
+        self.name = name
+
+
+class _FakeStateGraph:
+    """
+    LangGraph StateGraph 대역
+
+    등록된 노드와 엣지를 기록하고, 같은 단계의 노드를 모두 실행한 뒤 다음 단계로 넘어가는
+    방식(조인 엣지는 모든 선행 노드가 끝난 단계에서 실행)으로 invoke/ainvoke를 흉내냅니다.
+    """
+
+    START, END = "__start__", "__end__"
+
+    def __init__(self, schema):
+        self.nodes = {}
+        self.edges = {}
+        self.joins = []
+        self.conditional = {}
+
+    def add_node(self, name, runnable):
+        self.nodes[name] = runnable
+
+    def add_edge(self, source, target):
+        if isinstance(source, list):
+            self.joins.append((set(source), target))
+        else:
+            self.edges[source] = target
+
+    def add_conditional_edges(self, source, path, targets):
+        self.conditional[source] = (path, targets)
+
+    def compile(self):
+        return self
+
+    def _successors(self, step, values):
+        following = set()
+        for name in step:
+            if name in self.edges:
+                following.add(self.edges[name])
+            if name in self.conditional:
+                path, targets = self.conditional[name]
+                routed = path(values)
+                routed = routed if isinstance(routed, list) else [routed]
+                assert set(routed) <= set(targets), f"unregistered route from {name}: {routed}"
+                following.update(routed)
+        following.update(target for sources, target in self.joins if sources <= set(step))
+        following.discard(self.END)
+        assert following <= set(self.nodes), f"unknown nodes: {following - set(self.nodes)}"
+        return sorted(following)
+
+    def invoke(self, values):
+        values = dict(values)
+        step = self._successors([self.START], values)
+        while step:
+            for update in [self.nodes[name].func(values) for name in step]:
+                values.update(update)
+            step = self._successors(step, values)
+        return values
+
+    async def ainvoke(self, values):
+        values = dict(values)
+        step = self._successors([self.START], values)
+        while step:
+            for update in await asyncio.gather(*(self.nodes[name].afunc(values) for name in step)):
+                values.update(update)
+            step = self._successors(step, values)
+        return values
+
+
+class TestGraphWorkflow:
+    """노드 그래프 GraphWorkflow 테스트"""
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_compiled_graph_wiring(self, monkeypatch, parallel):
+        """StateGraph로 컴파일한 노드/엣지가 노드 순차 실행과 같은 결과를 내는지 테스트 (StateGraph 대역)"""
+        module = "backend.infrastructure.graph.graph_workflow"
+        monkeypatch.setattr(f"{module}.LANGGRAPH_AVAILABLE", True)
+        monkeypatch.setattr(f"{module}.StateGraph", _FakeStateGraph, raising=False)
+        monkeypatch.setattr(f"{module}.RunnableLambda", _FakeRunnable, raising=False)
+        monkeypatch.setattr(f"{module}.START", _FakeStateGraph.START, raising=False)
+        monkeypatch.setattr(f"{module}.END", _FakeStateGraph.END, raising=False)
+
+        checkpointer = DummyCheckpointer()
+        workflow = GraphWorkflow(parallel=parallel, checkpointer=checkpointer)
+        assert isinstance(workflow._graph, _FakeStateGraph)
+        assert ("merge" in workflow._graph.nodes) is parallel
+
+        expected = DummyWorkflow(parallel=parallel).run(RequirementState(user_input="쇼핑몰"))
+        result = workflow.run(RequirementState(user_input="쇼핑몰"), thread_id="s1")
+        async_result = asyncio.run(workflow.run_async(RequirementState(user_input="쇼핑몰"), thread_id="s2"))
+
+        for actual in (result, async_result):
+            assert actual.questions == expected.questions
+            assert actual.judge_feedback == expected.judge_feedback
+            assert actual.iteration_count == 1
+        assert checkpointer._storage == {}
+
+        # 체크포인트에서 재개하면 START 조건부 엣지가 다음 노드로 보냄
+        resumed = RequirementState(user_input="쇼핑몰")
+        checkpointer.save("s3", {
+            "base": _turn_fingerprint(resumed),
+            "node": "merge" if parallel else "judge",
+            "state": CompactSession.from_state(result).to_dict(),
+        })
+        assert workflow.run(resumed, thread_id="s3").iteration_count == result.iteration_count + 1
+
+    def test_langgraph_matches_dummy_workflow(self):
+        """langgraph가 설치된 환경에서 실제 StateGraph 실행이 DummyWorkflow와 같은지 테스트"""
+        pytest.importorskip("langgraph")
+        workflow = GraphWorkflow(checkpointer=DummyCheckpointer())
+        assert workflow._graph is not None
+
+        expected = DummyWorkflow().run(RequirementState(user_input="쇼핑몰"))
+        result = workflow.run(RequirementState(user_input="쇼핑몰"), thread_id="s1")
+        async_result = asyncio.run(workflow.run_async(RequirementState(user_input="쇼핑몰"), thread_id="s2"))
+
+        for actual in (result, async_result):
+            assert actual.questions == expected.questions
+            assert actual.judge_feedback == expected.judge_feedback
+            assert actual.iteration_count == 1
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_graph_matches_dummy_workflow(self, parallel):
+        """그래프 실행이 DummyWorkflow와 같은 결과를 내고 턴을 마치면 체크포인트를 지우는지 테스트"""
+        checkpointer = DummyCheckpointer()
+        workflow = GraphWorkflow(parallel=parallel, checkpointer=checkpointer)
+        expected = DummyWorkflow(parallel=parallel).run(RequirementState(user_input="쇼핑몰"))
+
+        result = workflow.run(RequirementState(user_input="쇼핑몰"), thread_id="s1")
+        async_result = asyncio.run(workflow.run_async(RequirementState(user_input="쇼핑몰"), thread_id="s2"))
+
+        for actual in (result, async_result):
+            assert actual.questions == expected.questions
+            assert actual.judge_feedback == expected.judge_feedback
+            assert len(actual.messages) == len(expected.messages)
+            assert actual.iteration_count == 1
+        assert checkpointer._storage == {}
+
+    def test_graph_resumes_after_crash(self):
+        """노드 도중 중단된 턴을 다시 실행하면 끝난 노드를 건너뛰고 이어서 실행하는지 테스트"""
+        checkpointer = DummyCheckpointer()
+        workflow = GraphWorkflow(checkpointer=checkpointer)
+        consultant = workflow.consultant_agent
+        judge = workflow.judge_agent
+        calls = []
+
+        def counting_consultant(state):
+            calls.append("consultant")
+            return consultant(state)
+
+        def crashing_judge(state):
+            if "judge" not in calls:
+                calls.append("judge")
+                raise RuntimeError("worker crashed")
+            return judge(state)
+
+        workflow.consultant_agent = counting_consultant
+        workflow.judge_agent = crashing_judge
+
+        with pytest.raises(RuntimeError):
+            workflow.run(RequirementState(user_input="쇼핑몰"), thread_id="s1")
+        assert checkpointer.load("s1")["node"] == "consultant"
+
+        result = workflow.run(RequirementState(user_input="쇼핑몰"), thread_id="s1")
+
+        assert calls == ["consultant", "judge"]
+        assert workflow.resumed_turns == 1
+        assert len(result.questions) > 0
+        assert result.iteration_count == 1
+        assert checkpointer.load("s1") is None
+
+        # 다른 입력이면 이전 체크포인트를 쓰지 않음
+        checkpointer.save("s1", {"base": "stale", "node": "consultant", "state": {}})
+        workflow.run(RequirementState(user_input="다른 프로젝트"), thread_id="s1")
+        assert calls.count("consultant") == 2
+
+    def test_async_checkpoints_written_off_event_loop(self):
+        """비동기 실행의 체크포인트 읽기/쓰기/삭제가 이벤트 루프 스레드 밖에서 실행되는지 테스트"""
+        checkpointer = DummyCheckpointer()
+        threads = []
+        for name in ("load", "save", "delete"):
+            method = getattr(checkpointer, name)
+
+            def recorded(*args, _method=method):
+                threads.append(threading.get_ident())
+                return _method(*args)
+            setattr(checkpointer, name, recorded)
+        workflow = GraphWorkflow(checkpointer=checkpointer)
+
+        async def turn():
+            await workflow.run_async(RequirementState(user_input="쇼핑몰"), thread_id="s1")
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(turn())
+        assert len(threads) >= 4
+        assert loop_thread not in threads
+
+    def test_create_workflow_reuses_compiled_graph(self, monkeypatch, tmp_path):
+        """요청마다 executor를 만들어도 GraphWorkflow(컴파일된 그래프)는 한 번만 만드는지 테스트"""
+        monkeypatch.setattr("backend.infrastructure.graph.graph_workflow._graph_workflows", {})
+        monkeypatch.setattr(
+            "backend.infrastructure.graph.graph_workflow._checkpointer",
+            SQLiteCheckpointer(db_path=str(tmp_path / "checkpoints.db"))
+        )
+
+        first = create_workflow("graph")
+        assert isinstance(first, GraphWorkflow)
+        assert create_workflow("graph") is first
+        assert create_workflow("dummy") is not create_workflow("dummy")
+
+
+class TestStreamingWorkflow:
+    """DummyWorkflow 스트리밍 실행 테스트"""
+
+    @staticmethod
+    async def _approving_judge_async(state):
+        state.is_complete = True
+        state.judge_feedback = "충분"
+        return state
+
+    @staticmethod
+    def _collect(workflow, state):
+        async def run():
+            return [event async for event in workflow.run_stream(state)]
+        return asyncio.run(run())
+
+    def test_run_stream_emits_tokens_then_verdict(self):
+        """토큰 → 질문 → Judge 판정 순으로 이벤트를 내보내는지 테스트"""
+        state = RequirementState(user_input="쇼핑몰을 만들고 싶습니다")
+        events = self._collect(DummyWorkflow(), state)
+        names = [name for name, _ in events]
+
+        assert names[0] == "consultant_token"
+        assert names[-2:] == ["question", "judge"]
+        assert events[-2][1]["questions"] == state.questions
+        assert state.messages[-1].role == "assistant"
+        assert state.iteration_count == 1
+
+    def test_run_stream_streams_srs_sections(self):
+        """Judge 승인 시 SRS 섹션을 하나씩 내보내고 final_srs를 저장하는지 테스트"""
+        workflow = DummyWorkflow()
+        workflow.judge_agent_async = self._approving_judge_async
+        state = RequirementState(user_input="쇼핑몰 프로젝트")
+        events = self._collect(workflow, state)
+        sections = [data["section"] for name, data in events if name == "srs_section"]
+
+        assert sections[:2] == ["project_name", "overview"]
+        assert "tech_stack" in sections
+        assert state.final_srs is not None
+        assert set(sections) == set(json.loads(state.final_srs))
+
 
 class TestDummyExecutor:
     """DummyExecutor 테스트"""
@@ -125,6 +449,84 @@ class TestDummyExecutor:
         assert isinstance(result, RequirementState)
         assert len(result.messages) > 0
 
+    def test_executor_execute_async_persists_state(self):
+        """비동기 실행 결과가 저장되는지 테스트"""
+        executor = DummyExecutor()
+        session_id = executor.create_session()
+
+        result = asyncio.run(executor.execute_async(session_id, "쇼핑몰을 만들고 싶습니다"))
+
+        assert result.user_input == "쇼핑몰을 만들고 싶습니다"
+        assert executor.get_state(session_id) is not None
+
+    def test_executor_serializes_concurrent_turns(self, monkeypatch):
+        """같은 세션의 동시 요청이 서로의 답변을 덮어쓰지 않는지 테스트"""
+        executor = DummyExecutor()
+        session_id = executor.create_session()
+        executor.execute(session_id, "쇼핑몰을 만들고 싶습니다")
+
+        # 실제 LLM 호출처럼 워크플로우 도중 다른 요청으로 전환되도록 함
+        run_async = executor.workflow.run_async
+
+        async def slow_run_async(state, speculation=None, thread_id=None):
+            await asyncio.sleep(0.01)
+            return await run_async(state, speculation, thread_id)
+
+        monkeypatch.setattr(executor.workflow, "run_async", slow_run_async)
+
+        async def run_both():
+            await asyncio.gather(
+                executor.execute_async(session_id, "카카오 로그인"),
+                executor.execute_async(session_id, "AWS에 배포합니다")
+            )
+
+        asyncio.run(run_both())
+
+        user_messages = [m.content for m in executor.get_state(session_id).messages if m.role == "user"]
+        assert "카카오 로그인" in user_messages
+        assert "AWS에 배포합니다" in user_messages
+
+    def test_executor_retries_turn_on_version_conflict(self, monkeypatch):
+        """턴 도중 다른 요청이 저장하면 최신 상태로 턴을 다시 실행하는지 테스트"""
+        executor = DummyExecutor()
+        session_id = executor.create_session()
+        executor.execute(session_id, "쇼핑몰을 만들고 싶습니다")
+
+        # 락 lease가 만료되어 다른 워커가 그 사이 저장한 상황
+        run = executor.workflow.run
+        calls = []
+
+        def interleaved_run(state, speculation=None, thread_id=None):
+            if not calls:
+                other = executor.repository.load(session_id)
+                other.messages.append(Message(role="user", content="다른 요청"))
+                executor.repository.save(session_id, other)
+            calls.append(state.version)
+            return run(state, speculation, thread_id)
+
+        monkeypatch.setattr(executor.workflow, "run", interleaved_run)
+        result = executor.execute(session_id, "카카오 로그인")
+
+        assert calls == [1, 2]
+        user_messages = [m.content for m in result.messages if m.role == "user"]
+        assert user_messages.count("카카오 로그인") == 1
+        assert "다른 요청" in user_messages
+        assert executor.get_state(session_id).version == 3
+
+    def test_executor_does_not_remember_unsaved_turn(self, monkeypatch):
+        """저장소가 저장에 실패하면 예외를 발생시키고 Idempotency-Key 결과를 기록하지 않는지 테스트"""
+        executor = DummyExecutor()
+        session_id = executor.create_session()
+        executor.execute(session_id, "쇼핑몰을 만들고 싶습니다")
+
+        monkeypatch.setattr(executor.repository, "save", lambda *args, **kwargs: False)
+        with pytest.raises(SessionSaveFailed):
+            executor.execute(session_id, "카카오 로그인", idempotency_key="key-1")
+        monkeypatch.undo()
+
+        result = executor.execute(session_id, "카카오 로그인", idempotency_key="key-1")
+        assert executor.get_state(session_id).version == result.version == 2
+
 
 class TestDummySessionRepository:
     """DummySessionRepository 테스트"""
@@ -150,6 +552,18 @@ class TestDummySessionRepository:
         assert isinstance(loaded_state, RequirementState)
         assert loaded_state.user_input == "test"
 
+    def test_repository_keeps_recent_traces(self):
+        """세션당 최근 max_traces개 턴 트레이스만 보관하고 삭제 시 함께 지우는지 테스트"""
+        repo = DummySessionRepository(max_traces=2)
+        repo.append_trace("s1", TurnTrace(session_id="s1", started_at=0.0))  # 없는 세션은 무시
+        repo.save("s1", RequirementState(user_input="test"))
+        for iteration in range(3):
+            repo.append_trace("s1", TurnTrace(session_id="s1", iteration=iteration, started_at=0.0))
+
+        assert [t.iteration for t in repo.load_traces("s1")] == [1, 2]
+        repo.delete("s1")
+        assert repo.load_traces("s1") == []
+
     def test_repository_load_nonexistent_session(self):
         """존재하지 않는 세션 로드 시 None 반환 테스트"""
         repo = DummySessionRepository()
@@ -179,6 +593,22 @@ class TestDummySessionRepository:
         deleted = repo.delete("nonexistent-session")
         assert deleted is False
 
+    def test_repository_compare_and_swap(self):
+        """읽은 뒤 다른 저장이 있으면 expected_version 저장이 거부되는지 테스트"""
+        repo = DummySessionRepository()
+        state = RequirementState(user_input="a")
+        assert repo.save("s1", state, expected_version=0) is True
+        assert state.version == 1
+
+        first = repo.load("s1")
+        second = repo.load("s1")
+        repo.save("s1", first, expected_version=1)
+
+        with pytest.raises(SessionVersionConflict):
+            repo.save("s1", second, expected_version=1)
+        assert repo.load("s1").version == 2
+        assert repo.eviction_stats()["version_conflicts"] == 1
+
     def test_repository_list_sessions(self):
         """Repository가 모든 세션을 나열하는지 테스트"""
         repo = DummySessionRepository()
@@ -195,3 +625,310 @@ class TestDummySessionRepository:
         assert "session-1" in session_ids
         assert "session-2" in session_ids
         assert "session-3" in session_ids
+
+
+class TestSessionEviction:
+    """세션 만료 및 LRU 제거 테스트"""
+
+    class FakeClock:
+        """수동으로 진행하는 시계"""
+
+        def __init__(self):
+            self.now = 0.0
+
+        def __call__(self):
+            return self.now
+
+    def test_expired_session_not_loaded(self):
+        """TTL이 지난 세션은 로드되지 않는지 테스트"""
+        clock = self.FakeClock()
+        repo = DummySessionRepository(ttl_seconds=10, clock=clock)
+        repo.save("s1", RequirementState(user_input="a"))
+
+        clock.now = 5
+        assert repo.load("s1") is not None  # 접근 시간 갱신
+
+        clock.now = 14
+        assert repo.load("s1") is not None
+
+        clock.now = 30
+        assert repo.load("s1") is None
+        assert repo.eviction_stats()["evicted_expired"] == 1
+
+    def test_sweeper_evicts_only_expired(self):
+        """sweeper가 만료된 세션만 제거하는지 테스트"""
+        clock = self.FakeClock()
+        repo = DummySessionRepository(ttl_seconds=10, clock=clock)
+        repo.save("old", RequirementState(user_input="a"))
+        clock.now = 8
+        repo.save("new", RequirementState(user_input="b"))
+
+        clock.now = 15
+        assert SessionSweeper(repo).sweep() == 1
+        assert repo.list_sessions() == ["new"]
+
+    def test_max_sessions_evicts_least_recently_used(self):
+        """최대 세션 수 초과 시 LRU 세션이 제거되는지 테스트"""
+        repo = DummySessionRepository(max_sessions=2)
+        repo.save("a", RequirementState(user_input="a"))
+        repo.save("b", RequirementState(user_input="b"))
+        repo.load("a")  # a를 최근 사용으로
+        repo.save("c", RequirementState(user_input="c"))
+
+        assert sorted(repo.list_sessions()) == ["a", "c"]
+        assert repo.eviction_stats()["evicted_lru"] == 1
+
+    def test_max_bytes_evicts_until_under_limit(self):
+        """총 크기 제한 초과 시 LRU 세션이 제거되는지 테스트"""
+        size = len(RequirementState(user_input="x" * 100).model_dump_json())
+        repo = DummySessionRepository(max_bytes=size * 2)
+        for sid in ["a", "b", "c"]:
+            repo.save(sid, RequirementState(user_input="x" * 100))
+
+        stats = repo.eviction_stats()
+        assert stats["sessions"] == 2
+        assert stats["bytes"] <= size * 2
+        assert repo.load("a") is None
+
+    def test_sqlite_evicts_expired(self, tmp_path):
+        """SQLite 저장소의 만료 세션 정리 테스트"""
+        repo = SQLiteSessionRepository(
+            db_path=str(tmp_path / "s.db"), flush_interval=0, ttl_seconds=60
+        )
+        repo.save("s1", RequirementState(user_input="a"))
+        repo._conn.execute("UPDATE sessions SET updated_at = updated_at - 120")
+
+        assert repo.evict_expired() == 1
+        assert repo.load("s1") is None
+        assert repo.eviction_stats()["evicted_expired"] == 1
+        repo.close()
+
+
+class TestSQLiteSessionRepository:
+    """SQLiteSessionRepository 테스트"""
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """저장한 상태가 그대로 복원되는지 테스트"""
+        repo = SQLiteSessionRepository(db_path=str(tmp_path / "s.db"), flush_interval=0)
+        state = RequirementState(
+            user_input="test",
+            messages=[Message(role="user", content="쇼핑몰")],
+            collected_info={"payment": "토스페이먼츠"},
+            iteration_count=2
+        )
+        assert repo.save("s1", state) is True
+
+        loaded = repo.load("s1")
+        assert loaded == state
+        repo.close()
+
+    def test_loads_legacy_state_rows(self, tmp_path):
+        """이전 형식(RequirementState JSON)으로 저장된 행도 읽는지 테스트"""
+        repo = SQLiteSessionRepository(db_path=str(tmp_path / "s.db"), flush_interval=0)
+        state = RequirementState(user_input="legacy", collected_info={"response_1": "legacy"})
+        repo._conn.execute(
+            "INSERT INTO sessions (session_id, state, updated_at) VALUES (?, ?, ?)",
+            ("old", state.model_dump_json(), 0)
+        )
+
+        assert repo.load("old") == state
+        repo.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        """재시작 후에도 세션이 유지되는지 테스트"""
+        db_path = str(tmp_path / "s.db")
+        repo = SQLiteSessionRepository(db_path=db_path, flush_interval=10)
+        repo.save("s1", RequirementState(user_input="first"))
+        repo.close()
+
+        reopened = SQLiteSessionRepository(db_path=db_path, flush_interval=0)
+        assert reopened.load("s1").user_input == "first"
+        assert reopened.list_sessions() == ["s1"]
+        reopened.close()
+
+    def test_write_behind_coalesces_saves(self, tmp_path):
+        """같은 세션의 여러 저장이 한 번의 기록으로 병합되는지 테스트"""
+        repo = SQLiteSessionRepository(db_path=str(tmp_path / "s.db"), flush_interval=10)
+        for i in range(5):
+            repo.save("s1", RequirementState(user_input=f"v{i}"))
+
+        # 플러시 전에도 최신 상태를 읽을 수 있어야 함
+        assert repo.load("s1").user_input == "v4"
+
+        repo.flush()
+        assert repo.saves_requested == 5
+        assert repo.rows_written == 1
+        repo.close()
+
+    def test_delete_pending_and_stored(self, tmp_path):
+        """기록 전/후 세션 모두 삭제되는지 테스트"""
+        repo = SQLiteSessionRepository(db_path=str(tmp_path / "s.db"), flush_interval=10)
+        repo.save("pending", RequirementState(user_input="a"))
+        repo.save("stored", RequirementState(user_input="b"))
+        repo.flush()
+        repo.save("pending2", RequirementState(user_input="c"))
+
+        assert repo.delete("stored") is True
+        assert repo.delete("pending2") is True
+        assert repo.delete("missing") is False
+        assert repo.list_sessions() == ["pending"]
+        repo.close()
+
+    def test_compare_and_swap_across_instances(self, tmp_path):
+        """다른 인스턴스가 먼저 저장한 버전과 충돌하고, 오래된 기록이 최신 행을 덮어쓰지 않는지 테스트"""
+        db_path = str(tmp_path / "s.db")
+        worker_a = SQLiteSessionRepository(db_path=db_path, flush_interval=0)
+        worker_b = SQLiteSessionRepository(db_path=db_path, flush_interval=10)
+        worker_a.save("s1", RequirementState(user_input="v1"), expected_version=0)
+
+        stale = worker_b.load("s1")
+        worker_a.save("s1", worker_a.load("s1"), expected_version=1)
+        with pytest.raises(SessionVersionConflict):
+            worker_b.save("s1", stale, expected_version=1)
+
+        # 기록 대기 중이던 오래된 버전은 일괄 기록 시 무시됨
+        worker_b._pending["s1"] = ("{}", 1)
+        worker_b.flush()
+        assert worker_a.load("s1").version == 2
+
+        worker_a.close()
+        worker_b.close()
+
+    def test_compare_and_swap_with_write_behind_instances(self, tmp_path):
+        """lease가 만료되어 두 워커가 같은 버전으로 저장해도 한쪽만 기록되고 다른 쪽은 충돌하는지 테스트"""
+        db_path = str(tmp_path / "s.db")
+        worker_a = SQLiteSessionRepository(db_path=db_path, flush_interval=10)
+        worker_b = SQLiteSessionRepository(db_path=db_path, flush_interval=10)
+        initial = RequirementState(user_input="x", messages=[Message(role="user", content="x")])
+        worker_a.save("s1", initial, expected_version=0)
+
+        state_a, state_b = worker_a.load("s1"), worker_b.load("s1")
+        state_a.messages.append(Message(role="user", content="A answer"))
+        state_b.messages.append(Message(role="user", content="B answer"))
+
+        assert worker_a.save("s1", state_a, expected_version=1) is True
+        with pytest.raises(SessionVersionConflict):
+            worker_b.save("s1", state_b, expected_version=1)
+        assert worker_a.flush() and worker_b.flush()
+
+        stored = SQLiteSessionRepository(db_path=db_path, flush_interval=0).load("s1")
+        assert [m.content for m in stored.messages] == ["x", "A answer"]
+        assert stored.version == 2
+        assert worker_b.version_conflicts == 1
+
+        worker_a.close()
+        worker_b.close()
+
+    def test_turn_traces_visible_to_other_instances(self, tmp_path):
+        """한 워커가 기록한 턴 트레이스를 다른 워커가 조회하고, 세션당 최근 N개만 남는지 테스트"""
+        db_path = str(tmp_path / "s.db")
+        worker_a = SQLiteSessionRepository(db_path=db_path, flush_interval=10, max_traces=2)
+        worker_b = SQLiteSessionRepository(db_path=db_path, flush_interval=10, max_traces=2)
+        worker_a.save("s1", RequirementState(user_input="x"))
+        for iteration in range(3):
+            worker_a.append_trace("s1", TurnTrace(session_id="s1", iteration=iteration, started_at=0.0))
+
+        assert [t.iteration for t in worker_a.load_traces("s1")] == [1, 2]
+        assert worker_b.load_traces("s1") == []
+        assert worker_a.flush()
+        assert [t.iteration for t in worker_b.load_traces("s1")] == [1, 2]
+
+        assert worker_b.delete("s1")
+        assert worker_a.load_traces("s1") == []
+
+        worker_a.close()
+        worker_b.close()
+
+    def test_session_lock_excludes_other_instances(self, tmp_path):
+        """다른 인스턴스(워커)는 락이 풀릴 때까지 기다리고, 풀린 뒤에는 최신 저장을 읽는지 테스트"""
+        db_path = str(tmp_path / "s.db")
+        worker_a = SQLiteSessionRepository(db_path=db_path, flush_interval=10)
+        worker_b = SQLiteSessionRepository(db_path=db_path, flush_interval=10, lock_timeout=0.05)
+
+        with worker_a.lock("s1"):
+            worker_a.save("s1", RequirementState(user_input="from a"))
+            with pytest.raises(SessionLockTimeout):
+                with worker_b.lock("s1"):
+                    pass
+            with worker_b.lock("s2"):  # 다른 세션은 영향 없음
+                pass
+
+        with worker_b.lock("s1"):
+            assert worker_b.load("s1").user_input == "from a"
+
+        worker_a.close()
+        worker_b.close()
+
+    def test_session_lock_lease_expires(self, tmp_path):
+        """락을 잡은 워커가 죽어도 lease가 지나면 다른 워커가 가져가는지 테스트"""
+        db_path = str(tmp_path / "s.db")
+        crashed = SQLiteSessionRepository(db_path=db_path, flush_interval=0)
+        worker = SQLiteSessionRepository(db_path=db_path, flush_interval=0, lock_timeout=0.05)
+
+        assert crashed._locks.try_acquire("s1", "crashed-owner") is True
+        with pytest.raises(SessionLockTimeout):
+            with worker.lock("s1"):
+                pass
+
+        crashed._conn.execute("UPDATE session_locks SET expires_at = expires_at - 1000")
+        with worker.lock("s1"):
+            assert crashed._locks.try_acquire("s1", "crashed-owner") is False
+
+        crashed.close()
+        worker.close()
+
+    def test_session_lock_async_runs_off_event_loop(self, tmp_path, monkeypatch):
+        """비동기 락의 lease 획득/해제(DB 쓰기)가 이벤트 루프 스레드 밖에서 실행되는지 테스트"""
+        repo = SQLiteSessionRepository(db_path=str(tmp_path / "s.db"), flush_interval=0)
+        locks = repo._locks
+        threads = []
+
+        def recorded(method):
+            def wrapper(*args):
+                threads.append(threading.get_ident())
+                return method(*args)
+            return wrapper
+
+        monkeypatch.setattr(locks, "try_acquire", recorded(locks.try_acquire))
+        monkeypatch.setattr(locks, "release", recorded(locks.release))
+
+        async def turn():
+            async with repo.lock_async("s1"):
+                return threading.get_ident()
+
+        loop_thread = asyncio.run(turn())
+        assert len(threads) == 2
+        assert loop_thread not in threads
+        assert locks.try_acquire("s1", "other") is True
+        repo.close()
+
+    def test_idempotency_store_shared_and_expiring(self, tmp_path):
+        """Idempotency-Key 기록이 워커 간에 공유되고 TTL 후 사라지는지 테스트"""
+        db_path = str(tmp_path / "s.db")
+        worker_a = SQLiteIdempotencyStore(db_path=db_path, ttl_seconds=60)
+        worker_b = SQLiteIdempotencyStore(db_path=db_path, ttl_seconds=60)
+
+        assert worker_a.setdefault("start", "k1", "session-a") == "session-a"
+        assert worker_b.setdefault("start", "k1", "session-b") == "session-a"
+        worker_a.put("session-a", "k2", "result")
+        assert worker_b.get("session-a", "k2") == "result"
+        assert worker_b.get("session-b", "k2") is None
+
+        worker_a._conn.execute("UPDATE idempotency_keys SET expires_at = expires_at - 120")
+        assert worker_b.get("session-a", "k2") is None
+
+        clock = TestSessionEviction.FakeClock()
+        memory = IdempotencyStore(ttl_seconds=10, clock=clock)
+        memory.put("s1", "k1", "result")
+        clock.now = 11
+        assert memory.get("s1", "k1") is None
+
+        worker_a.close()
+        worker_b.close()
+
+    def test_factory_selects_backend(self, tmp_path):
+        """팩토리가 설정에 맞는 저장소를 생성하는지 테스트"""
+        assert isinstance(create_session_repository("memory"), DummySessionRepository)
+        with pytest.raises(ValueError):
+            create_session_repository("redis")
+
@@ -2,6 +2,8 @@
 import pytest
 from datetime import datetime
 from backend.domain.models.state import Message, RequirementState
+from backend.domain.models.compact_state import CompactSession, Role
+from backend.infrastructure.prompts.prompt_builder import IncrementalPromptBuilder
 from backend.domain.models.agent_response import ConsultantResponse, JudgeResponse
 from backend.domain.models.srs import (
     FunctionalRequirement,
@@ -70,6 +72,65 @@ class TestRequirementState:
         assert state.messages[0].content == "안녕하세요"
 
 
+class TestCompactSession:
+    """저장용 CompactSession 테스트"""
+
+    def _conversation(self, turns: int) -> RequirementState:
+        """executor와 같은 방식으로 답변을 백업한 대화 상태"""
+        state = RequirementState(user_input="온라인 쇼핑몰을 만들고 싶습니다")
+        state.collected_info["initial_request"] = state.user_input
+        state.collected_info["project_type"] = "이커머스"
+        state.messages.append(Message(role="user", content=state.user_input))
+        for i in range(1, turns + 1):
+            state.messages.append(Message(role="assistant", content=f"추가 정보가 필요합니다:\n\n질문 {i}?"))
+            state.user_input = f"답변 {i}"
+            state.collected_info[f"response_{i}"] = state.user_input
+            state.messages.append(Message(role="user", content=state.user_input))
+            state.iteration_count = i
+        return state
+
+    def test_roundtrip_stores_user_text_once(self):
+        """사용자 답변을 메시지에만 보관하고 그대로 복원하는지 테스트"""
+        state = self._conversation(3)
+        IncrementalPromptBuilder().judge_history(state)
+
+        compact = CompactSession.from_state(state)
+
+        assert compact.collected_info == {"project_type": "이커머스"}
+        assert compact.user_input is None
+        assert compact.messages[0].role is Role.USER
+        assert compact.messages[-1].backs_key == "response_3"
+        assert compact.to_state() == state
+        assert CompactSession.from_dict(compact.to_dict()).to_state() == state
+
+    def test_trim_drops_only_summarized_messages(self):
+        """프롬프트 요약에 반영된 오래된 메시지만 버리고 히스토리는 유지하는지 테스트"""
+        state = self._conversation(10)
+        builder = IncrementalPromptBuilder(token_budget=30)
+        history = builder.judge_history(state)
+
+        compact = CompactSession.from_state(state, max_messages=6)
+        restored = compact.to_state()
+
+        assert len(restored.messages) == 6
+        assert compact.dropped_messages == len(state.messages) - 6
+        assert restored.collected_info["initial_request"] == "온라인 쇼핑몰을 만들고 싶습니다"
+        assert restored.collected_info["response_10"] == "답변 10"
+        # 버린 메시지의 답변 백업은 collected_info에 남음
+        assert restored.collected_info["response_1"] == "답변 1"
+        assert restored.collected_info == state.collected_info
+        assert builder.judge_history(restored) == history
+
+        # 다시 저장해도 남은 메시지는 백업 키와 연결됨
+        resaved = CompactSession.from_state(restored, max_messages=6)
+        assert "response_10" not in resaved.collected_info
+        assert resaved.to_state().collected_info == state.collected_info
+
+        # 요약되지 않은 메시지는 한도를 넘어도 유지
+        unsummarized = CompactSession.from_state(self._conversation(10), max_messages=6)
+        assert unsummarized.dropped_messages == 0
+
+
 class TestConsultantResponse:
     """ConsultantResponse 모델 테스트"""
 
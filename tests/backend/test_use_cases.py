@@ -1,10 +1,16 @@
 """Use Cases Test Suite"""
+import asyncio
+import threading
+import time
 import pytest
 from backend.application.use_cases.start_session_use_case import StartSessionUseCase
 from backend.application.use_cases.continue_session_use_case import ContinueSessionUseCase
 from backend.application.use_cases.get_srs_use_case import GetSRSUseCase
 from backend.application.use_cases.reset_session_use_case import ResetSessionUseCase
+from backend.application.use_cases.batch_srs_use_case import BatchSRSUseCase
 from backend.domain.models.state import RequirementState
+from backend.domain.agents.writer_agent import writer_agent
+from config.settings import settings
 
 
 class TestStartSessionUseCase:
@@ -63,6 +69,32 @@ class TestContinueSessionUseCase:
 
         assert "error" in result or "session_id" in result
 
+    def test_execute_serves_precomputed_markdown(self):
+        """완료 시점에 저장된 Markdown 표현을 반환하는지 테스트"""
+        use_case = GetSRSUseCase()
+        state = writer_agent(RequirementState(user_input="쇼핑몰 프로젝트", is_complete=True))
+        use_case.executor.repository.save("srs-markdown-session", state)
+
+        result = use_case.execute("srs-markdown-session", format="markdown")
+
+        assert result["content"] == state.srs_renditions.markdown
+        assert result["content"].startswith("# ")
+        assert result["srs_data"]["project_name"] == "프로젝트"
+        assert result["etag"] == state.srs_renditions.content_hash
+
+    def test_execute_rebuilds_stale_renditions(self):
+        """final_srs가 바뀌면 표현을 다시 생성하는지 테스트"""
+        use_case = GetSRSUseCase()
+        state = writer_agent(RequirementState(user_input="쇼핑몰 프로젝트", is_complete=True))
+        old_hash = state.srs_renditions.content_hash
+        state.final_srs = state.final_srs.replace("프로젝트", "새 프로젝트", 1)
+        use_case.executor.repository.save("srs-stale-session", state)
+
+        result = use_case.execute("srs-stale-session")
+
+        assert result["etag"] != old_hash
+        assert result["srs_data"]["project_name"] == "새 프로젝트"
+
 
 class TestGetSRSUseCase:
     """GetSRSUseCase 테스트"""
@@ -121,3 +153,33 @@ class TestResetSessionUseCase:
         result = use_case.execute("nonexistent-id")
 
         assert "error" in result or "message" in result
+
+
+class TestBatchSRSUseCase:
+    """BatchSRSUseCase 테스트"""
+
+    def test_timed_out_item_holds_slot_and_skips_save(self, monkeypatch):
+        """시간 초과된 항목은 실행 중인 스레드가 끝날 때까지 기다리고 결과를 저장하지 않는지 테스트"""
+        use_case = BatchSRSUseCase()
+        writer_done = threading.Event()
+
+        def slow_writer(state):
+            time.sleep(0.2)
+            writer_done.set()
+            return writer_agent(state)
+
+        async def slow_writer_async(state):
+            return await asyncio.to_thread(slow_writer, state)
+
+        monkeypatch.setattr(use_case.executor.workflow, "writer_agent_async", slow_writer_async)
+        monkeypatch.setattr(settings, "batch_item_timeout", 0.05)
+
+        async def run():
+            result = await use_case._run_item(0, {"id": "a", "initial_input": "온라인 쇼핑몰을 만들고 싶습니다"})
+            return result, writer_done.is_set()
+
+        result, finished_before_return = asyncio.run(run())
+
+        assert result["status"] == "error"
+        assert finished_before_return
+        assert use_case.executor.get_state(result["session_id"]) is None
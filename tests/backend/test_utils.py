@@ -5,6 +5,8 @@ from backend.domain.models.srs import SRSDocument, FunctionalRequirement
 from backend.utils.info_extractor import InfoExtractor
 from backend.utils.srs_formatter import SRSFormatter
 from backend.utils.quality_metrics import QualityMetrics
+from backend.utils.token_utils import estimate_tokens
+from backend.utils.tracing import TraceRecorder, record_llm_call, trace_stage, trace_turn
 
 
 class TestInfoExtractor:
@@ -30,6 +32,28 @@ class TestInfoExtractor:
         result = extractor.extract("테스트 입력")
         assert isinstance(result, dict)
 
+    def test_extract_multiple_categories(self):
+        """한 번의 호출로 여러 카테고리가 추출되는지 테스트"""
+        extractor = InfoExtractor()
+        text = "쇼핑몰입니다. 카카오페이 결제, 카카오 소셜로그인, AWS 배포, 월 1만 명 사용자"
+        result = extractor.extract(text)
+
+        assert result == {
+            "payment": "카카오페이",
+            "authentication": "카카오 소셜 로그인",
+            "deployment": "AWS",
+            "scale": "1만 명",
+            "project_type": "이커머스",
+        }
+
+    def test_extract_skips_existing_info(self):
+        """이미 수집된 카테고리는 건너뛰는지 테스트"""
+        extractor = InfoExtractor()
+        result = extractor.extract("AWS 배포, JWT 인증", existing_info={"deployment": "GCP"})
+
+        assert "deployment" not in result
+        assert result["authentication"] == "JWT 토큰 인증"
+
 
 class TestSRSFormatter:
     """SRSFormatter 테스트"""
@@ -136,3 +160,53 @@ class TestQualityMetrics:
         missing = metrics.get_missing_areas(state)
         assert isinstance(missing, list)
         assert len(missing) > 0
+
+
+class TestTokenUtils:
+    """토큰 추정 테스트"""
+
+    def test_estimate_tokens_empty(self):
+        """빈 입력은 0 토큰인지 테스트"""
+        assert estimate_tokens(None) == 0
+        assert estimate_tokens("") == 0
+
+    def test_estimate_tokens_ascii_and_korean(self):
+        """ASCII와 한글 비율이 반영되는지 테스트"""
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("가" * 15) == 10
+
+
+class TestTracing:
+    """턴 트레이스 테스트"""
+
+    def test_stage_outside_turn_is_noop(self):
+        """턴 트레이스 밖의 단계 기록은 무시되는지 테스트"""
+        with trace_stage("writer") as span:
+            record_llm_call("프롬프트", "응답")
+        assert span is None
+
+    def test_turn_records_stages_and_llm_calls(self, monkeypatch):
+        """단계 시간, 재시도, 프롬프트 크기가 기록되는지 테스트"""
+        recorder = TraceRecorder()
+        monkeypatch.setattr("backend.utils.tracing._recorder", recorder)
+
+        with trace_turn("session-1", iteration=2):
+            with trace_stage("judge_llm"):
+                record_llm_call("abc", "12345", attempts=3)
+                record_llm_call("de", "67", attempts=0, cache_hit=True)
+            with pytest.raises(ValueError):
+                with trace_stage("writer"):
+                    raise ValueError("실패")
+
+        trace = recorder.get_session_traces("session-1")[0]
+        judge, writer = trace.stages
+        assert trace.iteration == 2
+        assert (judge.llm_calls, judge.retries, judge.cache_hits) == (2, 2, 1)
+        assert (judge.prompt_chars, judge.response_chars) == (5, 7)
+        assert writer.error == "ValueError"
+
+        text = recorder.render_prometheus()
+        assert 'specpilot_stage_retries_total{stage="judge_llm"} 2' in text
+        assert 'specpilot_stage_errors_total{stage="writer"} 1' in text
+        assert 'specpilot_turn_duration_seconds_bucket{le="+Inf"} 1' in text
+